@@ -4,21 +4,251 @@ Generate llms.txt files for AI crawler accessibility.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from datetime import datetime, timezone
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, Comment, NavigableString
 except ImportError:
     print("Error: Install dependencies: pip install requests beautifulsoup4")
     sys.exit(1)
 
 
+# Section headings, in output order, for each URL category
+SECTION_NAMES = {
+    'home': 'Home',
+    'products': 'Products & Features',
+    'docs': 'Documentation',
+    'blog': 'Blog & Resources',
+    'about': 'About',
+    'support': 'Support & Contact',
+    'other': 'Additional Pages'
+}
+MAX_SECTION_LINKS = 15
+# New pages fetched per --update run, matching the 40-page limit of a fresh run
+MAX_UPDATE_FETCHES = 40
+
+LINK_LINE = re.compile(r'^- \[([^\]]+)\]\(([^)]+)\)(?::\s*(.*))?$')
+
+# Elements that never hold a page's main content
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'svg', 'iframe']
+
+
+def _inline_markdown(elem, base_url):
+    """Flatten an element's inline content, keeping links and code spans."""
+    parts = []
+    for child in elem.children:
+        if isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(str(child))
+        elif child.name in ('ul', 'ol', 'pre', 'table'):
+            # Nested blocks are emitted on their own
+            continue
+        elif child.name == 'a':
+            text = _inline_markdown(child, base_url)
+            href = child.get('href')
+            if text and href and not href.startswith(('#', 'javascript:', 'mailto:')):
+                parts.append(f"[{text}]({urljoin(base_url, href)})")
+            else:
+                parts.append(text)
+        elif child.name == 'code':
+            parts.append(f"`{child.get_text()}`")
+        elif child.name == 'br':
+            parts.append(' ')
+        else:
+            parts.append(_inline_markdown(child, base_url))
+    return re.sub(r'\s+', ' ', ''.join(parts)).strip()
+
+
+def html_to_markdown(html, base_url=''):
+    """Convert a page's main content to clean markdown."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    
+    main = soup.find('main') or soup.find('article') or soup.find(attrs={'role': 'main'}) or soup.body or soup
+    
+    blocks = []
+    for elem in main.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'pre', 'blockquote', 'tr']):
+        # Nested blocks are emitted by their innermost block element
+        if elem.name != 'pre' and elem.find_parent('pre'):
+            continue
+        if elem.name == 'p' and elem.find_parent(['li', 'blockquote', 'td', 'th']):
+            continue
+        
+        if elem.name == 'pre':
+            code = elem.get_text().strip('\n')
+            if code:
+                blocks.append(f"```\n{code}\n```")
+            continue
+        
+        text = _inline_markdown(elem, base_url)
+        if not text:
+            continue
+        if elem.name[0] == 'h':
+            # Page sections sit below the "### page" heading in llms-full.txt
+            level = min(int(elem.name[1]) + 3, 6)
+            blocks.append(f"{'#' * level} {text}")
+        elif elem.name == 'li':
+            blocks.append(f"- {text}")
+        elif elem.name == 'blockquote':
+            blocks.append(f"> {text}")
+        elif elem.name == 'tr':
+            cells = [_inline_markdown(c, base_url) for c in elem.find_all(['th', 'td'])]
+            row = '| ' + ' | '.join(cells) + ' |'
+            table = elem.find_parent('table')
+            if table is not None and table.find('tr') is elem:
+                row += '\n|' + ' --- |' * len(cells)
+            blocks.append(row)
+        else:
+            blocks.append(text)
+    
+    # Keep list items and table rows tight, separate everything else
+    out = []
+    for block in blocks:
+        if out and block[:2] in ('- ', '| ') and out[-1][:2] == block[:2]:
+            out[-1] += '\n' + block
+        else:
+            out.append(block)
+    return '\n\n'.join(out)
+
+
+def convert_cached_page(job):
+    """Convert one spooled page to markdown unless it is already cached.
+    
+    Runs in a worker process; returns the path of the cached markdown.
+    """
+    content_hash, url, cache_dir = job
+    md_path = os.path.join(cache_dir, 'md', f"{content_hash}.md")
+    if os.path.exists(md_path):
+        return md_path
+    
+    html_path = os.path.join(cache_dir, 'html', f"{content_hash}.html")
+    with open(html_path, 'r', encoding='utf-8') as f:
+        markdown = html_to_markdown(f.read(), url)
+    
+    tmp_path = f"{md_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(markdown)
+    os.replace(tmp_path, md_path)
+    os.remove(html_path)
+    return md_path
+
+
+def _parse_lastmod(value):
+    """Parse a sitemap <lastmod> value into an aware datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class LLMsTxtDocument:
+    """An existing llms.txt split into a header and editable sections.
+    
+    Lines are kept verbatim, so sections that are not edited render back
+    exactly as they were read.
+    """
+    
+    def __init__(self, path):
+        with open(path, 'r') as f:
+            lines = f.read().split('\n')
+        
+        self.header = []
+        self.sections = []
+        for line in lines:
+            if line.startswith('## '):
+                self.sections.append({'name': line[3:].strip(), 'lines': [line], 'dirty': False})
+            elif self.sections:
+                self.sections[-1]['lines'].append(line)
+            else:
+                self.header.append(line)
+    
+    def links(self):
+        """Map each linked URL to (section, title, description)."""
+        found = {}
+        for section in self.sections:
+            for line in section['lines']:
+                match = LINK_LINE.match(line)
+                if match:
+                    title, url, desc = match.groups()
+                    found.setdefault(url, (section, title, desc or ''))
+        return found
+    
+    def section(self, name):
+        for section in self.sections:
+            if section['name'] == name:
+                return section
+        return None
+    
+    def replace_link(self, section, url, line):
+        for i, existing in enumerate(section['lines']):
+            match = LINK_LINE.match(existing)
+            if match and match.group(2) == url:
+                if existing != line:
+                    section['lines'][i] = line
+                    section['dirty'] = True
+                return
+    
+    def remove_link(self, section, url):
+        """Drop a link; a section left without links is dropped too."""
+        section['lines'] = [
+            line for line in section['lines']
+            if not ((m := LINK_LINE.match(line)) and m.group(2) == url)
+        ]
+        section['dirty'] = True
+        if not any(LINK_LINE.match(line) for line in section['lines']):
+            self.sections.remove(section)
+    
+    def is_full(self, name):
+        """Whether a section already holds MAX_SECTION_LINKS links."""
+        section = self.section(name)
+        return section is not None and sum(1 for l in section['lines'] if LINK_LINE.match(l)) >= MAX_SECTION_LINKS
+    
+    def add_link(self, name, line):
+        """Append a link to a section, creating the section if needed."""
+        section = self.section(name)
+        if section is None:
+            # New sections go in their standard position among the known ones
+            order = list(SECTION_NAMES.values())
+            rank = order.index(name) if name in order else len(order)
+            position = len(self.sections)
+            for i, existing in enumerate(self.sections):
+                if existing['name'] in order and order.index(existing['name']) > rank:
+                    position = i
+                    break
+            section = {'name': name, 'lines': [f"## {name}", '', line, ''], 'dirty': True}
+            if position == len(self.sections) and self.sections and self.sections[-1]['lines'][-1] != '':
+                self.sections[-1]['lines'].append('')
+            self.sections.insert(position, section)
+            return True
+        
+        link_rows = [i for i, l in enumerate(section['lines']) if LINK_LINE.match(l)]
+        if len(link_rows) >= MAX_SECTION_LINKS:
+            return False
+        section['lines'].insert(link_rows[-1] + 1, line)
+        section['dirty'] = True
+        return True
+    
+    def render(self):
+        lines = list(self.header)
+        for section in self.sections:
+            lines.extend(section['lines'])
+        return '\n'.join(lines)
+
+
 class LLMsTxtGenerator:
     """Generate llms.txt files from website analysis."""
     
@@ -28,6 +258,11 @@ class LLMsTxtGenerator:
         self.timeout = timeout
         self.visited = set()
         self.pages = []
+        self.brand_info = None
+        self.sitemap_lastmod = {}
+        self.update_state = None
+        # Set to a directory to spool page HTML for llms-full.txt conversion
+        self.full_cache_dir = None
     
     def fetch(self, path='', full_url=None):
         """Fetch a URL with error handling."""
@@ -94,35 +329,68 @@ class LLMsTxtGenerator:
         if not resp:
             return None
         
-        return {
+        page = {
             'url': url,
             'title': self.extract_title(resp.text),
             'description': self.extract_description(resp.text, url)
         }
+        if self.full_cache_dir:
+            page['content_hash'] = self._spool_html(resp.text)
+        return page
     
-    def get_sitemap_urls(self):
-        """Fetch URLs from sitemap.xml."""
-        urls = []
+    def _spool_html(self, html):
+        """Write page HTML to the cache unless its markdown is already cached."""
+        content_hash = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        md_path = os.path.join(self.full_cache_dir, 'md', f"{content_hash}.md")
+        if not os.path.exists(md_path):
+            with open(os.path.join(self.full_cache_dir, 'html', f"{content_hash}.html"), 'w', encoding='utf-8') as f:
+                f.write(html)
+        return content_hash
+    
+    def get_sitemap_entries(self):
+        """Fetch (url, lastmod) pairs from sitemap.xml, following sitemap indexes."""
+        import xml.etree.ElementTree as ET
+        
+        def parse(resp):
+            entries, children = [], []
+            try:
+                root = ET.fromstring(resp.text.encode('utf-8'))
+            except ET.ParseError:
+                return entries, children
+            for elem in root:
+                loc = lastmod = None
+                for child in elem:
+                    if child.tag.endswith('loc') and child.text:
+                        loc = child.text.strip()
+                    elif child.tag.endswith('lastmod') and child.text:
+                        lastmod = child.text.strip()
+                if not loc:
+                    continue
+                if elem.tag.endswith('sitemap'):
+                    children.append(loc)
+                else:
+                    entries.append((loc, lastmod))
+            return entries, children
         
+        entries = []
         # Try common sitemap locations
         for path in ['/sitemap.xml', '/sitemap_index.xml', '/sitemap-index.xml']:
             resp = self.fetch(path)
             if resp and resp.status_code == 200:
-                # Parse XML
-                import xml.etree.ElementTree as ET
-                try:
-                    root = ET.fromstring(resp.text.encode('utf-8'))
-                    # Handle both sitemap and urlset
-                    for elem in root.iter():
-                        if elem.tag.endswith('loc'):
-                            urls.append(elem.text.strip())
-                except:
-                    pass
-                if urls:
+                entries, children = parse(resp)
+                for child_url in children:
+                    child = self.fetch(full_url=child_url)
+                    if child:
+                        entries.extend(parse(child)[0])
+                if entries:
                     break
         
         # Filter to same domain
-        return [u for u in urls if self.domain in u][:50]  # Limit to 50
+        return [(u, lastmod) for u, lastmod in entries if self.domain in u]
+    
+    def get_sitemap_urls(self):
+        """Fetch URLs from sitemap.xml."""
+        return [u for u, _ in self.get_sitemap_entries()][:50]  # Limit to 50
     
     def categorize_url(self, url):
         """Categorize a URL into section type."""
@@ -146,7 +414,8 @@ class LLMsTxtGenerator:
     def generate_from_sitemap(self):
         """Generate llms.txt by analyzing sitemap."""
         print("Fetching sitemap...", file=sys.stderr)
-        urls = self.get_sitemap_urls()
+        self.sitemap_lastmod = dict(self.get_sitemap_entries())
+        urls = list(self.sitemap_lastmod)[:50]  # Limit to 50
         
         if not urls:
             print("No sitemap found. Try --interactive mode.", file=sys.stderr)
@@ -251,8 +520,29 @@ class LLMsTxtGenerator:
         brand_name = brand_name or self.domain
         tagline = tagline or f"Official website for {brand_name}"
         overview = overview or f"{brand_name} provides products and services. Visit the website for more information."
+        self.brand_info = (brand_name, tagline, overview)
+        
+        # Build output
+        lines = [
+            f"# {brand_name}",
+            "",
+            f"> {tagline}",
+            "",
+            overview,
+            ""
+        ]
         
-        # Categorize pages
+        for section_name, pages in self._sections():
+            lines.append(f"## {section_name}")
+            lines.append("")
+            for page in pages:
+                lines.append(f"- [{page['title']}]({page['url']}): {page['description']}")
+            lines.append("")
+        
+        return '\n'.join(lines)
+    
+    def _sections(self):
+        """Group analyzed pages into (section name, pages) in output order."""
         sections = {
             'home': [],
             'products': [],
@@ -267,54 +557,218 @@ class LLMsTxtGenerator:
             cat = self.categorize_url(page['url'])
             sections[cat].append(page)
         
-        # Build output
-        lines = [
-            f"# {brand_name}",
-            "",
-            f"> {tagline}",
-            "",
-            overview,
-            ""
-        ]
+        # Max 15 per section
+        return [(SECTION_NAMES[cat], pages[:MAX_SECTION_LINKS]) for cat, pages in sections.items() if pages]
+    
+    def update_existing(self, path, state=None):
+        """Patch an existing llms.txt against the sitemap instead of regenerating.
+        
+        Only pages that are new, or whose sitemap <lastmod> changed, are
+        fetched. Same-domain links that left the sitemap are dropped, and
+        only the sections that were touched are rewritten. ``state`` holds
+        the sitemap and auto-generated text recorded by the previous run;
+        descriptions that differ from it were edited by hand and are kept.
+        Without state, every sitemap URL missing from the file is new,
+        changes to listed pages are judged against the file's mtime, and
+        existing text is always kept.
+        
+        New pages whose section is already full are skipped before they are
+        fetched, and at most MAX_UPDATE_FETCHES new pages are fetched per
+        run. Both stay out of the recorded sitemap, so a later run picks
+        them up once there is room.
+        """
+        doc = LLMsTxtDocument(path)
+        listed = doc.links()
+        known_lastmod = (state or {}).get('sitemap', {})
+        auto_text = (state or {}).get('pages', {})
+        file_mtime = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
         
-        # Add sections
-        section_names = {
-            'home': 'Home',
-            'products': 'Products & Features',
-            'docs': 'Documentation',
-            'blog': 'Blog & Resources',
-            'about': 'About',
-            'support': 'Support & Contact',
-            'other': 'Additional Pages'
+        print("Fetching sitemap...", file=sys.stderr)
+        self.sitemap_lastmod = dict(self.get_sitemap_entries())
+        if not self.sitemap_lastmod:
+            print("No sitemap found; nothing to update.", file=sys.stderr)
+            return None, None
+        
+        def is_modified(url, lastmod):
+            if state is not None and url in known_lastmod:
+                return lastmod != known_lastmod[url]
+            parsed = _parse_lastmod(lastmod)
+            return parsed is not None and parsed > file_mtime
+        
+        changed, new = [], []
+        for url, lastmod in self.sitemap_lastmod.items():
+            if url in listed:
+                if lastmod and is_modified(url, lastmod):
+                    changed.append(url)
+            elif state is None or url not in known_lastmod:
+                new.append(url)
+            elif lastmod and is_modified(url, lastmod):
+                new.append(url)
+        removed = [url for url in listed if self.domain in url and url not in self.sitemap_lastmod]
+        
+        print(f"{len(new)} new, {len(changed)} changed, {len(removed)} removed", file=sys.stderr)
+        
+        for url in removed:
+            doc.remove_link(listed[url][0], url)
+            auto_text.pop(url, None)
+        
+        added = skipped = deferred = fetched_new = 0
+        pending = set()
+        for url in changed + new:
+            if url not in listed:
+                section_name = SECTION_NAMES[self.categorize_url(url)]
+                if doc.is_full(section_name):
+                    skipped += 1
+                    pending.add(url)
+                    continue
+                if fetched_new >= MAX_UPDATE_FETCHES:
+                    deferred += 1
+                    pending.add(url)
+                    continue
+                fetched_new += 1
+            print(f"  Analyzing: {url}", file=sys.stderr)
+            page = self.analyze_page(url)
+            time.sleep(0.5)  # Be polite
+            if not page:
+                continue
+            
+            if url in listed:
+                section, title, desc = listed[url]
+                previous = auto_text.get(url)
+                if previous and title == previous['title']:
+                    title = page['title']
+                if previous and desc == previous['description']:
+                    desc = page['description']
+                doc.replace_link(section, url, f"- [{title}]({url}): {desc}")
+            else:
+                doc.add_link(section_name, f"- [{page['title']}]({url}): {page['description']}")
+                added += 1
+            auto_text[url] = {'title': page['title'], 'description': page['description']}
+        
+        self.update_state = {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'sitemap': {url: lastmod for url, lastmod in self.sitemap_lastmod.items() if url not in pending},
+            'pages': auto_text,
         }
-        
-        for cat, pages in sections.items():
-            if pages:
-                lines.append(f"## {section_names[cat]}")
-                lines.append("")
-                for page in pages[:15]:  # Max 15 per section
-                    lines.append(f"- [{page['title']}]({page['url']}): {page['description']}")
-                lines.append("")
-        
-        return '\n'.join(lines)
+        summary = {
+            'new': len(new),
+            'changed': len(changed),
+            'removed': len(removed),
+            'added': added,
+            'skipped_full_sections': skipped,
+            'deferred': deferred,
+            'sections_rewritten': sorted({listed[url][0]['name'] for url in removed}
+                                         | {s['name'] for s in doc.sections if s['dirty']}),
+        }
+        return doc.render(), summary
+    
+    def state(self):
+        """Sitemap and auto-generated text for a later update_existing() run."""
+        if self.update_state:
+            return self.update_state
+        return {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'sitemap': self.sitemap_lastmod,
+            'pages': {p['url']: {'title': p['title'], 'description': p['description']} for p in self.pages},
+        }
+    
+    def enable_full(self, cache_dir):
+        """Spool analyzed pages so write_full() can build llms-full.txt."""
+        self.full_cache_dir = cache_dir
+        os.makedirs(os.path.join(cache_dir, 'html'), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, 'md'), exist_ok=True)
+    
+    def write_full(self, path, workers=None):
+        """Write llms-full.txt: every indexed page's content as markdown.
+        
+        Pages are converted in a process pool and copied to disk in section
+        order as they finish, so only one page is in memory at a time.
+        Markdown is cached by HTML content hash; unchanged pages are reused.
+        HTML spooled for pages beyond the per-section limit is deleted.
+        """
+        brand_name, tagline, overview = self.brand_info
+        sections = self._sections()
+        # One job per distinct content hash, in first-appearance order
+        jobs = {}
+        for _, pages in sections:
+            for page in pages:
+                jobs.setdefault(page['content_hash'], (page['content_hash'], page['url'], self.full_cache_dir))
+        jobs = list(jobs.values())
+        cached = sum(
+            1 for content_hash, _, cache_dir in jobs
+            if os.path.exists(os.path.join(cache_dir, 'md', f"{content_hash}.md"))
+        )
+        print(f"Converting {len(jobs) - cached} pages ({cached} cached)...", file=sys.stderr)
+        
+        with open(path, 'w', encoding='utf-8') as out, ProcessPoolExecutor(max_workers=workers) as executor:
+            out.write(f"# {brand_name}\n\n> {tagline}\n\n{overview}\n")
+            results = executor.map(convert_cached_page, jobs)
+            md_paths = {}
+            for section_name, pages in sections:
+                out.write(f"\n## {section_name}\n")
+                for page in pages:
+                    if page['content_hash'] not in md_paths:
+                        md_paths[page['content_hash']] = next(results)
+                    out.write(f"\n### [{page['title']}]({page['url']})\n\n")
+                    with open(md_paths[page['content_hash']], 'r', encoding='utf-8') as f:
+                        for chunk in iter(lambda: f.read(65536), ''):
+                            out.write(chunk)
+                    out.write("\n")
+        
+        # Converted pages remove their own HTML; drop the ones never emitted
+        for page in self.pages:
+            if page.get('content_hash') and page['content_hash'] not in md_paths:
+                html_path = os.path.join(self.full_cache_dir, 'html', f"{page['content_hash']}.html")
+                if os.path.exists(html_path):
+                    os.remove(html_path)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate llms.txt files")
     parser.add_argument("domain", help="Domain to analyze (e.g., example.com)")
-    parser.add_argument("--output", "-o", default="llms.txt", help="Output file")
+    parser.add_argument("--output", "-o", help="Output file (default: llms.txt, or the --update file)")
     parser.add_argument("--from-sitemap", action="store_true", help="Auto-generate from sitemap")
     parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
     parser.add_argument("--urls", help="File with URLs (one per line)")
     parser.add_argument("--timeout", type=int, default=10, help="Request timeout")
     parser.add_argument("--format", choices=["md", "json"], default="md", help="Output format")
+    parser.add_argument("--full", action="store_true", help="Also generate llms-full.txt with each page's content")
+    parser.add_argument("--full-output", help="llms-full.txt path (default: next to --output)")
+    parser.add_argument("--cache-dir", default=".llms_txt_cache", help="Per-page markdown cache for --full")
+    parser.add_argument("--workers", type=int, help="Conversion worker processes for --full")
+    parser.add_argument("--update", metavar="EXISTING", help="Patch an existing llms.txt from sitemap changes")
+    parser.add_argument("--state", help="Update state file (default: <output>.state.json)")
     
     args = parser.parse_args()
     
+    if args.update and (args.full or args.format == "json"):
+        parser.error("--update only supports markdown output without --full")
+    
+    args.output = args.output or args.update or "llms.txt"
+    state_path = args.state or f"{args.update or args.output}.state.json"
+    # Only --update reads the state, so only write it there or when asked for
+    write_state = args.format == "md" and (args.update or args.state)
+    
     generator = LLMsTxtGenerator(args.domain, timeout=args.timeout)
+    if args.full:
+        generator.enable_full(args.cache_dir)
     
     # Determine generation method
-    if args.interactive:
+    if args.update:
+        state = None
+        if os.path.exists(state_path):
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+        content, summary = generator.update_existing(args.update, state)
+        if summary:
+            print(f"Sections rewritten: {', '.join(summary['sections_rewritten']) or 'none'}", file=sys.stderr)
+            if summary['skipped_full_sections']:
+                print(f"Skipped {summary['skipped_full_sections']} new pages (section already has "
+                      f"{MAX_SECTION_LINKS} links)", file=sys.stderr)
+            if summary['deferred']:
+                print(f"Deferred {summary['deferred']} new pages to the next --update run "
+                      f"(at most {MAX_UPDATE_FETCHES} fetched per run)", file=sys.stderr)
+    elif args.interactive:
         content = generator.generate_interactive()
     elif args.urls:
         content = generator.generate_from_file(args.urls)
@@ -344,8 +798,18 @@ def main():
     with open(args.output, 'w') as f:
         f.write(result)
     
+    if write_state:
+        with open(state_path, 'w') as f:
+            json.dump(generator.state(), f, indent=2)
+    
     print(f"\n✅ Generated llms.txt: {args.output}", file=sys.stderr)
     print(f"   Place this file at: https://{args.domain}/llms.txt", file=sys.stderr)
+    
+    if args.full:
+        full_path = args.full_output or os.path.join(os.path.dirname(args.output), 'llms-full.txt')
+        generator.write_full(full_path, workers=args.workers)
+        print(f"\n✅ Generated llms-full.txt: {full_path}", file=sys.stderr)
+        print(f"   Place this file at: https://{args.domain}/llms-full.txt", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,13 @@ Validate llms.txt files against quality criteria.
 """
 
 import argparse
+import json
+import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 try:
@@ -15,8 +20,121 @@ except ImportError:
     sys.exit(1)
 
 
+# Statuses where a server is likely rejecting HEAD rather than the URL itself
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 429, 500, 501, 502, 503}
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'geo-llms-txt', 'link-cache.json')
+
+
+class LinkChecker:
+    """Check many URLs concurrently with connection reuse and a result cache.
+
+    Each worker thread keeps its own ``requests.Session`` so connections are
+    reused, a per-host semaphore caps concurrent requests to any one server,
+    and a HEAD request falls back to a ranged GET when the server rejects
+    HEAD or drops the connection. Results are cached on disk for ``cache_ttl`` seconds.
+    """
+
+    def __init__(self, workers=32, per_host=4, timeout=10, cache_file=None, cache_ttl=86400):
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self.cache = self._load_cache()
+        self._local = threading.local()
+        self._host_limits = {}
+        self._host_lock = threading.Lock()
+
+    def _load_cache(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {url: r for url, r in cache.items() if now - r.get('checked_at', 0) < self.cache_ttl}
+
+    def _save_cache(self):
+        if not self.cache_file:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        tmp_path = self.cache_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.cache, f)
+        os.replace(tmp_path, self.cache_file)
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = 'llms-txt-validator/1.0'
+            self._local.session = session
+        return session
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _check(self, url):
+        session = self._session()
+        with self._host_limit(url):
+            try:
+                resp = session.head(url, timeout=self.timeout, allow_redirects=True)
+                status, method = resp.status_code, 'HEAD'
+            except requests.RequestException:
+                # Some servers reset the connection on HEAD but answer GET
+                status, method = None, 'HEAD'
+            if status is None or status in HEAD_FALLBACK_STATUSES:
+                try:
+                    resp = session.get(url, timeout=self.timeout, allow_redirects=True,
+                                       headers={'Range': 'bytes=0-0'}, stream=True)
+                    resp.close()
+                    status, method = resp.status_code, 'GET'
+                except requests.RequestException as e:
+                    return {'ok': False, 'status': type(e).__name__, 'method': 'GET', 'checked_at': time.time()}
+        return {'ok': 200 <= status < 400, 'status': status, 'method': method, 'checked_at': time.time()}
+
+    def check(self, urls):
+        """Return ``{url: result}`` for the unique URLs given."""
+        unique = list(dict.fromkeys(urls))
+        results = {url: self.cache[url] for url in unique if url in self.cache}
+        pending = [url for url in unique if url not in results]
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                for url, result in zip(pending, executor.map(self._check, pending)):
+                    results[url] = result
+                    # Connection errors are often transient, so only HTTP answers are cached
+                    if isinstance(result['status'], int):
+                        self.cache[url] = result
+            self._save_cache()
+
+        self.stats = {'unique': len(unique), 'cached': len(unique) - len(pending), 'checked': len(pending)}
+        return results
+
+
+LINK_PATTERN = re.compile(r'- \[([^\]]+)\]\(([^)]+)\)')
+DESC_PATTERN = re.compile(r'- \[[^\]]+\]\([^)]+\): (.+)')
+PROMOTIONAL_WORDS = ['best', 'revolutionary', 'amazing', 'incredible', 'unmatched', 'ultimate']
+VAGUE_PHRASES = ['click here', 'learn more', 'read more', 'our page', 'this page', 'information about']
+
+
 class LLMsTxtValidator:
-    """Validate llms.txt files."""
+    """Validate llms.txt files.
+    
+    The file is streamed once, line by line; every check keeps only the
+    small amount of state it needs, so multi-megabyte llms-full.txt files
+    validate in bounded memory. Findings carry the line they came from.
+    """
     
     def __init__(self, filepath):
         self.filepath = filepath
@@ -24,15 +142,35 @@ class LLMsTxtValidator:
         self.warnings = []
         self.info = []
         
-        with open(filepath, 'r') as f:
-            self.content = f.read()
+        # Per-check streaming state
+        self.first_line = None
+        self.h2_count = 0
+        self.tagline_line = None
+        self.overview_state = 'before'
+        self.overview_lines = 0
+        self.promo_found = {}
+        self.vague_found = {}
+        self.link_count = 0
+        self.link_lines = {}
+        self._validated = False
     
     def validate(self):
-        """Run all validations."""
-        self._check_structure()
-        self._check_brand_section()
-        self._check_links()
-        self._check_quality()
+        """Run all validations in a single pass over the file."""
+        self._validated = True
+        offset = 0
+        with open(self.filepath, 'r') as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.rstrip('\n')
+                self._check_structure(lineno, line)
+                self._check_brand_section(lineno, line, offset)
+                self._check_links(lineno, line)
+                self._check_quality(lineno, line)
+                offset += len(line) + 1
+        
+        self._finish_structure()
+        self._finish_brand_section()
+        self._finish_links()
+        self._finish_quality()
         
         return {
             'valid': len(self.errors) == 0,
@@ -41,130 +179,140 @@ class LLMsTxtValidator:
             'info': self.info
         }
     
-    def _check_structure(self):
+    def _check_structure(self, lineno, line):
         """Check markdown structure."""
+        if self.first_line is None and line.strip():
+            self.first_line = (lineno, line.lstrip())
+        
+        if line.startswith('## '):
+            self.h2_count += 1
+        
+        if line.startswith('-') and '[' in line and '](' not in line:
+            self.warnings.append(f"Line {lineno}: Possible malformed link")
+    
+    def _finish_structure(self):
         # Must start with H1
-        if not self.content.strip().startswith('# '):
-            self.errors.append("File must start with '# Brand Name' (H1 heading)")
+        if self.first_line is None or not self.first_line[1].startswith('# '):
+            where = f"Line {self.first_line[0]}: " if self.first_line else ""
+            self.errors.append(f"{where}File must start with '# Brand Name' (H1 heading)")
         
         # Should have sections (H2)
-        h2_count = len(re.findall(r'^## ', self.content, re.MULTILINE))
-        if h2_count < 2:
-            self.warnings.append(f"Only {h2_count} section(s) found. Consider adding more sections for better organization.")
+        if self.h2_count < 2:
+            self.warnings.append(f"Only {self.h2_count} section(s) found. Consider adding more sections for better organization.")
         else:
-            self.info.append(f"Found {h2_count} sections")
-        
-        # Check for proper markdown
-        lines = self.content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if line.startswith('-') and '[' in line and '](' not in line:
-                self.warnings.append(f"Line {i}: Possible malformed link")
+            self.info.append(f"Found {self.h2_count} sections")
     
-    def _check_brand_section(self):
+    def _check_brand_section(self, lineno, line, offset):
         """Check brand description section."""
-        # Look for tagline (blockquote)
-        if '> ' not in self.content[:500]:
+        # Tagline (blockquote) must appear in the first 500 characters
+        if self.tagline_line is None and offset < 500 and '> ' in line[:500 - offset]:
+            self.tagline_line = lineno
+        
+        # Promotional language, reported at its first occurrence
+        line_lower = line.lower()
+        for word in PROMOTIONAL_WORDS:
+            if word not in self.promo_found and word in line_lower:
+                self.promo_found[word] = lineno
+        
+        # Overview runs from the first blockquote to the next heading or link
+        if self.overview_state == 'done':
+            return
+        if line.startswith('> '):
+            self.overview_state = 'in'
+        elif self.overview_state == 'in':
+            if line.startswith('#') or line.startswith('- ['):
+                self.overview_state = 'done'
+            elif line.strip():
+                self.overview_lines += 1
+    
+    def _finish_brand_section(self):
+        if self.tagline_line is None:
             self.warnings.append("No tagline found. Consider adding a one-sentence description after the brand name.")
         
-        # Check for promotional language
-        promotional = ['best', 'revolutionary', 'amazing', 'incredible', 'unmatched', 'ultimate']
-        content_lower = self.content.lower()
-        found_promo = [p for p in promotional if p in content_lower]
-        if found_promo:
-            self.warnings.append(f"Promotional language detected: {', '.join(found_promo)}. Consider more factual descriptions.")
-        
-        # Check overview length
-        lines = self.content.split('\n')
-        overview_lines = []
-        in_overview = False
-        for line in lines:
-            if line.startswith('> '):
-                in_overview = True
-                continue
-            if in_overview:
-                if line.startswith('#') or line.startswith('- ['):
-                    break
-                if line.strip():
-                    overview_lines.append(line)
-        
-        if len(overview_lines) < 2:
+        if self.promo_found:
+            found = ', '.join(f"{word} (line {lineno})" for word, lineno in self.promo_found.items())
+            self.warnings.append(f"Promotional language detected: {found}. Consider more factual descriptions.")
+        
+        if self.overview_lines < 2:
             self.warnings.append("Brand overview seems short. Consider adding 2-3 paragraphs.")
-        elif len(overview_lines) > 10:
+        elif self.overview_lines > 10:
             self.warnings.append("Brand overview is quite long. Consider condensing to 2-3 paragraphs.")
     
-    def _check_links(self):
-        """Check link format and count."""
-        # Extract all links
-        link_pattern = r'- \[([^\]]+)\]\(([^)]+)\)'
-        links = re.findall(link_pattern, self.content)
-        
-        self.info.append(f"Found {len(links)} links")
-        
-        # Check link count
-        if len(links) < 10:
-            self.warnings.append(f"Only {len(links)} links. Consider adding more (15-40 recommended).")
-        elif len(links) > 50:
-            self.warnings.append(f"{len(links)} links is a lot. Consider curating to 15-40 most important pages.")
-        
-        # Check for duplicates
-        urls = [url for _, url in links]
-        duplicates = set([u for u in urls if urls.count(u) > 1])
-        if duplicates:
-            self.errors.append(f"Duplicate URLs found: {', '.join(duplicates)}")
+    def _check_links(self, lineno, line):
+        """Check link format and descriptions."""
+        if '](' not in line:
+            return
         
-        # Check URL format
-        for title, url in links:
+        for match in LINK_PATTERN.finditer(line):
+            title, url = match.groups()
+            self.link_count += 1
+            self.link_lines.setdefault(url, []).append(lineno)
+            
             if not url.startswith('http://') and not url.startswith('https://'):
-                self.errors.append(f"URL must use http(s):// : {url}")
+                self.errors.append(f"Line {lineno}: URL must use http(s):// : {url}")
             
             if title == url:
-                self.warnings.append(f"Link text is the URL. Use descriptive titles: {url}")
+                self.warnings.append(f"Line {lineno}: Link text is the URL. Use descriptive titles: {url}")
         
-        # Check descriptions
-        desc_pattern = r'- \[[^\]]+\]\([^)]+\): (.+)'
-        descriptions = re.findall(desc_pattern, self.content)
-        
-        for desc in descriptions:
+        for desc in DESC_PATTERN.findall(line):
             words = desc.split()
             if len(words) < 3:
-                self.warnings.append(f"Description too short: '{desc}'")
+                self.warnings.append(f"Line {lineno}: Description too short: '{desc}'")
             if len(words) > 20:
-                self.warnings.append(f"Description too long ({len(words)} words): '{desc[:50]}...'")
+                self.warnings.append(f"Line {lineno}: Description too long ({len(words)} words): '{desc[:50]}...'")
     
-    def _check_quality(self):
-        """Check content quality."""
-        # Check for vague descriptions
-        vague = ['click here', 'learn more', 'read more', 'our page', 'this page', 'information about']
-        content_lower = self.content.lower()
+    def _finish_links(self):
+        self.info.append(f"Found {self.link_count} links")
+        
+        if self.link_count < 10:
+            self.warnings.append(f"Only {self.link_count} links. Consider adding more (15-40 recommended).")
+        elif self.link_count > 50:
+            self.warnings.append(f"{self.link_count} links is a lot. Consider curating to 15-40 most important pages.")
         
-        for v in vague:
-            if v in content_lower:
-                self.warnings.append(f"Vague phrase found: '{v}'. Use specific descriptions instead.")
+        duplicates = {url: lines for url, lines in self.link_lines.items() if len(lines) > 1}
+        if duplicates:
+            found = ', '.join(
+                f"{url} (lines {', '.join(map(str, lines))})" for url, lines in duplicates.items()
+            )
+            self.errors.append(f"Duplicate URLs found: {found}")
+    
+    def _check_quality(self, lineno, line):
+        """Check content quality."""
+        line_lower = line.lower()
+        for phrase in VAGUE_PHRASES:
+            if phrase not in self.vague_found and phrase in line_lower:
+                self.vague_found[phrase] = lineno
     
-    def check_live_urls(self, sample_size=5):
-        """Check that URLs are accessible (sample)."""
-        link_pattern = r'- \[([^\]]+)\]\(([^)]+)\)'
-        links = re.findall(link_pattern, self.content)
+    def _finish_quality(self):
+        for phrase, lineno in self.vague_found.items():
+            self.warnings.append(f"Line {lineno}: Vague phrase found: '{phrase}'. Use specific descriptions instead.")
+    
+    def check_live_urls(self, sample_size=5, check_all=False, checker=None):
+        """Check that URLs are accessible (a sample, or every link with check_all)."""
+        if not self._validated:
+            self.validate()
+        urls = [url for url in self.link_lines if url.startswith(('http://', 'https://'))]
         
-        if not links:
+        if not urls:
             return
         
-        print(f"\nChecking {min(sample_size, len(links))} URLs...", file=sys.stderr)
+        if not check_all:
+            import random
+            urls = random.sample(urls, min(sample_size, len(urls)))
         
-        import random
-        sample = random.sample(links, min(sample_size, len(links)))
+        checker = checker or LinkChecker()
+        print(f"\nChecking {len(urls)} URLs...", file=sys.stderr)
+        started = time.time()
+        results = checker.check(urls)
+        print(f"Checked {checker.stats['checked']} URLs ({checker.stats['cached']} from cache) "
+              f"in {time.time() - started:.1f}s", file=sys.stderr)
         
-        broken = []
-        for title, url in sample:
-            try:
-                resp = requests.head(url, timeout=10, allow_redirects=True)
-                if resp.status_code != 200:
-                    broken.append((url, resp.status_code))
-            except Exception as e:
-                broken.append((url, str(e)))
+        broken = [(url, r['status']) for url, r in results.items() if not r['ok']]
+        scope = f"all {len(urls)}" if check_all else f"sample of {len(urls)}"
+        self.info.append(f"Checked {scope} unique URLs: {len(broken)} broken")
         
         if broken:
-            self.warnings.append(f"Some URLs may be broken (checked sample of {len(sample)}):")
+            self.warnings.append(f"Some URLs may be broken (checked {scope}):")
             for url, status in broken:
                 self.warnings.append(f"  - {url}: {status}")
 
@@ -174,14 +322,28 @@ def main():
     parser.add_argument("filepath", help="Path to llms.txt file")
     parser.add_argument("--check-urls", action="store_true", help="Check if URLs are accessible")
     parser.add_argument("--sample-size", type=int, default=5, help="Number of URLs to check")
+    parser.add_argument("--check-all", action="store_true", help="Check every link concurrently (implies --check-urls)")
+    parser.add_argument("--workers", type=int, default=32, help="Concurrent link checks")
+    parser.add_argument("--per-host", type=int, default=4, help="Max concurrent requests per host")
+    parser.add_argument("--timeout", type=int, default=10, help="Request timeout in seconds")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help="Persistent link result cache")
+    parser.add_argument("--cache-ttl", type=float, default=24, help="Hours before a cached link result is rechecked")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the link result cache")
     
     args = parser.parse_args()
     
     validator = LLMsTxtValidator(args.filepath)
     results = validator.validate()
     
-    if args.check_urls:
-        validator.check_live_urls(args.sample_size)
+    if args.check_urls or args.check_all:
+        checker = LinkChecker(
+            workers=args.workers,
+            per_host=args.per_host,
+            timeout=args.timeout,
+            cache_file=None if args.no_cache else args.cache_file,
+            cache_ttl=args.cache_ttl * 3600,
+        )
+        validator.check_live_urls(args.sample_size, check_all=args.check_all, checker=checker)
     
     # Print results
     print(f"\n{'='*50}")
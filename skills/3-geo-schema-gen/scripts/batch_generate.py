@@ -6,9 +6,10 @@ Batch generate schemas for multiple pages from sitemap.
 import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 try:
     import requests
@@ -17,6 +18,14 @@ except ImportError:
     print("Error: pip install requests beautifulsoup4")
     sys.exit(1)
 
+# Add parent directory to path to import fragment_store
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fragment_store import FragmentStore
+
+# Page types that describe a web page and can carry a breadcrumb
+WEB_PAGE_TYPES = {"WebPage", "FAQPage"}
+CREATIVE_WORK_TYPES = {"Article", "BlogPosting", "WebPage", "FAQPage"}
+
 
 def fetch_sitemap_urls(sitemap_url):
     """Extract URLs from sitemap.xml."""
@@ -70,7 +79,36 @@ def detect_page_type(url, html):
     return "WebPage"
 
 
-def extract_schema_data(url, html, schema_type):
+def site_entities(url, soup, site_cache):
+    """Return the site-wide Organization and WebSite, derived once per site."""
+    parsed = urlparse(url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    if origin not in site_cache:
+        site_name = soup.find('meta', attrs={'property': 'og:site_name'})
+        name = site_name.get('content', '').strip() if site_name else ''
+        if not name:
+            name = parsed.netloc.replace('www.', '')
+        site_cache[origin] = (
+            {"@type": "Organization", "name": name, "url": origin},
+            {"@type": "WebSite", "name": name, "url": origin},
+        )
+    return site_cache[origin]
+
+
+def build_breadcrumb(url):
+    """Build a BreadcrumbList from the URL path segments."""
+    parsed = urlparse(url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    items = [{"@type": "ListItem", "position": 1, "name": "Home", "item": origin + "/"}]
+    path = ""
+    for segment in [s for s in parsed.path.split('/') if s]:
+        path += "/" + segment
+        name = re.sub(r'\.\w+$', '', segment).replace('-', ' ').replace('_', ' ').title()
+        items.append({"@type": "ListItem", "position": len(items) + 1, "name": name, "item": origin + path})
+    return {"@type": "BreadcrumbList", "itemListElement": items}
+
+
+def extract_schema_data(url, html, schema_type, site_cache=None):
     """Extract data for a specific schema type."""
     soup = BeautifulSoup(html, 'html.parser')
     data = {
@@ -109,6 +147,13 @@ def extract_schema_data(url, html, schema_type):
         if title:
             data["name"] = title.get_text(strip=True)
     
+    if site_cache is not None and schema_type in CREATIVE_WORK_TYPES:
+        organization, website = site_entities(url, soup, site_cache)
+        data["publisher"] = organization
+        data["isPartOf"] = website
+        if schema_type in WEB_PAGE_TYPES:
+            data["breadcrumb"] = build_breadcrumb(url)
+    
     return data
 
 
@@ -118,6 +163,10 @@ def main():
     parser.add_argument("--output-dir", "-o", default="./schemas", help="Output directory")
     parser.add_argument("--limit", "-l", type=int, default=50, help="Max pages to process")
     parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Store shared fragments once and write pages.jsonl with @id references")
+    parser.add_argument("--site-entities", action="store_true",
+                        help="Link pages to the site's Organization and WebSite, and add breadcrumbs")
     
     args = parser.parse_args()
     
@@ -137,6 +186,12 @@ def main():
     urls = urls[:args.limit]
     print(f"Processing first {len(urls)} URLs...")
     
+    # In dedupe mode pages go to one JSONL and shared entities to the fragment store
+    store = FragmentStore(output_dir) if args.dedupe else None
+    pages_file = open(output_dir / "pages.jsonl", 'w') if args.dedupe else None
+    # Site-wide publisher, isPartOf and breadcrumb are opt-in; --dedupe only changes storage
+    site_cache = {} if args.site_entities else None
+    
     # Process each URL
     results = []
     for i, url in enumerate(urls, 1):
@@ -155,14 +210,25 @@ def main():
             schema_type = detect_page_type(url, resp.text)
             print(f"  Detected type: {schema_type}")
             
-            schema = extract_schema_data(url, resp.text, schema_type)
+            schema = extract_schema_data(url, resp.text, schema_type, site_cache)
             
-            # Save individual file
             safe_name = url.replace('https://', '').replace('http://', '').replace('/', '_')[:100]
-            output_file = output_dir / f"{safe_name}.json"
-            with open(output_file, 'w') as f:
-                json.dump(schema, f, indent=2)
-            print(f"  ✅ Saved: {output_file}")
+            if store:
+                # Append the page with shared entities replaced by fragment references
+                output_file = output_dir / "pages.jsonl"
+                pages_file.write(json.dumps({
+                    "url": url,
+                    "name": safe_name,
+                    "type": schema_type,
+                    "schema": store.dedupe(schema)
+                }, separators=(',', ':')) + "\n")
+                print(f"  ✅ Stored: {url}")
+            else:
+                # Save individual file
+                output_file = output_dir / f"{safe_name}.json"
+                with open(output_file, 'w') as f:
+                    json.dump(schema, f, indent=2)
+                print(f"  ✅ Saved: {output_file}")
             
             results.append({
                 "url": url,
@@ -173,18 +239,31 @@ def main():
         except Exception as e:
             print(f"  ❌ Error: {e}")
     
+    summary = {
+        "total": len(urls),
+        "successful": len(results),
+        "results": results
+    }
+    if store:
+        pages_file.close()
+        store.close()
+        summary["fragments"] = {
+            "references": store.stats["references"],
+            "stored": store.stats["stored"],
+            "total": len(store.known)
+        }
+    
     # Save summary
     summary_file = output_dir / "summary.json"
     with open(summary_file, 'w') as f:
-        json.dump({
-            "total": len(urls),
-            "successful": len(results),
-            "results": results
-        }, f, indent=2)
+        json.dump(summary, f, indent=2)
     
     print(f"\n{'='*60}")
     print(f"Batch complete!")
     print(f"Generated {len(results)} schemas")
+    if store:
+        print(f"Fragments: {store.stats['references']} references, {store.stats['stored']} new")
+        print(f"Export full JSON-LD: python scripts/fragment_store.py {output_dir} --output-dir full/")
     print(f"Summary: {summary_file}")
     print('='*60)
 
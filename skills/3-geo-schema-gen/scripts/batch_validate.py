@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Batch validate Schema.org JSON-LD files from a directory or JSONL stream.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# Add parent directory to path to import validate_schema
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from validate_schema import SchemaValidator
+
+
+# One validator per worker process, reset between documents
+_validator = None
+
+
+def _init_worker():
+    global _validator
+    _validator = SchemaValidator()
+
+
+def iter_directory(root, exclude):
+    """Yield (source, path) for every .json file under root."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json') and entry.name not in exclude:
+                    yield entry.path, ('file', entry.path)
+
+
+def iter_jsonl(path):
+    """Yield (source, raw line) for every non-blank line of a JSONL file or stdin."""
+    f = sys.stdin if path == '-' else open(path, 'r')
+    name = 'stdin' if path == '-' else path
+    try:
+        for lineno, line in enumerate(f, 1):
+            if line.strip():
+                yield f"{name}:{lineno}", ('line', line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def validate_document(job):
+    """Load and validate one document (runs in a worker)."""
+    source, (kind, payload) = job
+    try:
+        if kind == 'file':
+            with open(payload, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+        else:
+            schema = json.loads(payload)
+    except OSError as e:
+        return {'source': source, 'valid': False, 'errors': [f"Could not read file: {e}"], 'warnings': []}
+    except ValueError as e:
+        # JSONDecodeError and UnicodeDecodeError (non-UTF-8 files)
+        return {'source': source, 'valid': False, 'errors': [f"Invalid JSON: {e}"], 'warnings': []}
+    
+    if not isinstance(schema, dict):
+        return {'source': source, 'valid': False, 'errors': ["Schema must be a JSON object"], 'warnings': []}
+    
+    _validator.reset()
+    try:
+        results = _validator.validate(schema)
+    except Exception as e:
+        # One malformed document must not abort the whole batch
+        return {'source': source, 'type': schema.get('@type'), 'valid': False,
+                'errors': [f"Validator error: {type(e).__name__}: {e}"], 'warnings': []}
+    return {
+        'source': source,
+        'type': schema.get('@type') if isinstance(schema, dict) else None,
+        'valid': results['valid'],
+        'errors': list(results['errors']),
+        'warnings': list(results['warnings']),
+    }
+
+
+def normalize_message(message):
+    """Collapse the document-specific parts of a finding for the histogram."""
+    message = re.sub(r"'[^']*'|\"[^\"]*\"", "'…'", message)
+    message = re.sub(r'\[\d+\]', '[N]', message)
+    message = re.sub(r'\b\d+\b', 'N', message)
+    return re.sub(r'(detected|value for|value): .*', r'\1: …', message)
+
+
+def iter_batches(jobs, size):
+    """Split the job stream into bounded batches so input is never fully buffered."""
+    jobs = iter(jobs)
+    while True:
+        batch = list(islice(jobs, size))
+        if not batch:
+            return
+        yield batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch validate Schema.org JSON-LD")
+    parser.add_argument("input", help="Directory of .json files, or a .jsonl file ('-' for stdin)")
+    parser.add_argument("--output", "-o", help="Per-document results as JSONL (default: stdout)")
+    parser.add_argument("--histogram", default="validation-summary.json", help="Aggregate error histogram output")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--chunksize", type=int, default=64, help="Documents sent to a worker per task")
+    parser.add_argument("--exclude", default="summary.json", help="Comma-separated file names to skip")
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    
+    args = parser.parse_args()
+    
+    if os.path.isdir(args.input):
+        jobs = iter_directory(args.input, set(args.exclude.split(',')))
+    else:
+        jobs = iter_jsonl(args.input)
+    
+    out = open(args.output, 'w') if args.output else sys.stdout
+    error_hist = Counter()
+    warning_hist = Counter()
+    type_counts = Counter()
+    total = passed = 0
+    started = time.perf_counter()
+    
+    batch_size = max(1, args.chunksize) * max(1, args.workers or 1) * 4
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        for batch in iter_batches(jobs, batch_size):
+            for result in executor.map(validate_document, batch, chunksize=max(1, args.chunksize)):
+                ok = result['valid'] and not (args.strict and result['warnings'])
+                result['passed'] = ok
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                
+                total += 1
+                passed += ok
+                type_counts[str(result.get('type'))] += 1
+                error_hist.update(normalize_message(e) for e in result['errors'])
+                warning_hist.update(normalize_message(w) for w in result['warnings'])
+    
+    if out is not sys.stdout:
+        out.close()
+    
+    elapsed = time.perf_counter() - started
+    summary = {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "strict": args.strict,
+        "elapsed_seconds": round(elapsed, 2),
+        "types": dict(type_counts.most_common()),
+        "errors": dict(error_hist.most_common()),
+        "warnings": dict(warning_hist.most_common()),
+    }
+    with open(args.histogram, 'w') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    
+    print(f"\n{'='*60}", file=sys.stderr)
+    print(f"Validated {total} documents in {elapsed:.1f}s: {passed} passed, {total - passed} failed", file=sys.stderr)
+    for message, count in error_hist.most_common(10):
+        print(f"  {count:>6}  {message}", file=sys.stderr)
+    print(f"Histogram: {args.histogram}", file=sys.stderr)
+    print('='*60, file=sys.stderr)
+    
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Bulk generate Product JSON-LD from CSV/JSONL product feeds.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+# Add parent directory to path to import generate_schema
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_schema import SCHEMA_TEMPLATES
+
+
+# Column mapping for Google Merchant Center style feeds. Keys are dotted
+# paths into the schema; values are a column name or a spec with
+# "column", "default", "map" and "transform".
+DEFAULT_MAPPING = {
+    "type": "Product",
+    "fields": {
+        "name": "title",
+        "description": "description",
+        "sku": "id",
+        "mpn": "mpn",
+        "gtin13": "gtin",
+        "image": "image_link",
+        "url": "link",
+        "brand.name": "brand",
+        "offers.price": {"column": "price", "transform": "price_amount"},
+        "offers.priceCurrency": {"column": "price", "transform": "price_currency", "default": "USD"},
+        "offers.availability": {
+            "column": "availability",
+            "map": {
+                "in stock": "https://schema.org/InStock",
+                "in_stock": "https://schema.org/InStock",
+                "out of stock": "https://schema.org/OutOfStock",
+                "out_of_stock": "https://schema.org/OutOfStock",
+                "preorder": "https://schema.org/PreOrder",
+                "backorder": "https://schema.org/BackOrder",
+            },
+        },
+        "offers.itemCondition": {
+            "column": "condition",
+            "map": {
+                "new": "https://schema.org/NewCondition",
+                "used": "https://schema.org/UsedCondition",
+                "refurbished": "https://schema.org/RefurbishedCondition",
+            },
+        },
+        "offers.url": "link",
+    },
+}
+
+PRICE_PATTERN = re.compile(r'([\d.,]+)\s*([A-Za-z]{3})?')
+
+TRANSFORMS = {
+    "price_amount": lambda v: (m := PRICE_PATTERN.search(v)) and m.group(1).replace(',', ''),
+    "price_currency": lambda v: (m := PRICE_PATTERN.search(v)) and m.group(2) and m.group(2).upper(),
+    "lower": str.lower,
+    "strip": str.strip,
+}
+
+# Compiled mapping, set once per worker process
+_compiled = None
+
+# Skipped lines and failed rows listed individually in the summary
+MAX_REPORTED_ERRORS = 20
+
+
+def _nested_types(template, prefix=()):
+    """Map each nested object path in a template to its @type."""
+    types = {}
+    for key, value in template.items():
+        if isinstance(value, dict) and "@type" in value:
+            types[prefix + (key,)] = value["@type"]
+            types.update(_nested_types(value, prefix + (key,)))
+    return types
+
+
+def compile_mapping(mapping):
+    """Turn a declarative mapping into (path, getter) pairs plus nested @types."""
+    schema_type = mapping.get("type", "Product")
+    template = SCHEMA_TEMPLATES.get(schema_type, {"@context": "https://schema.org", "@type": schema_type})
+    nested_types = _nested_types(template)
+    nested_types.update({tuple(k.split('.')): v for k, v in mapping.get("types", {}).items()})
+
+    fields = []
+    for path, spec in mapping["fields"].items():
+        if isinstance(spec, str):
+            spec = {"column": spec}
+        column = spec.get("column")
+        default = spec.get("default")
+        value_map = {k.lower(): v for k, v in spec.get("map", {}).items()}
+        transform = TRANSFORMS[spec["transform"]] if "transform" in spec else None
+
+        def getter(row, column=column, default=default, value_map=value_map, transform=transform):
+            value = row.get(column) if column else None
+            if isinstance(value, str):
+                value = value.strip()
+                if value and transform:
+                    value = transform(value)
+                if value and value_map:
+                    value = value_map.get(value.lower(), value)
+            return value if value not in (None, "") else default
+
+        fields.append((tuple(path.split('.')), getter))
+
+    return {
+        "context": template.get("@context", "https://schema.org"),
+        "type": schema_type,
+        "nested_types": nested_types,
+        "fields": fields,
+        "id_template": mapping.get("id"),
+    }
+
+
+def build_schema(row, compiled):
+    """Build one JSON-LD document from a feed row; empty fields are omitted."""
+    schema = {"@context": compiled["context"], "@type": compiled["type"]}
+    for path, getter in compiled["fields"]:
+        value = getter(row)
+        if value is None:
+            continue
+        node = schema
+        for depth, key in enumerate(path[:-1], 1):
+            if key not in node:
+                node[key] = {}
+                nested_type = compiled["nested_types"].get(path[:depth])
+                if nested_type:
+                    node[key]["@type"] = nested_type
+            node = node[key]
+        node[path[-1]] = value
+    if compiled["id_template"]:
+        schema["@id"] = compiled["id_template"].format(**row)
+    return schema
+
+
+def _init_worker(mapping):
+    global _compiled
+    _compiled = compile_mapping(mapping)
+
+
+def generate_batch(rows):
+    """Serialize a batch of (line number, row) pairs to JSON-LD lines (runs in a worker).
+
+    Returns the lines and a (line number, error) pair for each row that failed.
+    """
+    lines, errors = [], []
+    for line_number, row in rows:
+        try:
+            lines.append(json.dumps(build_schema(row, _compiled), ensure_ascii=False, separators=(',', ':')))
+        except (KeyError, ValueError, TypeError) as e:
+            errors.append((line_number, f"{type(e).__name__}: {e}"))
+    return lines, errors
+
+
+def _iter_jsonl(lines, skipped):
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            skipped.append((line_number, f"Invalid JSON: {e}"))
+            continue
+        if not isinstance(row, dict):
+            skipped.append((line_number, "Row must be a JSON object"))
+            continue
+        yield line_number, row
+
+
+def iter_rows(path, skipped):
+    """Stream (line number, row) pairs from a CSV/TSV or JSONL file ('-' reads JSONL from stdin).
+
+    Malformed JSONL lines are appended to ``skipped`` as (line number, error)
+    instead of stopping the feed.
+    """
+    if path == '-':
+        yield from _iter_jsonl(sys.stdin, skipped)
+        return
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            yield from _iter_jsonl(f, skipped)
+        else:
+            delimiter = '\t' if path.endswith('.tsv') else ','
+            reader = csv.DictReader(f, delimiter=delimiter)
+            for row in reader:
+                yield reader.line_num, row
+
+
+class ShardWriter:
+    """Write JSONL lines to one file or to fixed-size numbered shards."""
+
+    def __init__(self, output, output_dir, shard_size):
+        self.output = output
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.shard_size = shard_size
+        self.count = 0
+        self.files = []
+        self._fh = None
+        if self.output_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self._fh = open(output, 'w', encoding='utf-8') if output else sys.stdout
+
+    def write(self, line):
+        if self.output_dir and self.count % self.shard_size == 0:
+            if self._fh:
+                self._fh.close()
+            shard = self.output_dir / f"schemas-{self.count // self.shard_size:05d}.jsonl"
+            self.files.append(str(shard))
+            self._fh = open(shard, 'w', encoding='utf-8')
+        self._fh.write(line + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._fh and self._fh is not sys.stdout:
+            self._fh.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk generate Product JSON-LD from a product feed")
+    parser.add_argument("feed", help="CSV/TSV or JSONL product feed ('-' for JSONL on stdin)")
+    parser.add_argument("--mapping", help="JSON mapping file (default: Google Merchant feed columns)")
+    parser.add_argument("--output", "-o", help="Single JSONL output file (default: stdout)")
+    parser.add_argument("--output-dir", help="Write numbered JSONL shards to this directory instead")
+    parser.add_argument("--shard-size", type=int, default=10000, help="Schemas per shard with --output-dir")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (0 = in-process)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Rows per worker task")
+
+    args = parser.parse_args()
+
+    mapping = DEFAULT_MAPPING
+    if args.mapping:
+        with open(args.mapping, 'r') as f:
+            mapping = json.load(f)
+
+    writer = ShardWriter(args.output, args.output_dir, args.shard_size)
+    skipped = []
+    rows = iter_rows(args.feed, skipped)
+    batches = iter(lambda: list(islice(rows, args.batch_size)), [])
+    errors = []
+    started = time.perf_counter()
+
+    if args.workers == 0:
+        _init_worker(mapping)
+        for batch in batches:
+            lines, batch_errors = generate_batch(batch)
+            errors.extend(batch_errors)
+            for line in lines:
+                writer.write(line)
+    else:
+        # Keep a bounded window of batches in flight so memory stays constant
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(mapping,)) as executor:
+            pending = deque()
+            window = max(2, (args.workers or os.cpu_count() or 1) * 2)
+            for batch in batches:
+                pending.append(executor.submit(generate_batch, batch))
+                while len(pending) >= window or (pending and pending[0].done()):
+                    lines, batch_errors = pending.popleft().result()
+                    errors.extend(batch_errors)
+                    for line in lines:
+                        writer.write(line)
+            while pending:
+                lines, batch_errors = pending.popleft().result()
+                errors.extend(batch_errors)
+                for line in lines:
+                    writer.write(line)
+
+    writer.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}", file=sys.stderr)
+    print(f"Generated {writer.count} schemas in {elapsed:.1f}s "
+          f"({writer.count / elapsed if elapsed else 0:,.0f} rows/s), {len(errors)} row error(s), "
+          f"{len(skipped)} skipped line(s)", file=sys.stderr)
+    for label, problems in (("Skipped", skipped), ("Failed", sorted(errors))):
+        for line_number, error in problems[:MAX_REPORTED_ERRORS]:
+            print(f"  {label} line {line_number}: {error}", file=sys.stderr)
+        if len(problems) > MAX_REPORTED_ERRORS:
+            print(f"  ... and {len(problems) - MAX_REPORTED_ERRORS} more", file=sys.stderr)
+    if writer.files:
+        print(f"Shards: {len(writer.files)} files in {args.output_dir}", file=sys.stderr)
+    print('='*60, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Crawl a live site from its sitemap and validate the deployed JSON-LD.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+
+try:
+    import requests
+except ImportError:
+    print("Error: pip install requests")
+    sys.exit(1)
+
+# Add parent directory to path to import validate_schema and batch_validate
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from validate_schema import SchemaValidator
+from batch_validate import normalize_message
+
+
+JSON_LD_PATTERN = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Example URLs kept per finding in the rollup
+SAMPLE_URLS = 3
+
+# One validator per worker process, reset between blocks
+_validator = None
+
+
+def _init_worker():
+    global _validator
+    _validator = SchemaValidator()
+
+
+class PageFetcher:
+    """Fetch pages from worker threads, each with its own pooled session."""
+
+    def __init__(self, workers=16, timeout=15):
+        self.workers = workers
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = 'schema-crawl-validator/1.0'
+            self._local.session = session
+        return session
+
+    def fetch(self, url):
+        """Return (url, status, JSON-LD blocks); status is an error string on failure."""
+        try:
+            resp = self.session().get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            return url, type(e).__name__, []
+        if resp.status_code != 200:
+            return url, resp.status_code, []
+        return url, 200, [block.strip() for block in JSON_LD_PATTERN.findall(resp.text) if block.strip()]
+
+
+def iter_sitemap_urls(source, session):
+    """Stream page URLs from a sitemap, following sitemap indexes.
+
+    ``source`` is a sitemap URL, a local sitemap file, or a text file with
+    one URL per line. Remote sitemaps are parsed incrementally as they
+    download.
+    """
+    if not source.startswith('http'):
+        with open(source, 'r') as f:
+            head = f.read(512)
+            f.seek(0)
+            if not head.lstrip().startswith('<'):
+                for line in f:
+                    if line.strip():
+                        yield line.strip()
+                return
+            yield from _parse_sitemap(iter(lambda: f.read(65536).encode('utf-8'), b''), session)
+        return
+
+    resp = session.get(source, timeout=30, stream=True)
+    if resp.status_code != 200:
+        print(f"Error fetching sitemap {source}: HTTP {resp.status_code}", file=sys.stderr)
+        return
+    yield from _parse_sitemap(resp.iter_content(65536), session)
+
+
+def _parse_sitemap(chunks, session):
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    nested = []
+    in_index = False
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                in_index = in_index or tag == 'sitemap'
+            elif tag == 'loc' and elem.text:
+                # Child sitemaps of an index are crawled after this document
+                if in_index:
+                    nested.append(elem.text.strip())
+                else:
+                    yield elem.text.strip()
+            elif tag in ('url', 'sitemap'):
+                in_index = False
+                elem.clear()
+    for child in nested:
+        yield from iter_sitemap_urls(child, session)
+
+
+def schema_type_key(schema):
+    """Rollup key: the @type, or the member types of an @graph."""
+    if not isinstance(schema, dict):
+        return type(schema).__name__
+    if '@graph' in schema and isinstance(schema['@graph'], list):
+        types = sorted({str(m.get('@type')) for m in schema['@graph'] if isinstance(m, dict)})
+        return '@graph[' + '+'.join(types) + ']'
+    declared = schema.get('@type', 'Unknown')
+    return '+'.join(map(str, declared)) if isinstance(declared, list) else str(declared)
+
+
+def validate_page(job):
+    """Validate every JSON-LD block of one page (runs in a worker)."""
+    url, blocks = job
+    results = []
+    for index, block in enumerate(blocks):
+        try:
+            data = json.loads(block)
+        except json.JSONDecodeError as e:
+            results.append({'block': index, 'type': 'InvalidJSON', 'valid': False,
+                            'errors': [f"Invalid JSON: {e.msg}"], 'warnings': []})
+            continue
+        # A block may hold a single schema or an array of them
+        for schema in (data if isinstance(data, list) else [data]):
+            if not isinstance(schema, dict):
+                results.append({'block': index, 'type': schema_type_key(schema), 'valid': False,
+                                'errors': ["Schema must be a JSON object"], 'warnings': []})
+                continue
+            _validator.reset()
+            try:
+                outcome = _validator.validate(schema)
+            except Exception as e:
+                # One malformed schema must not abort the whole crawl
+                results.append({'block': index, 'type': schema_type_key(schema), 'valid': False,
+                                'errors': [f"Validator error: {type(e).__name__}: {e}"], 'warnings': []})
+                continue
+            results.append({
+                'block': index,
+                'type': schema_type_key(schema),
+                'valid': outcome['valid'],
+                'errors': list(outcome['errors']),
+                'warnings': list(outcome['warnings']),
+            })
+    return url, results
+
+
+class Rollup:
+    """Aggregate findings per schema type and normalized message."""
+
+    def __init__(self, strict=False):
+        self.strict = strict
+        self.pages = Counter()
+        self.fetch_errors = Counter()
+        self.types = defaultdict(lambda: {
+            'schemas': 0, 'passed': 0,
+            'errors': defaultdict(lambda: {'count': 0, 'urls': []}),
+            'warnings': defaultdict(lambda: {'count': 0, 'urls': []}),
+        })
+
+    def add_fetch(self, url, status, blocks):
+        self.pages['crawled'] += 1
+        if status != 200:
+            self.fetch_errors[str(status)] += 1
+        elif not blocks:
+            self.pages['without_schema'] += 1
+
+    def add_results(self, url, results):
+        self.pages['with_schema'] += 1
+        page_ok = True
+        for result in results:
+            entry = self.types[result['type']]
+            entry['schemas'] += 1
+            ok = result['valid'] and not (self.strict and result['warnings'])
+            entry['passed'] += ok
+            page_ok = page_ok and ok
+            for kind in ('errors', 'warnings'):
+                for message in set(map(normalize_message, result[kind])):
+                    finding = entry[kind][message]
+                    finding['count'] += 1
+                    if len(finding['urls']) < SAMPLE_URLS:
+                        finding['urls'].append(url)
+        self.pages['passed' if page_ok else 'failed'] += 1
+
+    def to_dict(self):
+        def ranked(findings):
+            return dict(sorted(findings.items(), key=lambda item: -item[1]['count']))
+
+        return {
+            'pages': dict(self.pages),
+            'fetch_errors': dict(self.fetch_errors.most_common()),
+            'types': {
+                name: {
+                    'schemas': entry['schemas'],
+                    'passed': entry['passed'],
+                    'failed': entry['schemas'] - entry['passed'],
+                    'errors': ranked(entry['errors']),
+                    'warnings': ranked(entry['warnings']),
+                }
+                for name, entry in sorted(self.types.items(), key=lambda item: -item[1]['schemas'])
+            },
+        }
+
+
+def crawl(urls, fetcher, executor, rollup, out=None, max_in_flight=256):
+    """Fetch pages and validate their blocks, keeping a bounded number in flight."""
+    urls = iter(urls)
+    fetching, validating = set(), set()
+    exhausted = False
+    reported = 0
+
+    with ThreadPoolExecutor(max_workers=fetcher.workers) as fetch_pool:
+        while True:
+            while not exhausted and len(fetching) + len(validating) < max_in_flight:
+                url = next(urls, None)
+                if url is None:
+                    exhausted = True
+                    break
+                fetching.add(fetch_pool.submit(fetcher.fetch, url))
+            if not fetching and not validating:
+                break
+
+            done, _ = wait(fetching | validating, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    fetching.discard(future)
+                    url, status, blocks = future.result()
+                    rollup.add_fetch(url, status, blocks)
+                    if blocks:
+                        validating.add(executor.submit(validate_page, (url, blocks)))
+                    elif out:
+                        out.write(json.dumps({'url': url, 'status': status, 'schemas': []}) + "\n")
+                else:
+                    validating.discard(future)
+                    url, results = future.result()
+                    rollup.add_results(url, results)
+                    if out:
+                        out.write(json.dumps({'url': url, 'status': 200, 'schemas': results},
+                                             ensure_ascii=False) + "\n")
+
+            if rollup.pages['crawled'] >= reported + 1000:
+                reported = rollup.pages['crawled'] - rollup.pages['crawled'] % 1000
+                print(f"  {reported} pages crawled", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the JSON-LD deployed across a live site")
+    parser.add_argument("sitemap", help="Sitemap URL, sitemap file, or text file of URLs")
+    parser.add_argument("--output", "-o", help="Per-page results as JSONL")
+    parser.add_argument("--rollup", default="crawl-summary.json", help="Per-type, per-error rollup output")
+    parser.add_argument("--limit", "-l", type=int, help="Max pages to crawl")
+    parser.add_argument("--fetchers", type=int, default=16, help="Concurrent page fetches")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Validation worker processes")
+    parser.add_argument("--timeout", type=float, default=15, help="Per-page request timeout in seconds")
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+
+    args = parser.parse_args()
+
+    fetcher = PageFetcher(workers=args.fetchers, timeout=args.timeout)
+    urls = iter_sitemap_urls(args.sitemap, fetcher.session())
+    if args.limit:
+        urls = islice(urls, args.limit)
+
+    rollup = Rollup(strict=args.strict)
+    out = open(args.output, 'w') if args.output else None
+    started = time.perf_counter()
+
+    print(f"Crawling {args.sitemap}...", file=sys.stderr)
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        crawl(urls, fetcher, executor, rollup, out=out, max_in_flight=max(64, args.fetchers * 8))
+
+    if out:
+        out.close()
+
+    elapsed = time.perf_counter() - started
+    summary = rollup.to_dict()
+    summary['elapsed_seconds'] = round(elapsed, 2)
+    with open(args.rollup, 'w') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    pages = summary['pages']
+    print(f"\n{'='*60}", file=sys.stderr)
+    print(f"Crawled {pages.get('crawled', 0)} pages in {elapsed:.1f}s: "
+          f"{pages.get('with_schema', 0)} with JSON-LD, {pages.get('without_schema', 0)} without, "
+          f"{sum(rollup.fetch_errors.values())} fetch errors", file=sys.stderr)
+    for name, entry in summary['types'].items():
+        print(f"  {name}: {entry['passed']}/{entry['schemas']} passed", file=sys.stderr)
+        for message, finding in islice(entry['errors'].items(), 3):
+            print(f"    {finding['count']:>6}  {message}", file=sys.stderr)
+    print(f"Rollup: {args.rollup}", file=sys.stderr)
+    print('='*60, file=sys.stderr)
+
+    return 0 if not pages.get('failed') else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
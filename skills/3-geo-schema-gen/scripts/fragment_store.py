@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for schema fragments shared across pages.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+
+FRAGMENT_PREFIX = "urn:fragment:"
+
+
+def fragment_key(entity):
+    """Hash an entity's normalized JSON (sorted keys, compact separators)."""
+    normalized = json.dumps(entity, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:20]
+
+
+class FragmentStore:
+    """Append-only fragment store backed by ``fragments.jsonl``.
+
+    Nested typed entities (anything with an ``@type`` below the page root)
+    are stored once by content hash and replaced in the page with
+    ``{"@id": "urn:fragment:<hash>"}``. Children are stored before their
+    parents, so a breadcrumb sharing most of its items with other pages
+    only adds the items that differ.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.path = self.root / "fragments.jsonl"
+        self.known = set()
+        self.stats = {"references": 0, "stored": 0}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        self.known.add(json.loads(line)["id"])
+        self._fh = open(self.path, 'a', encoding='utf-8')
+
+    def put(self, entity):
+        """Store an entity if it is new and return its fragment @id."""
+        fragment_id = FRAGMENT_PREFIX + fragment_key(entity)
+        self.stats["references"] += 1
+        if fragment_id not in self.known:
+            self.known.add(fragment_id)
+            self.stats["stored"] += 1
+            self._fh.write(json.dumps({"id": fragment_id, "fragment": entity},
+                                      ensure_ascii=False, separators=(',', ':')) + "\n")
+        return fragment_id
+
+    def dedupe(self, document):
+        """Return a copy of a page document with nested entities replaced by references."""
+        return self._dedupe(document, top=True)
+
+    def _dedupe(self, value, top=False):
+        if isinstance(value, list):
+            return [self._dedupe(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        node = {key: self._dedupe(item) for key, item in value.items()}
+        if top or "@type" not in node:
+            return node
+        return {"@id": self.put(node)}
+
+    def close(self):
+        self._fh.close()
+
+
+def load_fragments(root):
+    """Read every fragment in a store into memory, keyed by @id."""
+    fragments = {}
+    with open(Path(root) / "fragments.jsonl", 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                fragments[record["id"]] = record["fragment"]
+    return fragments
+
+
+def expand(value, fragments):
+    """Reassemble full JSON-LD by inlining fragment references."""
+    if isinstance(value, list):
+        return [expand(item, fragments) for item in value]
+    if not isinstance(value, dict):
+        return value
+    ref = value.get("@id")
+    if len(value) == 1 and isinstance(ref, str) and ref in fragments:
+        return expand(fragments[ref], fragments)
+    return {key: expand(item, fragments) for key, item in value.items()}
+
+
+def export(store_dir, output=None, output_dir=None, urls=None):
+    """Write expanded schemas from ``pages.jsonl`` to a JSONL file or one file per page."""
+    store_dir = Path(store_dir)
+    fragments = load_fragments(store_dir)
+    wanted = set(urls) if urls else None
+
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out = None if output_dir else (open(output, 'w', encoding='utf-8') if output else sys.stdout)
+
+    count = 0
+    with open(store_dir / "pages.jsonl", 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            page = json.loads(line)
+            if wanted is not None and page["url"] not in wanted:
+                continue
+            schema = expand(page["schema"], fragments)
+            if output_dir:
+                with open(Path(output_dir) / f"{page['name']}.json", 'w', encoding='utf-8') as pf:
+                    json.dump(schema, pf, indent=2, ensure_ascii=False)
+            else:
+                out.write(json.dumps({"url": page["url"], "schema": schema}, ensure_ascii=False) + "\n")
+            count += 1
+
+    if out and out is not sys.stdout:
+        out.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reassemble full JSON-LD from a fragment store")
+    parser.add_argument("store_dir", help="Directory written by batch_generate.py --dedupe")
+    parser.add_argument("--output", "-o", help="JSONL output file (default: stdout)")
+    parser.add_argument("--output-dir", help="Write one <page>.json file per page instead")
+    parser.add_argument("--url", action="append", help="Only export this page URL (repeatable)")
+
+    args = parser.parse_args()
+
+    count = export(args.store_dir, output=args.output, output_dir=args.output_dir, urls=args.url)
+    print(f"Exported {count} schemas", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,175 @@ import sys
 import re
 
 
+# Compact Schema.org subset used by SchemaValidator. Each type names its
+# parent; `required` is inherited unless a type declares its own, while
+# `recommended` and `properties` accumulate down the hierarchy. Messages
+# may use {type}, {field} and {index}.
+#
+# `required` applies to top-level and @graph entities. Entities nested
+# inside another (an Article's publisher, say) only need `nested_required`,
+# which defaults to `required`.
+SCHEMA_RULES = {
+    "Thing": {
+        "parent": None,
+        "properties": {
+            "name": {"kind": "text"},
+            "url": {"kind": "url"},
+            "description": {"kind": "text"},
+        },
+    },
+    "CreativeWork": {"parent": "Thing"},
+    "Article": {
+        "parent": "CreativeWork",
+        "required": ["headline", "author", "datePublished"],
+        "recommended": {
+            "publisher": "{type} should include publisher",
+            "image": "{type} should include image for rich results",
+        },
+    },
+    "BlogPosting": {"parent": "Article"},
+    "NewsArticle": {"parent": "Article"},
+    "WebSite": {"parent": "CreativeWork", "required": ["name", "url"], "nested_required": ["name"]},
+    "WebPage": {"parent": "CreativeWork"},
+    "FAQPage": {
+        "parent": "WebPage",
+        "required": ["mainEntity"],
+        "properties": {
+            "mainEntity": {
+                "kind": "array",
+                "message": "FAQPage mainEntity must be an array",
+                "items": {
+                    "type": "Question",
+                    "type_message": "FAQ item {index} must be @type: Question",
+                    "required": {"acceptedAnswer": "FAQ item {index} missing acceptedAnswer"},
+                },
+            },
+        },
+    },
+    "HowTo": {"parent": "CreativeWork", "required": ["name", "step"]},
+    "Organization": {
+        "parent": "Thing",
+        "required": ["name", "url"],
+        "nested_required": ["name"],
+        "recommended": {"logo": "{type} should include logo"},
+    },
+    "Place": {"parent": "Thing"},
+    "LocalBusiness": {"parent": "Place", "required": ["name", "address"], "nested_required": ["name"]},
+    "Product": {
+        "parent": "Thing",
+        "required": ["name"],
+        "any_of": [(("offers", "review"), "Product must have offers or review")],
+        "properties": {
+            "offers": {"kind": "entity", "type": "Offer", "message": "Product offers must be an object"},
+        },
+    },
+    "Offer": {
+        "parent": "Thing",
+        "required": {"price": "Offer missing price"},
+        "recommended": {"priceCurrency": "Offer should specify priceCurrency"},
+        "checks": ["price_format"],
+    },
+    "ItemList": {"parent": "Thing"},
+    "BreadcrumbList": {
+        "parent": "ItemList",
+        "required": ["itemListElement"],
+        "properties": {
+            "itemListElement": {
+                "kind": "array",
+                "items": {"required": {"position": "Breadcrumb item {index} missing position"}},
+            },
+        },
+    },
+}
+
+PROMOTIONAL_WORDS = ['best', 'revolutionary', 'amazing', 'incredible', 'unmatched']
+PROMOTIONAL_PATTERN = re.compile('|'.join(PROMOTIONAL_WORDS))
+PRICE_PATTERN = re.compile(r'^\d+(\.\d{2})?$')
+
+KIND_CHECKS = {
+    "text": lambda v: isinstance(v, str),
+    "url": lambda v: isinstance(v, str),
+    "array": lambda v: isinstance(v, list),
+    "entity": lambda v: isinstance(v, dict) or (isinstance(v, list) and all(isinstance(i, dict) for i in v)),
+}
+
+
+def _is_empty(value):
+    return value is None or value == "" or value == [] or value == {}
+
+
+def compile_rules(rules):
+    """Flatten SCHEMA_RULES into one lookup table per type, inheritance resolved."""
+    compiled = {}
+    
+    def resolve(type_name):
+        if type_name in compiled:
+            return compiled[type_name]
+        spec = rules[type_name]
+        parent = resolve(spec["parent"]) if spec.get("parent") else None
+        
+        def fields(declared):
+            if isinstance(declared, dict):
+                return tuple(declared.items())
+            return tuple((field, "{type} missing required field: {field}") for field in declared)
+        
+        if spec.get("required") is None:
+            required = parent["required"] if parent else ()
+            nested_required = parent["nested_required"] if parent else ()
+        else:
+            required = fields(spec["required"])
+            nested_required = required
+        if spec.get("nested_required") is not None:
+            nested_required = fields(spec["nested_required"])
+        
+        properties = dict(parent["properties"]) if parent else {}
+        properties.update(spec.get("properties", {}))
+        recommended = dict(parent["recommended"]) if parent else {}
+        recommended.update(spec.get("recommended", {}))
+        
+        compiled[type_name] = {
+            "ancestors": {type_name} | (parent["ancestors"] if parent else set()),
+            "required": required,
+            "nested_required": nested_required,
+            "recommended": tuple(recommended.items()),
+            "any_of": tuple(spec.get("any_of", ())) or (parent["any_of"] if parent else ()),
+            "properties": properties,
+            "checks": tuple(spec.get("checks", ())) or (parent["checks"] if parent else ()),
+        }
+        return compiled[type_name]
+    
+    for type_name in rules:
+        resolve(type_name)
+    return compiled
+
+
+COMPILED_RULES = compile_rules(SCHEMA_RULES)
+
+
 class SchemaValidator:
     """Validate Schema.org JSON-LD."""
     
-    def __init__(self):
+    def __init__(self, rules=None, max_findings=1000):
+        self.rules = rules or COMPILED_RULES
+        self.max_findings = max_findings
+        self.reset()
+    
+    def reset(self):
+        """Clear findings so one validator can be reused across documents."""
         self.errors = []
         self.warnings = []
         self.info = []
+        self.suppressed = 0
     
     def validate(self, schema):
         """Run all validations."""
         self._validate_structure(schema)
-        self._validate_context(schema)
-        self._validate_required_fields(schema)
-        self._validate_best_practices(schema)
+        if isinstance(schema, dict):
+            self._validate_context(schema)
+            self._validate_required_fields(schema)
+        
+        if self.suppressed:
+            self.info.append(f"{self.suppressed} further finding(s) suppressed after {self.max_findings} per category")
         
         return {
             'valid': len(self.errors) == 0,
@@ -57,116 +212,180 @@ class SchemaValidator:
                 self.warnings.append("@context may not include schema.org")
     
     def _validate_required_fields(self, schema):
-        """Validate required fields for specific types."""
-        schema_type = schema.get("@type", "")
-        
-        if schema_type == "Organization":
-            self._check_required(schema, ["name", "url"], "Organization")
-            if "logo" not in schema:
-                self.warnings.append("Organization should include logo")
-        
-        elif schema_type == "WebSite":
-            self._check_required(schema, ["name", "url"], "WebSite")
-        
-        elif schema_type in ["Article", "BlogPosting"]:
-            self._check_required(schema, ["headline", "author", "datePublished"], schema_type)
-            if "publisher" not in schema:
-                self.warnings.append(f"{schema_type} should include publisher")
-            if "image" not in schema:
-                self.warnings.append(f"{schema_type} should include image for rich results")
-        
-        elif schema_type == "Product":
-            self._check_required(schema, ["name"], "Product")
-            if "offers" not in schema and "review" not in schema:
-                self.errors.append("Product must have offers or review")
-            if "offers" in schema:
-                self._validate_offer(schema["offers"])
-        
-        elif schema_type == "FAQPage":
-            self._check_required(schema, ["mainEntity"], "FAQPage")
-            if "mainEntity" in schema:
-                if not isinstance(schema["mainEntity"], list):
-                    self.errors.append("FAQPage mainEntity must be an array")
-                else:
-                    for i, item in enumerate(schema["mainEntity"]):
-                        if item.get("@type") != "Question":
-                            self.errors.append(f"FAQ item {i+1} must be @type: Question")
-                        if "acceptedAnswer" not in item:
-                            self.errors.append(f"FAQ item {i+1} missing acceptedAnswer")
-        
-        elif schema_type == "HowTo":
-            self._check_required(schema, ["name", "step"], "HowTo")
-        
-        elif schema_type == "BreadcrumbList":
-            self._check_required(schema, ["itemListElement"], "BreadcrumbList")
-            if "itemListElement" in schema:
-                for i, item in enumerate(schema["itemListElement"]):
-                    if "position" not in item:
-                        self.errors.append(f"Breadcrumb item {i+1} missing position")
-        
-        elif schema_type == "LocalBusiness":
-            self._check_required(schema, ["name", "address"], "LocalBusiness")
-    
-    def _check_required(self, schema, fields, schema_type):
-        """Check that required fields are present."""
-        for field in fields:
-            if field not in schema or not schema[field]:
-                self.errors.append(f"{schema_type} missing required field: {field}")
-    
-    def _validate_offer(self, offer):
-        """Validate Offer object."""
-        if not isinstance(offer, dict):
-            self.errors.append("Product offers must be an object")
-            return
+        """Validate every entity in the document, including @graph and nested nodes.
+        
+        The document is walked once with an explicit stack, so depth and size
+        are bounded only by memory. Each stack entry carries a (parent, key)
+        frame instead of a path string; paths are only built when a finding
+        is reported. Nodes that are bare {"@id": ...} references are resolved
+        through an index of the entities defined in the document.
+        """
+        defined = {}
+        references = []
+        promotional = set()
         
-        if "price" not in offer:
-            self.errors.append("Offer missing price")
-        elif isinstance(offer.get("price"), str) and not re.match(r'^\d+(\.\d{2})?$', offer["price"]):
-            if "$" in offer["price"] or "€" in offer["price"] or "£" in offer["price"]:
-                self.errors.append("Price should not include currency symbol")
+        # (value, frame, implied type, is top-level entity)
+        stack = [(schema, None, None, True)]
+        while stack:
+            node, frame, implied_type, top = stack.pop()
+            
+            if isinstance(node, list):
+                children = [
+                    (item, (frame, i), implied_type, top)
+                    for i, item in enumerate(node) if isinstance(item, (dict, list))
+                ]
+                for item in node:
+                    if isinstance(item, str):
+                        promotional.update(PROMOTIONAL_PATTERN.findall(item.lower()))
+                stack.extend(reversed(children))
+                continue
+            
+            node_id = node.get("@id")
+            if isinstance(node_id, str):
+                if len(node) == 1:
+                    references.append((node_id, frame, implied_type))
+                    continue
+                defined[node_id] = node.get("@type")
+            
+            rule_type, label = self._rule_type(node.get("@type"), implied_type)
+            if rule_type:
+                self._apply_rules(node, rule_type, label, frame, top)
+            if top and "@type" in node:
+                self._check_top_level(node, frame)
+            
+            properties = self.rules[rule_type]["properties"] if rule_type else {}
+            children = []
+            for key, value in node.items():
+                if key == "@context":
+                    continue
+                if _is_empty(value) and value is not None:
+                    self._report(self.warnings, "Empty value for: {path}", (frame, key))
+                elif isinstance(value, (dict, list)):
+                    # Only the root's @graph items count as top-level entities
+                    child_top = key == "@graph" and frame is None
+                    children.append((value, (frame, key), properties.get(key, {}).get("type"), child_top))
+                elif isinstance(value, str):
+                    if top and value.startswith("http://"):
+                        self._report(self.warnings, f"{key} uses HTTP (consider HTTPS)", frame)
+                    promotional.update(PROMOTIONAL_PATTERN.findall(value.lower()))
+            stack.extend(reversed(children))
+        
+        self._resolve_references(defined, references)
         
-        if "priceCurrency" not in offer:
-            self.warnings.append("Offer should specify priceCurrency")
+        if promotional:
+            found = [p for p in PROMOTIONAL_WORDS if p in promotional]
+            self.warnings.append(f"Promotional language detected: {', '.join(found)}")
     
-    def _validate_best_practices(self, schema):
-        """Validate best practices."""
-        schema_type = schema.get("@type", "")
+    def _rule_type(self, declared, implied_type):
+        """Pick the rules for a node from its @type, or the type its property implies."""
+        for candidate in (declared if isinstance(declared, list) else [declared]):
+            if isinstance(candidate, str) and candidate in self.rules:
+                return candidate, candidate
+        if declared is None and implied_type in self.rules:
+            return implied_type, implied_type
+        return None, None
+    
+    def _resolve_references(self, defined, references):
+        """Check @id references against the entities defined in the document."""
+        external = 0
+        for node_id, frame, implied_type in references:
+            if node_id not in defined:
+                external += 1
+                continue
+            target_type, _ = self._rule_type(defined[node_id], None)
+            if implied_type in self.rules and target_type and implied_type not in self.rules[target_type]["ancestors"]:
+                self._report(self.errors, f"@id {node_id} refers to a {target_type}, expected {implied_type}", frame)
         
-        # Check for https in URLs
-        for key, value in schema.items():
-            if isinstance(value, str) and value.startswith("http://"):
-                self.warnings.append(f"{key} uses HTTP (consider HTTPS)")
+        if references:
+            self.info.append(f"Resolved {len(references) - external} of {len(references)} @id references")
+        if external:
+            self.info.append(f"{external} @id reference(s) point outside this document")
+    
+    def _path(self, frame, max_depth=50):
+        """Build a dotted path from a (parent, key) frame chain."""
+        parts = []
+        while frame is not None and len(parts) < max_depth:
+            frame, key = frame
+            parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+        path = ''.join(reversed(parts)).lstrip('.')
+        return f"….{path}" if frame is not None else path
+    
+    def _report(self, target, message, frame):
+        """Record a finding with its node's path, up to max_findings per list.
         
-        # Check description length
-        if "description" in schema:
-            desc = schema["description"]
-            if len(desc) < 50:
-                self.warnings.append("Description is quite short (< 50 chars)")
-            if len(desc) > 500:
-                self.warnings.append("Description is quite long (> 500 chars)")
+        The path goes where the message has a {path} placeholder, or is
+        prefixed to it; root-level findings get no prefix.
+        """
+        if len(target) >= self.max_findings:
+            self.suppressed += 1
+            return
+        if "{path}" in message:
+            message = message.format(path=self._path(frame))
+        elif frame is not None:
+            message = f"{self._path(frame)}: {message}"
+        target.append(message)
+    
+    def _apply_rules(self, entity, rule_type, label, frame=None, top=True):
+        """Check one entity against the lookup table for rule_type.
         
-        # Check for promotional language
-        promotional = ['best', 'revolutionary', 'amazing', 'incredible', 'unmatched']
-        schema_str = json.dumps(schema).lower()
-        found = [p for p in promotional if p in schema_str]
-        if found:
-            self.warnings.append(f"Promotional language detected: {', '.join(found)}")
+        Nested entities only need their type's nested_required fields.
+        """
+        rules = self.rules[rule_type]
         
-        # Check for empty values
-        self._check_empty_values(schema)
+        for field, message in rules["required" if top else "nested_required"]:
+            if _is_empty(entity.get(field)):
+                self._report(self.errors, message.format(type=label, field=field), frame)
+        
+        for field, message in rules["recommended"]:
+            if field not in entity:
+                self._report(self.warnings, message.format(type=label, field=field), frame)
+        
+        for fields, message in rules["any_of"]:
+            if not any(field in entity for field in fields):
+                self._report(self.errors, message.format(type=label), frame)
+        
+        for check in rules["checks"]:
+            getattr(self, f"_check_{check}")(entity, frame)
+        
+        for field, spec in rules["properties"].items():
+            if field in entity and not _is_empty(entity[field]):
+                self._apply_property(entity[field], field, spec, label, frame)
     
-    def _check_empty_values(self, data, path=""):
-        """Recursively check for empty values."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                if value == "" or value == [] or value == {}:
-                    self.warnings.append(f"Empty value for: {current_path}")
-                elif isinstance(value, (dict, list)):
-                    self._check_empty_values(value, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                self._check_empty_values(item, f"{path}[{i}]")
+    def _apply_property(self, value, field, spec, label, frame):
+        """Check a property value against its declared kind and item rules."""
+        kind = spec.get("kind")
+        if kind and not KIND_CHECKS[kind](value):
+            message = spec.get("message", "{type} {field} must be {kind}")
+            target = self.errors if kind in ("array", "entity") else self.warnings
+            self._report(target, message.format(type=label, field=field, kind=kind), frame)
+            return
+        
+        items = spec.get("items")
+        if items and isinstance(value, list):
+            for i, item in enumerate(value, 1):
+                if not isinstance(item, dict):
+                    continue
+                if "type" in items and item.get("@type") != items["type"]:
+                    self._report(self.errors, items["type_message"].format(index=i), frame)
+                for item_field, message in items.get("required", {}).items():
+                    if item_field not in item:
+                        self._report(self.errors, message.format(index=i, field=item_field), frame)
+    
+    def _check_price_format(self, offer, frame):
+        """Prices are plain numbers; the currency goes in priceCurrency."""
+        price = offer.get("price")
+        if isinstance(price, str) and not PRICE_PATTERN.match(price):
+            if "$" in price or "€" in price or "£" in price:
+                self._report(self.errors, "Price should not include currency symbol", frame)
+    
+    def _check_top_level(self, entity, frame):
+        """Checks that only apply to the document's top-level entities."""
+        desc = entity.get("description")
+        if isinstance(desc, str):
+            if len(desc) < 50:
+                self._report(self.warnings, "Description is quite short (< 50 chars)", frame)
+            if len(desc) > 500:
+                self._report(self.warnings, "Description is quite long (> 500 chars)", frame)
 
 
 def main():
@@ -0,0 +1,65 @@
+"""generate_schema templates must pass validate_schema once filled in."""
+
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from generate_schema import SCHEMA_TEMPLATES, SchemaGenerator
+from validate_schema import SchemaValidator
+
+
+DESCRIPTION = "A plain description of the page that is long enough to avoid warnings."
+
+# What a user fills in for each template; nested entities keep the
+# template's shape (e.g. an Article publisher with name and logo only)
+FILLED = {
+    "Organization": {"name": "Example Co", "url": "https://example.com", "logo": "https://example.com/logo.png",
+                     "description": DESCRIPTION, "sameAs": ["https://twitter.com/example"]},
+    "WebSite": {"name": "Example", "url": "https://example.com",
+                "potentialAction": {"target": "https://example.com/search?q={search_term_string}"}},
+    "Article": {"headline": "Headline", "description": DESCRIPTION, "author": {"name": "Ada"},
+                "publisher": {"name": "Example Co", "logo": {"url": "https://example.com/logo.png"}},
+                "datePublished": "2024-01-01", "dateModified": "2024-01-02", "url": "https://example.com/a",
+                "image": "https://example.com/a.png"},
+    "FAQPage": {"mainEntity": [{"@type": "Question", "name": "Why?",
+                                "acceptedAnswer": {"@type": "Answer", "text": "Because."}}]},
+    "Product": {"name": "Widget", "description": DESCRIPTION, "brand": {"name": "Example"},
+                "offers": {"price": "10.00"}},
+    "HowTo": {"name": "Do it", "description": DESCRIPTION, "totalTime": "PT5M",
+              "step": [{"@type": "HowToStep", "text": "Start."}]},
+    "BreadcrumbList": {"itemListElement": [{"@type": "ListItem", "position": 1, "name": "Home",
+                                            "item": "https://example.com"}]},
+    "VideoObject": {"name": "Video", "description": DESCRIPTION, "thumbnailUrl": "https://example.com/t.png",
+                    "uploadDate": "2024-01-01", "duration": "PT1M"},
+    "LocalBusiness": {"name": "Shop", "telephone": "+1-555-0100", "openingHours": "Mo-Fr 09:00-17:00",
+                      "address": {"streetAddress": "1 Main St", "addressLocality": "Town", "addressRegion": "ST",
+                                  "postalCode": "12345", "addressCountry": "US"}},
+}
+FILLED["BlogPosting"] = FILLED["Article"]
+
+
+def test_every_template_has_a_filled_example():
+    assert set(FILLED) == set(SCHEMA_TEMPLATES)
+
+
+def test_filled_templates_validate():
+    generator = SchemaGenerator()
+    validator = SchemaValidator()
+    for schema_type, values in FILLED.items():
+        schema = copy.deepcopy(SCHEMA_TEMPLATES[schema_type])
+        generator._deep_merge(schema, copy.deepcopy(values))
+        validator.reset()
+        results = validator.validate(schema)
+        assert results["errors"] == [], (schema_type, results["errors"])
+
+
+def test_nested_organization_needs_only_name():
+    validator = SchemaValidator()
+    nested = {"@context": "https://schema.org", "@type": "Article", "headline": "H", "author": "Ada",
+              "datePublished": "2024-01-01", "publisher": {"@type": "Organization", "name": "Example Co"}}
+    assert validator.validate(nested)["errors"] == []
+
+    validator.reset()
+    top_level = {"@context": "https://schema.org", "@graph": [{"@type": "Organization", "name": "Example Co"}]}
+    assert validator.validate(top_level)["errors"] == ["@graph[0]: Organization missing required field: url"]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Batch Prompt Research - Generate and cluster prompts for many brands.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path to import research_prompts
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from research_prompts import PromptResearcher, compile_templates
+
+
+# Set once per worker process by _init_worker
+_worker_templates = None
+_worker_options = None
+
+
+def _split_competitors(value):
+    """Accept a list or a comma/semicolon/pipe separated string."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(c).strip() for c in value if str(c).strip()]
+    for sep in (";", "|"):
+        value = value.replace(sep, ",")
+    return [c.strip() for c in value.split(",") if c.strip()]
+
+
+def load_brand_configs(path):
+    """Read brand configs from a JSONL file or a CSV with a header row.
+
+    Each config needs ``brand`` and ``category``; ``competitors`` and
+    ``audience`` are optional.
+    """
+    configs = []
+    with open(path, "r", newline="") as f:
+        if path.endswith(".jsonl"):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for row in rows:
+            if not row.get("brand") or not row.get("category"):
+                continue
+            configs.append({
+                "brand": row["brand"].strip(),
+                "category": row["category"].strip(),
+                "competitors": _split_competitors(row.get("competitors")),
+                "audience": (row.get("audience") or "").strip(),
+            })
+    return configs
+
+
+def _init_worker(templates, options):
+    global _worker_templates, _worker_options
+    _worker_templates = templates
+    _worker_options = options
+
+
+def research_brand(config):
+    """Generate and cluster prompts for one brand config (runs in a worker)."""
+    started = time.perf_counter()
+    try:
+        researcher = PromptResearcher(
+            brand=config["brand"],
+            category=config["category"],
+            competitors=config["competitors"],
+            audience=config["audience"],
+            cluster_mode=_worker_options["cluster_mode"],
+            similarity_threshold=_worker_options["similarity_threshold"],
+            templates=_worker_templates,
+        )
+        prompts = researcher.generate_all_prompts()
+        clusters = researcher.cluster_prompts()
+    except Exception as e:
+        return config, [], {"brand": config["brand"], "error": str(e)}
+
+    rows = []
+    for cluster_name, cluster_prompts in clusters.items():
+        for prompt in cluster_prompts:
+            rows.append({"brand": config["brand"], "cluster": cluster_name, **prompt})
+
+    stats = {
+        "brand": config["brand"],
+        "category": config["category"],
+        "total_prompts": len(prompts),
+        "by_priority": {
+            level: sum(1 for p in prompts if p.get("priority") == level)
+            for level in ("high", "medium", "low")
+        },
+        "by_type": {},
+        "clusters": len(clusters),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    for prompt in prompts:
+        stats["by_type"][prompt["type"]] = stats["by_type"].get(prompt["type"], 0) + 1
+    return config, rows, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch AI prompt research")
+    parser.add_argument("input_file", help="CSV (brand,category,competitors,audience) or JSONL of brand configs")
+    parser.add_argument("--output-dir", default="./prompt-research", help="Output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--chunksize", type=int, default=16, help="Brands sent to a worker per task")
+    parser.add_argument("--cluster-mode", choices=["keyword", "similarity"], default="keyword",
+                        help="Clustering method applied per brand")
+    parser.add_argument("--similarity-threshold", type=float, default=0.3,
+                        help="Minimum cosine similarity to merge prompts in similarity mode")
+
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    configs = load_brand_configs(args.input_file)
+    print(f"Researching prompts for {len(configs)} brands...", file=sys.stderr)
+
+    # Templates are compiled once here and shipped to each worker at startup
+    templates = compile_templates()
+    options = {
+        "cluster_mode": args.cluster_mode,
+        "similarity_threshold": args.similarity_threshold,
+    }
+
+    started = time.perf_counter()
+    prompts_path = output_dir / "prompts.jsonl"
+    brand_stats = []
+    total_prompts = 0
+
+    # Rows are streamed to disk in input order, one contiguous block per brand
+    with open(prompts_path, "w") as out, ProcessPoolExecutor(
+        max_workers=args.workers, initializer=_init_worker, initargs=(templates, options)
+    ) as executor:
+        results = executor.map(research_brand, configs, chunksize=max(1, args.chunksize))
+        for i, (config, rows, stats) in enumerate(results, 1):
+            stats["offset"] = total_prompts
+            for row in rows:
+                out.write(json.dumps(row) + "\n")
+            total_prompts += len(rows)
+            brand_stats.append(stats)
+            if "error" in stats:
+                print(f"  [{i}/{len(configs)}] {config['brand']}: ERROR {stats['error']}", file=sys.stderr)
+            elif i % 100 == 0 or i == len(configs):
+                print(f"  [{i}/{len(configs)}] brands done", file=sys.stderr)
+
+    summary = {
+        "total_brands": len(configs),
+        "successful": len([s for s in brand_stats if "error" not in s]),
+        "total_prompts": total_prompts,
+        "cluster_mode": args.cluster_mode,
+        "elapsed_seconds": round(time.perf_counter() - started, 2),
+        "prompts_file": prompts_path.name,
+        "brands": brand_stats,
+    }
+
+    summary_path = output_dir / "summary.json"
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"\n{'='*50}", file=sys.stderr)
+    print(f"Batch research complete: {total_prompts} prompts for {summary['successful']} brands "
+          f"in {summary['elapsed_seconds']}s", file=sys.stderr)
+    print(f"Prompts saved to: {prompts_path}", file=sys.stderr)
+    print(f"Summary saved to: {summary_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,238 @@ Research AI search prompts for GEO strategy.
 
 import argparse
 import json
+import math
+import re
+import string
 import sys
+import zlib
+from collections import Counter, defaultdict
 from datetime import datetime
 
 
+# Words that carry no topical signal for similarity clustering
+STOP_WORDS = {
+    "a", "an", "the", "to", "for", "of", "in", "on", "with", "and", "or",
+    "is", "are", "i", "my", "me", "we", "our", "should", "what", "which",
+    "do", "does", "can", "from", "by", "at", "it", "your",
+}
+
+# Prompt templates per generator, compiled once by compile_templates()
+PROMPT_TEMPLATES = {
+    "discovery": [
+        "best {category}",
+        "best {category} for {audience}",
+        "top {category} tools",
+        "top {category} for {audience}",
+        "{category} recommendations",
+        "{category} recommendations for {audience}",
+        "what {category} should I use",
+        "what is the best {category}",
+    ],
+    "how-to": [
+        "how to use {brand}",
+        "how to get started with {category}",
+        "how to choose {category}",
+        "how to switch from {competitor} to {brand}",
+        "how to implement {category}",
+    ],
+    "recommendation": [
+        "recommend a {category}",
+        "recommend {category} for {audience}",
+        "suggest a {category}",
+        "what {category} should I choose",
+        "looking for {category}",
+    ],
+}
+
+# Mersenne prime used for the universal hash family behind MinHash
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+def tokenize(text):
+    """Lowercase word tokens with stop words removed."""
+    return [t for t in re.findall(r"[a-z0-9][a-z0-9.+#-]*", text.lower()) if t not in STOP_WORDS]
+
+
+def prompt_features(text):
+    """Unigram + bigram features used for both TF-IDF and MinHash."""
+    tokens = tokenize(text)
+    features = list(tokens)
+    features.extend(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return features
+
+
+def cosine(vec_a, vec_b):
+    """Cosine similarity of two L2-normalised sparse vectors."""
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    return sum(weight * vec_b.get(term, 0.0) for term, weight in vec_a.items())
+
+
+class CompiledTemplate:
+    """A prompt template pre-parsed into literal and field segments."""
+
+    def __init__(self, template):
+        self.template = template
+        self._parts = [
+            (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+        ]
+        self.fields = {field for _, field in self._parts if field}
+
+    def render(self, **values):
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field:
+                out.append(values[field])
+        return "".join(out)
+
+
+def compile_templates(templates=None):
+    """Compile a template set once so many researchers can share it."""
+    templates = templates or PROMPT_TEMPLATES
+    return {
+        name: [CompiledTemplate(t) for t in template_list]
+        for name, template_list in templates.items()
+    }
+
+
+class SimilarityClusterer:
+    """Cluster prompts by TF-IDF similarity using MinHash/LSH candidates.
+
+    Each prompt becomes a sparse TF-IDF vector over unigram/bigram features.
+    A MinHash signature over the same feature set is split into LSH bands;
+    prompts sharing a band bucket become candidate pairs, which are
+    confirmed with an exact cosine check and merged with union-find. Only
+    candidates are compared, so runtime stays near-linear in prompt count.
+    """
+
+    def __init__(self, threshold=0.3, num_perm=64, bands=32, max_anchors=4):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_anchors = max_anchors
+        # Fixed coefficients keep cluster assignments reproducible across runs
+        self._coeffs = [
+            (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+            for i in range(num_perm)
+        ]
+        self._feature_hashes = {}
+
+    def _vectorize(self, feature_lists):
+        """Build L2-normalised TF-IDF vectors for every prompt."""
+        doc_freq = Counter()
+        for features in feature_lists:
+            doc_freq.update(set(features))
+        total = len(feature_lists)
+        vectors = []
+        for features in feature_lists:
+            counts = Counter(features)
+            vec = {
+                term: count * (math.log((1 + total) / (1 + doc_freq[term])) + 1)
+                for term, count in counts.items()
+            }
+            norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+            vectors.append({term: w / norm for term, w in vec.items()})
+        return vectors
+
+    def _signature(self, features):
+        """MinHash signature of a feature set."""
+        if not features:
+            return None
+        # Features repeat heavily across prompts, so each one's permuted
+        # hashes are computed once and the signature is a column-wise min
+        rows = []
+        for feature in set(features):
+            row = self._feature_hashes.get(feature)
+            if row is None:
+                h = zlib.crc32(feature.encode())
+                row = tuple((a * h + b) % _MINHASH_PRIME for a, b in self._coeffs)
+                self._feature_hashes[feature] = row
+            rows.append(row)
+        return tuple(map(min, *rows)) if len(rows) > 1 else rows[0]
+
+    def cluster(self, texts):
+        """Return a list of clusters, each a list of indexes into ``texts``."""
+        feature_lists = [prompt_features(t) for t in texts]
+        self.vectors = self._vectorize(feature_lists)
+
+        parent = list(range(len(texts)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        buckets = defaultdict(list)
+        for idx, features in enumerate(feature_lists):
+            sig = self._signature(features)
+            if sig is None:
+                continue
+            for band in range(self.bands):
+                start = band * self.rows
+                buckets[(band, sig[start:start + self.rows])].append(idx)
+
+        checked = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Compare each member against a bounded set of anchors rather than
+            # every pair, so a popular bucket cannot go quadratic
+            anchors = members[:self.max_anchors]
+            for pos, idx in enumerate(members[1:], 1):
+                for anchor in anchors[:pos]:
+                    pair = (anchor, idx)
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    if find(anchor) == find(idx):
+                        break
+                    if cosine(self.vectors[anchor], self.vectors[idx]) >= self.threshold:
+                        union(anchor, idx)
+                        break
+
+        groups = defaultdict(list)
+        for idx in range(len(texts)):
+            groups[find(idx)].append(idx)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def centroid(self, members):
+        """Mean TF-IDF vector of a cluster."""
+        centroid = defaultdict(float)
+        for idx in members:
+            for term, weight in self.vectors[idx].items():
+                centroid[term] += weight / len(members)
+        return dict(centroid)
+
+    def representative(self, members, centroid):
+        """Member closest to the cluster centroid."""
+        return max(members, key=lambda idx: cosine(self.vectors[idx], centroid))
+
+
 class PromptResearcher:
     """Generate and research AI search prompts."""
     
-    def __init__(self, brand, category, competitors=None, audience=None):
+    def __init__(self, brand, category, competitors=None, audience=None,
+                 cluster_mode="keyword", similarity_threshold=0.3, templates=None):
         self.brand = brand
         self.category = category
         self.competitors = competitors or []
         self.audience = audience or ""
+        self.cluster_mode = cluster_mode
+        self.similarity_threshold = similarity_threshold
+        self.templates = templates or compile_templates()
         self.prompts = []
+        self.cluster_summaries = {}
     
     def generate_all_prompts(self):
         """Generate prompts across all types and stages."""
@@ -31,19 +250,8 @@ class PromptResearcher:
     
     def _generate_discovery_prompts(self):
         """Generate discovery-type prompts."""
-        templates = [
-            "best {category}",
-            "best {category} for {audience}",
-            "top {category} tools",
-            "top {category} for {audience}",
-            "{category} recommendations",
-            "{category} recommendations for {audience}",
-            "what {category} should I use",
-            "what is the best {category}",
-        ]
-        
-        for template in templates:
-            prompt = template.format(
+        for template in self.templates["discovery"]:
+            prompt = template.render(
                 category=self.category,
                 audience=self.audience or "teams"
             )
@@ -105,26 +313,19 @@ class PromptResearcher:
     
     def _generate_howto_prompts(self):
         """Generate how-to prompts."""
-        templates = [
-            "how to use {brand}",
-            "how to get started with {category}",
-            "how to choose {category}",
-            "how to switch from {competitor} to {brand}",
-            "how to implement {category}",
-        ]
-        
-        for template in templates:
-            if "{competitor}" in template and self.competitors:
+        for template in self.templates["how-to"]:
+            if "competitor" in template.fields:
+                # Competitor-specific templates are skipped when none are given
                 for comp in self.competitors[:2]:
                     self.prompts.append({
-                        "prompt": template.format(brand=self.brand, category=self.category, competitor=comp),
+                        "prompt": template.render(brand=self.brand, category=self.category, competitor=comp),
                         "type": "how-to",
                         "intent": "informational",
                         "priority": "medium"
                     })
             else:
                 self.prompts.append({
-                    "prompt": template.format(brand=self.brand, category=self.category),
+                    "prompt": template.render(brand=self.brand, category=self.category),
                     "type": "how-to",
                     "intent": "informational",
                     "priority": "medium"
@@ -150,17 +351,9 @@ class PromptResearcher:
     
     def _generate_recommendation_prompts(self):
         """Generate recommendation prompts."""
-        templates = [
-            "recommend a {category}",
-            "recommend {category} for {audience}",
-            "suggest a {category}",
-            "what {category} should I choose",
-            "looking for {category}",
-        ]
-        
-        for template in templates:
+        for template in self.templates["recommendation"]:
             self.prompts.append({
-                "prompt": template.format(category=self.category, audience=self.audience or "my team"),
+                "prompt": template.render(category=self.category, audience=self.audience or "my team"),
                 "type": "recommendation",
                 "intent": "commercial",
                 "priority": "high"
@@ -186,21 +379,26 @@ class PromptResearcher:
     
     def cluster_prompts(self):
         """Group prompts by theme."""
+        if self.cluster_mode == "similarity":
+            return self._cluster_by_similarity()
+        
         clusters = {}
         
         for prompt in self.prompts:
             text = prompt["prompt"].lower()
+            words = set(re.findall(r"[a-z0-9]+", text))
             
-            # Simple keyword-based clustering
-            if any(word in text for word in ["vs", "compare", "alternative", "or"]):
+            # Simple keyword-based clustering (whole words, so "or" does not
+            # match inside "for" or "recommendations")
+            if words & {"vs", "compare", "alternative", "or"}:
                 cluster = "comparisons"
-            elif any(word in text for word in ["how to", "guide", "steps"]):
+            elif "how to" in text or words & {"guide", "steps"}:
                 cluster = "how-to"
-            elif any(word in text for word in ["best", "top", "recommend"]):
+            elif words & {"best", "top", "recommend", "recommendation", "recommendations"}:
                 cluster = "discovery"
             elif "what is" in text:
                 cluster = "definitions"
-            elif "price" in text or "cost" in text or "free" in text:
+            elif words & {"price", "pricing", "cost", "free"}:
                 cluster = "pricing"
             else:
                 cluster = "other"
@@ -211,6 +409,27 @@ class PromptResearcher:
         
         return clusters
     
+    def _cluster_by_similarity(self):
+        """Group paraphrased prompts with TF-IDF + MinHash/LSH clustering."""
+        clusterer = SimilarityClusterer(threshold=self.similarity_threshold)
+        groups = clusterer.cluster([p["prompt"] for p in self.prompts])
+        
+        clusters = {}
+        self.cluster_summaries = {}
+        for members in groups:
+            centroid = clusterer.centroid(members)
+            top_terms = [term for term, _ in sorted(centroid.items(), key=lambda kv: -kv[1])[:3]]
+            name = " / ".join(top_terms) or "other"
+            if name in clusters:
+                name = f"{name} ({len(clusters)})"
+            clusters[name] = [self.prompts[idx] for idx in members]
+            self.cluster_summaries[name] = {
+                "size": len(members),
+                "centroid_terms": top_terms,
+                "representative": self.prompts[clusterer.representative(members, centroid)]["prompt"],
+            }
+        return clusters
+    
     def generate_report(self):
         """Generate markdown report."""
         lines = [
@@ -246,6 +465,10 @@ class PromptResearcher:
         clusters = self.cluster_prompts()
         for cluster_name, cluster_prompts in clusters.items():
             lines.append(f"### {cluster_name.title()} ({len(cluster_prompts)} prompts)")
+            summary = self.cluster_summaries.get(cluster_name)
+            if summary:
+                lines.append(f"**Representative**: \"{summary['representative']}\"  ")
+                lines.append(f"**Centroid terms**: {', '.join(summary['centroid_terms'])}\n")
             for p in cluster_prompts[:5]:
                 lines.append(f"- \"{p['prompt']}\"")
             if len(cluster_prompts) > 5:
@@ -269,6 +492,10 @@ def main():
     parser.add_argument("--audience", help="Target audience description")
     parser.add_argument("--output", "-o", help="Output file (default: stdout)")
     parser.add_argument("--format", choices=["md", "json"], default="md", help="Output format")
+    parser.add_argument("--cluster-mode", choices=["keyword", "similarity"], default="keyword",
+                        help="Clustering method for the report (similarity = TF-IDF + MinHash/LSH)")
+    parser.add_argument("--similarity-threshold", type=float, default=0.3,
+                        help="Minimum cosine similarity to merge prompts in similarity mode")
     
     args = parser.parse_args()
     
@@ -278,7 +505,9 @@ def main():
         brand=args.brand,
         category=args.category,
         competitors=competitors,
-        audience=args.audience
+        audience=args.audience,
+        cluster_mode=args.cluster_mode,
+        similarity_threshold=args.similarity_threshold
     )
     
     researcher.generate_all_prompts()
@@ -6,11 +6,11 @@ Reads grading.json files from run directories and produces:
 - run_summary with mean, stddev, min, max for each metric
 - delta between with_skill and without_skill configurations
 
-Usage:
-    python aggregate_benchmark.py <benchmark_dir>
+Usage (from the skill-creator directory, like the other scripts):
+    python -m scripts.aggregate_benchmark <benchmark_dir>
 
 Example:
-    python aggregate_benchmark.py benchmarks/2026-01-15T10-30-00/
+    python -m scripts.aggregate_benchmark benchmarks/2026-01-15T10-30-00/
 
 The script supports two directory layouts:
 
@@ -32,15 +32,46 @@ The script supports two directory layouts:
             │   └── run-1/grading.json
             └── without_skill/
                 └── run-1/grading.json
+
+Parsed runs are cached in <benchmark_dir>/.aggregate-index.jsonl, keyed by
+run path and file mtime/size, so re-running after adding runs only parses
+the new ones. Pass --no-index to re-parse everything.
+
+With --skill-name (or --skill-path), the run metrics are also appended to
+the skill's history in benchmark_store.py for trends across iterations.
+Pass --no-store to skip that.
 """
 
 import argparse
 import json
 import math
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from scripts.benchmark_store import DEFAULT_STORE_DIR, BenchmarkStore
+
+try:
+    import numpy as np
+except ImportError:
+    # Plain mean/stddev/min/max without intervals or comparisons
+    np = None
+
+METRICS = ("pass_rate", "time_seconds", "tokens")
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+# Below this many runs per config, or with an eval run only once, bootstrap
+# intervals come out far too narrow, so none are reported
+MIN_BOOTSTRAP_RUNS = 5
+
+# Sidecar cache of parsed runs, written next to benchmark.json
+INDEX_FILENAME = ".aggregate-index.jsonl"
+INDEX_VERSION = 2
+# Runs parsed per thread-pool task
+PARSE_CHUNK = 256
+
 
 def calculate_stats(values: list[float]) -> dict:
     """Calculate mean, stddev, min, max for a list of values."""
@@ -64,144 +95,438 @@ def calculate_stats(values: list[float]) -> dict:
     }
 
 
-def load_run_results(benchmark_dir: Path) -> dict:
+def _sorted_dirs(path: str, prefix: str = "") -> list[os.DirEntry]:
+    with os.scandir(path) as it:
+        return sorted(
+            (entry for entry in it if entry.name.startswith(prefix) and entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
+
+
+def _file_signature(path: str) -> list[int] | None:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def scan_benchmark(search_dir: Path) -> list[dict]:
+    """Walk eval-*/<config>/run-* once with os.scandir.
+
+    Returns one dict per eval directory with its metadata signature and, per
+    config directory that holds runs, the run directories with the
+    signatures of their grading.json and timing.json.
+    """
+    evals = []
+    for eval_entry in _sorted_dirs(str(search_dir), "eval-"):
+        metadata_path = os.path.join(eval_entry.path, "eval_metadata.json")
+        configs = []
+        # Discover config directories dynamically rather than hardcoding names
+        for config_entry in _sorted_dirs(eval_entry.path):
+            # Skip non-config directories (inputs, outputs, etc.)
+            runs = [
+                {
+                    "key": f"{eval_entry.name}/{config_entry.name}/{run_entry.name}",
+                    "path": run_entry.path,
+                    "run_number": int(run_entry.name.split("-")[1]),
+                    "grading": _file_signature(f"{run_entry.path}/grading.json"),
+                    "timing": _file_signature(f"{run_entry.path}/timing.json"),
+                }
+                for run_entry in _sorted_dirs(config_entry.path, "run-")
+            ]
+            if runs:
+                configs.append({"name": config_entry.name, "runs": runs})
+        evals.append({
+            "path": eval_entry.path,
+            "name": eval_entry.name,
+            "metadata": _file_signature(metadata_path),
+            "metadata_path": metadata_path,
+            "configs": configs,
+        })
+    return evals
+
+
+def parse_run(run_dir: Path) -> tuple[dict | None, list[str]]:
+    """Extract the metrics of one run directory; returns (result, warnings).
+
+    The result lacks eval_id, which comes from the eval directory. It is None
+    if grading.json can't be read.
+    """
+    warnings = []
+    grading_file = run_dir / "grading.json"
+    try:
+        with open(grading_file) as f:
+            grading = json.load(f)
+    except json.JSONDecodeError as e:
+        return None, [f"Warning: Invalid JSON in {grading_file}: {e}"]
+
+    # Extract metrics
+    result = {
+        "run_number": int(run_dir.name.split("-")[1]),
+        "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
+        "passed": grading.get("summary", {}).get("passed", 0),
+        "failed": grading.get("summary", {}).get("failed", 0),
+        "total": grading.get("summary", {}).get("total", 0),
+    }
+
+    # Extract timing — check grading.json first, then sibling timing.json
+    timing = grading.get("timing", {})
+    result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
+    timing_file = run_dir / "timing.json"
+    if result["time_seconds"] == 0.0 and timing_file.exists():
+        try:
+            with open(timing_file) as tf:
+                timing_data = json.load(tf)
+            result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
+            result["tokens"] = timing_data.get("total_tokens", 0)
+        except json.JSONDecodeError:
+            pass
+
+    # Extract metrics if available
+    metrics = grading.get("execution_metrics", {})
+    result["tool_calls"] = metrics.get("total_tool_calls", 0)
+    if not result.get("tokens"):
+        result["tokens"] = metrics.get("output_chars", 0)
+    result["errors"] = metrics.get("errors_encountered", 0)
+
+    # Extract expectations — viewer requires fields: text, passed, evidence
+    raw_expectations = grading.get("expectations", [])
+    for exp in raw_expectations:
+        if "text" not in exp or "passed" not in exp:
+            warnings.append(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
+    result["expectations"] = raw_expectations
+
+    # Extract notes from user_notes_summary
+    notes_summary = grading.get("user_notes_summary", {})
+    notes = []
+    notes.extend(notes_summary.get("uncertainties", []))
+    notes.extend(notes_summary.get("needs_review", []))
+    notes.extend(notes_summary.get("workarounds", []))
+    result["notes"] = notes
+
+    return result, warnings
+
+
+def _read_eval_metadata(metadata_path: str) -> tuple[list, str | None]:
+    """([found, eval_id], eval_name) from eval_metadata.json.
+
+    found is False if it has no eval_id or can't be read.
+    """
+    try:
+        with open(metadata_path) as mf:
+            metadata = json.load(mf)
+    except (json.JSONDecodeError, OSError):
+        return [False, None], None
+    return ["eval_id" in metadata, metadata.get("eval_id")], metadata.get("eval_name")
+
+
+def load_index(index_path: Path) -> tuple[dict, dict, int]:
+    """Read the index log; later lines override earlier ones.
+
+    Returns (eval entries, run entries, line count).
+    """
+    evals, runs = {}, {}
+    lines = 0
+    try:
+        with open(index_path) as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != INDEX_VERSION:
+                return {}, {}, 0
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+                if "run" in entry:
+                    runs[entry["run"]] = entry
+                else:
+                    evals[entry["eval"]] = entry
+    except (OSError, json.JSONDecodeError):
+        return {}, {}, 0
+    return evals, runs, lines
+
+
+def write_index(index_path: Path, entries: list[dict], rewrite: bool) -> None:
+    """Append entries to the index log, or rewrite it with just these entries."""
+    try:
+        if rewrite:
+            tmp = index_path.with_name(index_path.name + ".tmp")
+            with open(tmp, "w") as f:
+                f.write(json.dumps({"version": INDEX_VERSION}) + "\n")
+                f.writelines(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+            os.replace(tmp, index_path)
+        else:
+            with open(index_path, "a") as f:
+                f.writelines(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+    except OSError as e:
+        # A read-only benchmark dir still aggregates, just without the index
+        print(f"Warning: could not write {index_path}: {e}")
+
+
+def load_run_results(benchmark_dir: Path, use_index: bool = True, workers: int | None = None) -> dict:
     """
     Load all run results from a benchmark directory.
 
     Returns dict keyed by config name (e.g. "with_skill"/"without_skill",
     or "new_skill"/"old_skill"), each containing a list of run results.
+
+    Parsed runs are kept in an append-only sidecar index (INDEX_FILENAME)
+    keyed by run path and the mtime/size of its grading.json and
+    timing.json, so only new or changed runs are parsed again, in a thread
+    pool of ``workers``, and only their entries are appended.
     """
     # Support both layouts: eval dirs directly under benchmark_dir, or under runs/
     runs_dir = benchmark_dir / "runs"
     if runs_dir.exists():
         search_dir = runs_dir
-    elif list(benchmark_dir.glob("eval-*")):
+    elif any(entry.name.startswith("eval-") for entry in os.scandir(benchmark_dir)):
         search_dir = benchmark_dir
     else:
         print(f"No eval directories found in {benchmark_dir} or {benchmark_dir / 'runs'}")
         return {}
 
+    evals = scan_benchmark(search_dir)
+    index_path = benchmark_dir / INDEX_FILENAME
+    cached_evals, cached_runs, index_lines = load_index(index_path) if use_index else ({}, {}, 0)
+    fresh_evals, fresh_runs = {}, {}
+    changed = []
+
+    # Parse whatever is new or changed since the index was written
+    stale = []
+    for eval_info in evals:
+        for config in eval_info["configs"]:
+            for run in config["runs"]:
+                if run["grading"] is None:
+                    continue
+                signature = [run["grading"], run["timing"]]
+                entry = cached_runs.get(run["key"])
+                if entry and entry["signature"] == signature:
+                    fresh_runs[run["key"]] = entry
+                else:
+                    stale.append((run, signature))
+    if stale:
+        def parse_chunk(chunk: list) -> list:
+            return [parse_run(Path(run["path"])) for run, _ in chunk]
+
+        # Chunks keep per-task overhead low; threads overlap the file reads
+        chunks = [stale[i:i + PARSE_CHUNK] for i in range(0, len(stale), PARSE_CHUNK)]
+        with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for chunk, parsed in zip(chunks, executor.map(parse_chunk, chunks)):
+                for (run, signature), (result, warnings) in zip(chunk, parsed):
+                    fresh_runs[run["key"]] = {"run": run["key"], "signature": signature, "result": result, "warnings": warnings}
+                    changed.append(fresh_runs[run["key"]])
+
     results: dict[str, list] = {}
 
-    for eval_idx, eval_dir in enumerate(sorted(search_dir.glob("eval-*"))):
-        metadata_path = eval_dir / "eval_metadata.json"
-        if metadata_path.exists():
-            try:
-                with open(metadata_path) as mf:
-                    eval_id = json.load(mf).get("eval_id", eval_idx)
-            except (json.JSONDecodeError, OSError):
+    for eval_idx, eval_info in enumerate(evals):
+        if eval_info["metadata"] is not None:
+            entry = cached_evals.get(eval_info["name"])
+            if not entry or entry["signature"] != eval_info["metadata"]:
+                eval_id, eval_name = _read_eval_metadata(eval_info["metadata_path"])
+                entry = {"eval": eval_info["name"], "signature": eval_info["metadata"],
+                         "eval_id": eval_id, "eval_name": eval_name}
+                changed.append(entry)
+            fresh_evals[eval_info["name"]] = entry
+            found, eval_id = entry["eval_id"]
+            eval_name = entry["eval_name"]
+            if not found:
                 eval_id = eval_idx
         else:
+            eval_name = None
             try:
-                eval_id = int(eval_dir.name.split("-")[1])
+                eval_id = int(eval_info["name"].split("-")[1])
             except ValueError:
                 eval_id = eval_idx
 
-        # Discover config directories dynamically rather than hardcoding names
-        for config_dir in sorted(eval_dir.iterdir()):
-            if not config_dir.is_dir():
-                continue
-            # Skip non-config directories (inputs, outputs, etc.)
-            if not list(config_dir.glob("run-*")):
-                continue
-            config = config_dir.name
-            if config not in results:
-                results[config] = []
-
-            for run_dir in sorted(config_dir.glob("run-*")):
-                run_number = int(run_dir.name.split("-")[1])
-                grading_file = run_dir / "grading.json"
-
-                if not grading_file.exists():
-                    print(f"Warning: grading.json not found in {run_dir}")
-                    continue
+        for config in eval_info["configs"]:
+            if config["name"] not in results:
+                results[config["name"]] = []
 
-                try:
-                    with open(grading_file) as f:
-                        grading = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Invalid JSON in {grading_file}: {e}")
+            for run in config["runs"]:
+                if run["grading"] is None:
+                    print(f"Warning: grading.json not found in {run['path']}")
                     continue
+                entry = fresh_runs[run["key"]]
+                for warning in entry["warnings"]:
+                    print(warning)
+                if entry["result"] is None:
+                    continue
+                results[config["name"]].append({"eval_id": eval_id, "eval_name": eval_name, **entry["result"]})
 
-                # Extract metrics
-                result = {
-                    "eval_id": eval_id,
-                    "run_number": run_number,
-                    "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
-                    "passed": grading.get("summary", {}).get("passed", 0),
-                    "failed": grading.get("summary", {}).get("failed", 0),
-                    "total": grading.get("summary", {}).get("total", 0),
-                }
-
-                # Extract timing — check grading.json first, then sibling timing.json
-                timing = grading.get("timing", {})
-                result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
-                timing_file = run_dir / "timing.json"
-                if result["time_seconds"] == 0.0 and timing_file.exists():
-                    try:
-                        with open(timing_file) as tf:
-                            timing_data = json.load(tf)
-                        result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
-                        result["tokens"] = timing_data.get("total_tokens", 0)
-                    except json.JSONDecodeError:
-                        pass
-
-                # Extract metrics if available
-                metrics = grading.get("execution_metrics", {})
-                result["tool_calls"] = metrics.get("total_tool_calls", 0)
-                if not result.get("tokens"):
-                    result["tokens"] = metrics.get("output_chars", 0)
-                result["errors"] = metrics.get("errors_encountered", 0)
-
-                # Extract expectations — viewer requires fields: text, passed, evidence
-                raw_expectations = grading.get("expectations", [])
-                for exp in raw_expectations:
-                    if "text" not in exp or "passed" not in exp:
-                        print(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
-                result["expectations"] = raw_expectations
-
-                # Extract notes from user_notes_summary
-                notes_summary = grading.get("user_notes_summary", {})
-                notes = []
-                notes.extend(notes_summary.get("uncertainties", []))
-                notes.extend(notes_summary.get("needs_review", []))
-                notes.extend(notes_summary.get("workarounds", []))
-                result["notes"] = notes
-
-                results[config].append(result)
+    if use_index:
+        live = len(fresh_evals) + len(fresh_runs)
+        if not index_lines or index_lines > 2 * live:
+            # Compact: keep only entries still on disk, so deleted and superseded ones drop out
+            write_index(index_path, [*fresh_evals.values(), *fresh_runs.values()], rewrite=True)
+        elif changed:
+            write_index(index_path, changed, rewrite=False)
 
     return results
 
 
-def aggregate_results(results: dict) -> dict:
-    """
-    Aggregate run results into summary statistics.
+def _summary_stats(mean, stddev, low, high, pcts, ci) -> dict:
+    stats = {
+        "mean": round(float(mean), 4),
+        "stddev": round(float(stddev), 4),
+        "min": round(float(low), 4),
+        "max": round(float(high), 4),
+        "p5": round(float(pcts[0]), 4),
+        "p50": round(float(pcts[1]), 4),
+        "p95": round(float(pcts[2]), 4),
+    }
+    if ci is not None:
+        stats["ci"] = [round(float(ci[0]), 4), round(float(ci[1]), 4)]
+    return stats
 
-    Returns run_summary with stats for each configuration and delta.
+
+def _runs_by_eval(runs: list[dict]) -> list[list[dict]]:
+    """Runs grouped by eval_id, in order of first appearance."""
+    groups: dict = {}
+    for run in runs:
+        groups.setdefault(run["eval_id"], []).append(run)
+    return list(groups.values())
+
+
+def compute_statistics(
+    results: dict,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = CONFIDENCE,
+    seed: int = 0,
+) -> tuple[dict, list[dict]]:
+    """
+    Per-config statistics and pairwise comparisons for every metric.
+
+    All runs are stacked into one (metric x run) array. Means, spreads and
+    bootstrap resamples for every config come out of grouped reductions
+    over that array. Resampling is stratified by eval: each eval's runs are
+    redrawn from that eval only, so differences between evals don't count
+    as noise. The bootstrap means then give a confidence interval per config
+    and, for every pair of configs at once, the difference in means with its
+    interval and a two-sided bootstrap p-value.
+
+    Configs with fewer than MIN_BOOTSTRAP_RUNS runs, or with an eval run
+    only once, get no interval; their comparisons keep the delta but have
+    no ci, p_value or significant, and are marked ``"too_few_runs": True``.
+
+    Returns (per-config stats keyed by config, comparisons for each pair
+    in config order). Without NumPy, falls back to calculate_stats with no
+    intervals or comparisons.
     """
-    run_summary = {}
     configs = list(results.keys())
+    empty = {
+        "pass_rate": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
+        "time_seconds": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
+        "tokens": {"mean": 0, "stddev": 0, "min": 0, "max": 0}
+    }
+    summary = {config: empty for config in configs if not results[config]}
+    present = [config for config in configs if results[config]]
+
+    if np is None:
+        for config in present:
+            summary[config] = {
+                metric: calculate_stats([r.get(metric, 0) for r in results[config]])
+                for metric in METRICS
+            }
+        return {config: summary[config] for config in configs}, []
+
+    if not present:
+        return summary, []
+
+    # Each eval's runs are contiguous within their config
+    strata = {config: _runs_by_eval(results[config]) for config in present}
+    counts = np.array([len(results[config]) for config in present])
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    stratum_sizes = np.array([len(runs) for config in present for runs in strata[config]])
+    stratum_offsets = np.concatenate([[0], np.cumsum(stratum_sizes)[:-1]])
+    values = np.array([
+        [r.get(metric, 0) for config in present for runs in strata[config] for r in runs]
+        for metric in METRICS
+    ], dtype=float)
+    enough = [
+        len(results[config]) >= MIN_BOOTSTRAP_RUNS and min(len(runs) for runs in strata[config]) > 1
+        for config in present
+    ]
 
-    for config in configs:
-        runs = results.get(config, [])
+    means = np.add.reduceat(values, offsets, axis=1) / counts
+    centered = values - np.repeat(means, counts, axis=1)
+    sq = np.add.reduceat(centered ** 2, offsets, axis=1)
+    stddevs = np.sqrt(np.divide(sq, counts - 1, out=np.zeros_like(sq), where=counts > 1))
+    lows = np.minimum.reduceat(values, offsets, axis=1)
+    highs = np.maximum.reduceat(values, offsets, axis=1)
+    pcts = np.stack([
+        np.percentile(values[:, start:start + n], [5, 50, 95], axis=1)
+        for start, n in zip(offsets, counts)
+    ], axis=-1)  # (3, metric, config)
+
+    boot = None
+    if resamples > 0:
+        # Each position draws from the runs of its own config and eval
+        group_start = np.repeat(stratum_offsets, stratum_sizes)
+        group_size = np.repeat(stratum_sizes, stratum_sizes)
+        rng = np.random.default_rng(seed)
+        # Bound the (metric x resample x run) gather to ~32MB per chunk
+        chunk = max(1, min(resamples, 4_000_000 // values.size))
+        parts = []
+        for done in range(0, resamples, chunk):
+            b = min(chunk, resamples - done)
+            idx = group_start + (rng.random((b, values.shape[1])) * group_size).astype(np.intp)
+            parts.append(np.add.reduceat(values[:, idx], offsets, axis=2) / counts)
+        boot = np.concatenate(parts, axis=1)  # (metric, resample, config)
+
+    alpha = (1 - confidence) / 2
+    cis = np.percentile(boot, [100 * alpha, 100 * (1 - alpha)], axis=1) if boot is not None else None
+
+    for g, config in enumerate(present):
+        summary[config] = {
+            metric: _summary_stats(
+                means[m, g], stddevs[m, g], lows[m, g], highs[m, g], pcts[:, m, g],
+                cis[:, m, g] if cis is not None and enough[g] else None,
+            )
+            for m, metric in enumerate(METRICS)
+        }
 
-        if not runs:
-            run_summary[config] = {
-                "pass_rate": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
-                "time_seconds": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
-                "tokens": {"mean": 0, "stddev": 0, "min": 0, "max": 0}
-            }
-            continue
+    comparisons = []
+    if boot is not None and len(present) > 1:
+        diffs = boot[:, :, :, None] - boot[:, :, None, :]  # (metric, resample, a, b)
+        diff_cis = np.percentile(diffs, [100 * alpha, 100 * (1 - alpha)], axis=1)
+        p_values = np.minimum(1.0, 2 * np.minimum((diffs <= 0).mean(axis=1), (diffs >= 0).mean(axis=1)))
+        observed = means[:, :, None] - means[:, None, :]
+        for a in range(len(present)):
+            for b in range(a + 1, len(present)):
+                comparison = {"a": present[a], "b": present[b]}
+                for m, metric in enumerate(METRICS):
+                    comparison[metric] = {"delta": round(float(observed[m, a, b]), 4)}
+                    if not (enough[a] and enough[b]):
+                        continue
+                    low, high = diff_cis[0, m, a, b], diff_cis[1, m, a, b]
+                    comparison[metric].update({
+                        "ci": [round(float(low), 4), round(float(high), 4)],
+                        "p_value": round(float(p_values[m, a, b]), 4),
+                        "significant": bool(low > 0 or high < 0),
+                    })
+                if not (enough[a] and enough[b]):
+                    comparison["too_few_runs"] = True
+                comparisons.append(comparison)
+
+    return {config: summary[config] for config in configs}, comparisons
+
+
+def aggregate_results(results: dict, **kwargs) -> dict:
+    """
+    Aggregate run results into summary statistics.
 
-        pass_rates = [r["pass_rate"] for r in runs]
-        times = [r["time_seconds"] for r in runs]
-        tokens = [r.get("tokens", 0) for r in runs]
+    Returns run_summary with stats for each configuration and delta.
+    """
+    run_summary, _ = compute_statistics(results, **kwargs)
+    return _with_delta(run_summary)
 
-        run_summary[config] = {
-            "pass_rate": calculate_stats(pass_rates),
-            "time_seconds": calculate_stats(times),
-            "tokens": calculate_stats(tokens)
-        }
+
+def _with_delta(run_summary: dict) -> dict:
+    configs = list(run_summary.keys())
 
     # Calculate delta between the first two configs (if two exist)
     if len(configs) >= 2:
@@ -224,12 +549,21 @@ def aggregate_results(results: dict) -> dict:
     return run_summary
 
 
-def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "") -> dict:
+def generate_benchmark(
+    benchmark_dir: Path,
+    skill_name: str = "",
+    skill_path: str = "",
+    use_index: bool = True,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = CONFIDENCE,
+    seed: int = 0,
+) -> dict:
     """
     Generate complete benchmark.json from run results.
     """
-    results = load_run_results(benchmark_dir)
-    run_summary = aggregate_results(results)
+    results = load_run_results(benchmark_dir, use_index=use_index)
+    run_summary, comparisons = compute_statistics(results, resamples, confidence, seed)
+    run_summary = _with_delta(run_summary)
 
     # Build runs array for benchmark.json
     runs = []
@@ -237,6 +571,7 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
         for result in results[config]:
             runs.append({
                 "eval_id": result["eval_id"],
+                "eval_name": result["eval_name"],
                 "configuration": config,
                 "run_number": result["run_number"],
                 "result": {
@@ -268,10 +603,14 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
             "analyzer_model": "<model-name>",
             "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "evals_run": eval_ids,
-            "runs_per_configuration": 3
+            "runs_per_configuration": 3,
+            "confidence": confidence,
+            "bootstrap_resamples": resamples if np is not None else 0
         },
         "runs": runs,
         "run_summary": run_summary,
+        # Kept out of run_summary: the viewer treats every key there except delta as a config
+        "comparisons": comparisons,
         "notes": []  # To be filled by analyzer
     }
 
@@ -322,6 +661,33 @@ def generate_markdown(benchmark: dict) -> str:
     b_tokens = b_summary.get("tokens", {})
     lines.append(f"| Tokens | {a_tokens.get('mean', 0):.0f} ± {a_tokens.get('stddev', 0):.0f} | {b_tokens.get('mean', 0):.0f} ± {b_tokens.get('stddev', 0):.0f} | {delta.get('tokens', '—')} |")
 
+    # Pairwise comparisons with bootstrap intervals (needs NumPy)
+    comparisons = benchmark.get("comparisons") or []
+    if comparisons:
+        confidence = metadata.get("confidence", CONFIDENCE)
+        lines.extend([
+            "",
+            f"## Comparisons ({confidence*100:.0f}% bootstrap CI, * = significant)",
+            "",
+            f"Intervals need at least {MIN_BOOTSTRAP_RUNS} runs per configuration and two per eval.",
+            "",
+            "| Comparison | Pass Rate | Time | Tokens |",
+            "|------------|-----------|------|--------|",
+        ])
+
+        def cell(stat: dict, fmt: str, unit: str = "", scale: float = 1.0) -> str:
+            if "ci" not in stat:
+                return f"{stat['delta']*scale:{fmt}}{unit} (too few runs)"
+            low, high = stat["ci"]
+            mark = "*" if stat["significant"] else ""
+            return (f"{stat['delta']*scale:{fmt}}{unit}{mark} "
+                    f"[{low*scale:{fmt}}, {high*scale:{fmt}}] p={stat['p_value']:.3f}")
+
+        for c in comparisons:
+            label = f"{c['a'].replace('_', ' ').title()} vs {c['b'].replace('_', ' ').title()}"
+            lines.append(f"| {label} | {cell(c['pass_rate'], '+.0f', '%', 100)} | "
+                         f"{cell(c['time_seconds'], '+.1f', 's')} | {cell(c['tokens'], '+.0f')} |")
+
     # Notes section
     if benchmark.get("notes"):
         lines.extend([
@@ -359,6 +725,44 @@ def main():
         type=Path,
         help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json)"
     )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"Re-parse every run instead of reusing {INDEX_FILENAME}"
+    )
+    parser.add_argument(
+        "--store-dir",
+        default=str(DEFAULT_STORE_DIR),
+        help="Directory of the per-skill benchmark history (see benchmark_store.py)"
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Don't append this benchmark to the skill's history"
+    )
+    parser.add_argument(
+        "--iteration",
+        default=None,
+        help="Label for this benchmark in the history (default: the directory name)"
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help=f"Bootstrap resamples for confidence intervals and comparisons, 0 to skip (default: {BOOTSTRAP_RESAMPLES})"
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=CONFIDENCE,
+        help=f"Confidence level of the intervals (default: {CONFIDENCE})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for bootstrap resampling (default: 0)"
+    )
 
     args = parser.parse_args()
 
@@ -367,7 +771,12 @@ def main():
         sys.exit(1)
 
     # Generate benchmark
-    benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path)
+    if np is None:
+        print("Note: numpy not installed; skipping confidence intervals and comparisons (pip install numpy)")
+    benchmark = generate_benchmark(
+        args.benchmark_dir, args.skill_name, args.skill_path, use_index=not args.no_index,
+        resamples=args.bootstrap, confidence=args.confidence, seed=args.seed,
+    )
 
     # Determine output paths
     output_json = args.output or (args.benchmark_dir / "benchmark.json")
@@ -384,6 +793,13 @@ def main():
         f.write(markdown)
     print(f"Generated: {output_md}")
 
+    # Append run metrics to the skill's history for cross-iteration trends
+    skill_name = args.skill_name or (Path(args.skill_path).name if args.skill_path else "")
+    if not args.no_store and skill_name:
+        with BenchmarkStore(skill_name, Path(args.store_dir)) as store:
+            if store.append(benchmark, args.benchmark_dir, args.iteration):
+                print(f"Recorded in: {store.path}")
+
     # Print summary
     run_summary = benchmark["run_summary"]
     configs = [k for k in run_summary if k != "delta"]
@@ -395,6 +811,14 @@ def main():
         label = config.replace("_", " ").title()
         print(f"  {label}: {pr*100:.1f}% pass rate")
     print(f"  Delta:         {delta.get('pass_rate', '—')}")
+    for c in benchmark["comparisons"]:
+        stat = c["pass_rate"]
+        if c.get("too_few_runs"):
+            print(f"  {c['a']} vs {c['b']}: {stat['delta']:+.2f} (too few runs for an interval)")
+            continue
+        mark = " (significant)" if stat["significant"] else ""
+        print(f"  {c['a']} vs {c['b']}: {stat['delta']:+.2f} "
+              f"[{stat['ci'][0]:+.2f}, {stat['ci'][1]:+.2f}] p={stat['p_value']:.3f}{mark}")
 
 
 if __name__ == "__main__":
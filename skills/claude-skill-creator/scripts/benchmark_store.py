@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Per-skill history of benchmark run metrics.
+
+aggregate_benchmark appends every benchmark.json it writes to a SQLite
+database, one per skill, keeping only the run-level numbers (no
+expectations or notes). Trends across iterations, configurations and
+evals then come from one indexed query instead of re-reading every
+benchmark.json:
+
+    python -m scripts.benchmark_store my-skill trend --metric pass_rate
+    python -m scripts.benchmark_store my-skill trend --by iteration,eval_id --config with_skill
+    python -m scripts.benchmark_store my-skill add workspace/iteration-*/benchmark.json
+
+The store is append-only. Re-aggregating a directory adds a new snapshot
+only if its runs changed, and queries read the latest snapshot of each
+benchmark directory.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+from scripts.eval_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_STORE_DIR = DEFAULT_CACHE_DIR.parent / "benchmarks"
+
+METRICS = ("pass_rate", "passed", "failed", "total", "time_seconds", "tokens", "tool_calls", "errors")
+GROUP_COLUMNS = ("iteration", "configuration", "eval_id", "run_number", "executor_model")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS benchmarks (
+    id INTEGER PRIMARY KEY,
+    benchmark_dir TEXT NOT NULL,
+    iteration TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    skill_path TEXT,
+    executor_model TEXT,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS benchmarks_dir ON benchmarks (benchmark_dir, id);
+CREATE TABLE IF NOT EXISTS runs (
+    benchmark_id INTEGER NOT NULL REFERENCES benchmarks (id),
+    -- NUMERIC so integer IDs sort numerically and match "3" from the CLI
+    eval_id NUMERIC,
+    eval_name TEXT,
+    configuration TEXT NOT NULL,
+    run_number INTEGER,
+    pass_rate REAL,
+    passed INTEGER,
+    failed INTEGER,
+    total INTEGER,
+    time_seconds REAL,
+    tokens INTEGER,
+    tool_calls INTEGER,
+    errors INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_benchmark ON runs (benchmark_id, configuration, eval_id);
+-- Latest snapshot of every benchmark directory
+CREATE VIEW IF NOT EXISTS current_runs AS
+    SELECT b.iteration, b.timestamp, b.benchmark_dir, b.executor_model, r.*
+    FROM runs r JOIN benchmarks b ON b.id = r.benchmark_id
+    WHERE b.id IN (SELECT MAX(id) FROM benchmarks GROUP BY benchmark_dir);
+"""
+
+
+class BenchmarkStore:
+    """SQLite store of run-level benchmark metrics, one file per skill."""
+
+    def __init__(self, skill_name: str, store_dir: Path = DEFAULT_STORE_DIR):
+        self.skill_name = skill_name
+        self.path = Path(store_dir) / f"{skill_name}.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, benchmark: dict, benchmark_dir: Path, iteration: str | None = None) -> bool:
+        """Record a benchmark's runs; returns False if this snapshot is already stored.
+
+        ``iteration`` labels the benchmark in trends and defaults to the
+        directory name (e.g. "iteration-3").
+        """
+        benchmark_dir = str(Path(benchmark_dir).resolve())
+        metadata = benchmark.get("metadata", {})
+        rows = [
+            (
+                run.get("eval_id"),
+                run.get("eval_name"),
+                run["configuration"],
+                run.get("run_number"),
+                *(run.get("result", {}).get(metric, 0) for metric in METRICS),
+            )
+            for run in benchmark.get("runs", [])
+        ]
+        digest = hashlib.sha256(json.dumps(sorted(rows, key=repr)).encode("utf-8")).hexdigest()[:16]
+
+        latest = self.conn.execute(
+            "SELECT digest FROM benchmarks WHERE benchmark_dir = ? ORDER BY id DESC LIMIT 1", (benchmark_dir,)
+        ).fetchone()
+        if latest and latest["digest"] == digest:
+            return False
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO benchmarks (benchmark_dir, iteration, timestamp, skill_path, executor_model, digest)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (benchmark_dir, iteration or Path(benchmark_dir).name, metadata.get("timestamp", ""),
+                 metadata.get("skill_path"), metadata.get("executor_model"), digest),
+            )
+            self.conn.executemany(
+                f"INSERT INTO runs VALUES (?, {', '.join('?' * (4 + len(METRICS)))})",
+                [(cursor.lastrowid, *row) for row in rows],
+            )
+        return True
+
+    def benchmarks(self) -> list[dict]:
+        """Latest snapshot of each benchmark directory, oldest first."""
+        rows = self.conn.execute(
+            "SELECT b.*, COUNT(r.benchmark_id) AS runs FROM benchmarks b"
+            " LEFT JOIN runs r ON r.benchmark_id = b.id"
+            " WHERE b.id IN (SELECT MAX(id) FROM benchmarks GROUP BY benchmark_dir)"
+            " GROUP BY b.id ORDER BY b.timestamp, b.id"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def trend(
+        self,
+        metric: str = "pass_rate",
+        by: tuple[str, ...] = ("iteration", "configuration"),
+        configuration: str | None = None,
+        eval_id: str | None = None,
+        iteration: str | None = None,
+    ) -> list[dict]:
+        """Mean, stddev, min, max and run count of ``metric`` per group, in time order.
+
+        ``by`` picks the grouping columns from GROUP_COLUMNS; the other
+        arguments filter runs before grouping.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; choose from {', '.join(METRICS)}")
+        unknown = [column for column in by if column not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"Cannot group by {', '.join(unknown)}; choose from {', '.join(GROUP_COLUMNS)}")
+
+        filters, params = [], []
+        for column, value in (("configuration", configuration), ("eval_id", eval_id), ("iteration", iteration)):
+            if value is not None:
+                filters.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        columns = ", ".join(by)
+        group = f"GROUP BY {columns}" if by else ""
+
+        rows = self.conn.execute(
+            f"SELECT {columns + ',' if by else ''}"
+            f" AVG({metric}) AS mean, AVG({metric} * {metric}) AS mean_sq,"
+            f" MIN({metric}) AS min, MAX({metric}) AS max, COUNT(*) AS n,"
+            f" MIN(timestamp) AS first_seen"
+            f" FROM current_runs {where} {group}"
+            f" ORDER BY first_seen{', ' + columns if by else ''}",
+            params,
+        ).fetchall()
+
+        trend = []
+        for row in rows:
+            entry = {column: row[column] for column in by}
+            n, mean = row["n"], row["mean"] or 0.0
+            # Sample stddev from the running sums
+            variance = (row["mean_sq"] - mean * mean) * n / (n - 1) if n > 1 else 0.0
+            entry.update({
+                "mean": round(mean, 4),
+                "stddev": round(max(variance, 0.0) ** 0.5, 4),
+                "min": round(row["min"], 4) if row["min"] is not None else None,
+                "max": round(row["max"], 4) if row["max"] is not None else None,
+                "n": n,
+            })
+            trend.append(entry)
+        return trend
+
+
+def format_table(rows: list[dict]) -> str:
+    if not rows:
+        return "(no runs)"
+    columns = list(rows[0].keys())
+    cells = [[str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    lines.extend("  ".join(v.ljust(w) for v, w in zip(r, widths)) for r in cells)
+    return "\n".join(lines)
+
+
+def write_rows(rows: list[dict], fmt: str) -> None:
+    if fmt == "json":
+        print(json.dumps(rows, indent=2))
+    elif fmt == "csv":
+        if rows:
+            writer = csv.DictWriter(sys.stdout, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        print(format_table(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the benchmark history of a skill")
+    parser.add_argument("skill_name", help="Skill whose history to read")
+    parser.add_argument("--store-dir", default=str(DEFAULT_STORE_DIR), help="Directory of the per-skill stores")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add = subparsers.add_parser("add", help="Append existing benchmark.json files (e.g. to backfill history)")
+    add.add_argument("benchmarks", nargs="+", type=Path, help="benchmark.json files")
+    add.add_argument("--iteration", default=None, help="Label for a single file (default: its directory name)")
+
+    listing = subparsers.add_parser("list", help="List stored benchmarks")
+    listing.add_argument("--format", choices=["table", "json", "csv"], default="table")
+
+    trend = subparsers.add_parser("trend", help="Aggregate a metric over iterations, configs or evals")
+    trend.add_argument("--metric", choices=METRICS, default="pass_rate")
+    trend.add_argument("--by", default="iteration,configuration",
+                       help=f"Comma-separated grouping columns from: {', '.join(GROUP_COLUMNS)}")
+    trend.add_argument("--config", default=None, help="Only runs of this configuration")
+    trend.add_argument("--eval", dest="eval_id", default=None, help="Only runs of this eval ID")
+    trend.add_argument("--iteration", default=None, help="Only runs of this iteration")
+    trend.add_argument("--format", choices=["table", "json", "csv"], default="table")
+
+    args = parser.parse_args()
+
+    with BenchmarkStore(args.skill_name, Path(args.store_dir)) as store:
+        if args.command == "add":
+            for path in args.benchmarks:
+                try:
+                    benchmark = json.loads(path.read_text())
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"Warning: skipping {path}: {e}", file=sys.stderr)
+                    continue
+                added = store.append(benchmark, path.parent, args.iteration)
+                print(f"{'Added' if added else 'Unchanged'}: {path}")
+        elif args.command == "list":
+            write_rows(store.benchmarks(), args.format)
+        else:
+            by = tuple(column.strip() for column in args.by.split(",") if column.strip())
+            try:
+                rows = store.trend(args.metric, by, args.config, args.eval_id, args.iteration)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            write_rows(rows, args.format)
+
+
+if __name__ == "__main__":
+    main()
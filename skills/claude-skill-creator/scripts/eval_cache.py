@@ -0,0 +1,78 @@
+"""Persistent cache of trigger eval runs.
+
+Each `claude -p` run is keyed by (skill name, description hash, query,
+model, run index), so re-evaluating an unchanged description -- e.g. the
+held-out test set on every loop iteration -- reuses earlier outcomes
+instead of launching new subprocesses.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "skill-creator" / "eval-cache"
+
+
+def description_hash(description: str) -> str:
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()[:16]
+
+
+class EvalCache:
+    """Append-only JSONL cache of run outcomes, one file per skill."""
+
+    def __init__(self, skill_name: str, cache_dir: Path = DEFAULT_CACHE_DIR):
+        self.skill_name = skill_name
+        self.path = Path(cache_dir) / f"{skill_name}.jsonl"
+        self.entries: dict[str, bool] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+                self.entries[record["key"]] = record["triggered"]
+
+    def key(self, description: str, query: str, model: str | None, run_idx: int) -> str:
+        raw = json.dumps([self.skill_name, description_hash(description), query, model or "", run_idx])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, description: str, query: str, model: str | None, run_idx: int) -> bool | None:
+        triggered = self.entries.get(self.key(description, query, model, run_idx))
+        if triggered is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return triggered
+
+    def put(self, description: str, query: str, model: str | None, run_idx: int, triggered: bool) -> None:
+        key = self.key(description, query, model, run_idx)
+        self.entries[key] = triggered
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({
+                "key": key,
+                "description_hash": description_hash(description),
+                "query": query,
+                "model": model,
+                "run": run_idx,
+                "triggered": triggered,
+                "time": time.time(),
+            }) + "\n")
+
+    def clear(self) -> None:
+        """Invalidate every cached run for this skill."""
+        self.entries.clear()
+        if self.path.exists():
+            self.path.unlink()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "path": str(self.path)}
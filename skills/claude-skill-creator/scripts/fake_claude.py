@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Offline stand-in for `claude -p` when load-testing the eval harness.
+
+Accepts the same command line run_eval uses and streams the same kind of
+stream-json events: a text block, then either a Skill tool_use whose
+input_json_delta chunks name the skill under test, or message_stop without
+one. Latency and trigger probabilities are configurable, so worker scaling,
+parser cost and scheduling policies can be benchmarked reproducibly without
+calling the API.
+
+Select it with --claude-bin on run_eval / run_loop, or with the
+SKILL_CREATOR_CLAUDE environment variable:
+
+    SKILL_CREATOR_CLAUDE="$PWD/scripts/fake_claude.py --latency 0.5" \\
+        python -m scripts.run_eval --eval-set evals.json --skill-path my-skill
+
+Runs execute inside sandbox directories, so give the script's absolute path.
+
+Every option also reads a FAKE_CLAUDE_<OPTION> environment variable
+(for example FAKE_CLAUDE_LATENCY=0.5), which is handy when the command
+itself can't carry flags.
+
+Whether a query "matches" the description is decided by word overlap. A
+matching query triggers with --trigger-rate, any other with
+--false-trigger-rate.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+
+TEMP_COMMAND_PATTERN = re.compile(r"-skill-[0-9a-f]{8}\.md$")
+WORD_PATTERN = re.compile(r"[a-z0-9]{3,}")
+STOPWORDS = {
+    "the", "and", "for", "with", "this", "that", "from", "into", "your", "you",
+    "can", "use", "how", "what", "when", "are", "not", "any", "all", "about",
+}
+
+
+def env_default(name: str, default, cast=float):
+    value = os.environ.get(f"FAKE_CLAUDE_{name}")
+    return cast(value) if value is not None else default
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fake `claude -p` for offline harness benchmarks")
+    parser.add_argument("-p", "--print", dest="query", required=True, help="Query (as passed by run_eval)")
+    parser.add_argument("--output-format", default="stream-json")
+    parser.add_argument("--model", default=env_default("MODEL", "fake-claude", str))
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--include-partial-messages", action="store_true")
+    parser.add_argument("--latency", type=float, default=env_default("LATENCY", 2.0),
+                        help="Median seconds until the outcome is streamed")
+    parser.add_argument("--latency-sigma", type=float, default=env_default("LATENCY_SIGMA", 0.5),
+                        help="Log-normal sigma of the latency (0 = fixed)")
+    parser.add_argument("--slow-rate", type=float, default=env_default("SLOW_RATE", 0.0),
+                        help="Probability that a run is --slow-factor times slower")
+    parser.add_argument("--slow-factor", type=float, default=env_default("SLOW_FACTOR", 10.0))
+    parser.add_argument("--hang-rate", type=float, default=env_default("HANG_RATE", 0.0),
+                        help="Probability that a run never finishes (exercises timeouts)")
+    parser.add_argument("--trigger-rate", type=float, default=env_default("TRIGGER_RATE", 0.85),
+                        help="Probability of triggering for queries that match the description")
+    parser.add_argument("--false-trigger-rate", type=float, default=env_default("FALSE_TRIGGER_RATE", 0.05),
+                        help="Probability of triggering for queries that don't")
+    parser.add_argument("--match-threshold", type=float, default=env_default("MATCH_THRESHOLD", 0.25),
+                        help="Fraction of query words found in the description that counts as a match")
+    parser.add_argument("--text-deltas", type=int, default=env_default("TEXT_DELTAS", 20, int),
+                        help="text_delta events streamed before the decision (parser load)")
+    parser.add_argument("--seed", default=env_default("SEED", None, str),
+                        help="Make outcome and latency a deterministic function of seed, query and description "
+                             "(every run of a query then behaves the same)")
+    # Flags the real CLI accepts that don't matter here
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def find_skill(cwd: Path) -> tuple[str | None, str]:
+    """Return (command name, description) of the temporary skill command file, if any."""
+    commands_dir = cwd / ".claude" / "commands"
+    if not commands_dir.is_dir():
+        return None, ""
+    for path in sorted(commands_dir.iterdir()):
+        if TEMP_COMMAND_PATTERN.search(path.name):
+            return path.stem, read_description(path.read_text())
+    return None, ""
+
+
+def read_description(content: str) -> str:
+    lines = content.split("\n")
+    for i, line in enumerate(lines):
+        if line.startswith("description:"):
+            value = line[len("description:"):].strip()
+            if value not in ("|", ">", "|-", ">-"):
+                return value.strip("\"'")
+            block = []
+            for follow in lines[i + 1:]:
+                if follow and not follow.startswith(" "):
+                    break
+                block.append(follow.strip())
+            return " ".join(block).strip()
+    return ""
+
+
+def match_score(query: str, description: str) -> float:
+    words = {w for w in WORD_PATTERN.findall(query.lower()) if w not in STOPWORDS}
+    if not words:
+        return 0.0
+    described = set(WORD_PATTERN.findall(description.lower()))
+    return len(words & described) / len(words)
+
+
+class EventStream:
+    def __init__(self, out):
+        self.out = out
+
+    def emit(self, event: dict) -> None:
+        self.out.write(json.dumps(event) + "\n")
+        self.out.flush()
+
+    def stream(self, event: dict) -> None:
+        self.emit({"type": "stream_event", "event": event})
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    skill_name, description = find_skill(Path.cwd())
+    rng = random.Random(f"{args.seed}\0{args.query}\0{description}" if args.seed is not None else None)
+
+    matches = skill_name is not None and match_score(args.query, description) >= args.match_threshold
+    triggered = skill_name is not None and rng.random() < (args.trigger_rate if matches else args.false_trigger_rate)
+
+    latency = args.latency * (rng.lognormvariate(0, args.latency_sigma) if args.latency_sigma > 0 else 1.0)
+    if rng.random() < args.slow_rate:
+        latency *= args.slow_factor
+    hangs = rng.random() < args.hang_rate
+
+    out = EventStream(sys.stdout)
+    session_id = str(uuid.uuid4())
+    out.emit({
+        "type": "system", "subtype": "init", "session_id": session_id, "model": args.model,
+        "cwd": os.getcwd(), "tools": ["Bash", "Read", "Edit", "Write", "Skill"],
+        "slash_commands": [skill_name] if skill_name else [],
+    })
+    out.stream({"type": "message_start", "message": {"id": f"msg_{uuid.uuid4().hex[:24]}", "role": "assistant",
+                                                     "model": args.model, "content": []}})
+
+    # The text block takes the whole latency, spread evenly over its deltas
+    out.stream({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+    steps = max(1, args.text_deltas)
+    for i in range(args.text_deltas):
+        time.sleep(latency / steps)
+        out.stream({"type": "content_block_delta", "index": 0,
+                    "delta": {"type": "text_delta", "text": f"Thinking about the request, step {i}. "}})
+    if not args.text_deltas:
+        time.sleep(latency)
+    out.stream({"type": "content_block_stop", "index": 0})
+
+    if hangs:
+        # Like a run stuck on a slow tool call: stay silent until killed
+        while True:
+            time.sleep(60)
+
+    content = [{"type": "text", "text": "Working on it."}]
+    if triggered:
+        tool_id = f"toolu_{uuid.uuid4().hex[:24]}"
+        tool_input = {"skill": skill_name}
+        out.stream({"type": "content_block_start", "index": 1,
+                    "content_block": {"type": "tool_use", "id": tool_id, "name": "Skill", "input": {}}})
+        partial = json.dumps(tool_input)
+        for start in range(0, len(partial), 8):
+            out.stream({"type": "content_block_delta", "index": 1,
+                        "delta": {"type": "input_json_delta", "partial_json": partial[start:start + 8]}})
+        out.stream({"type": "content_block_stop", "index": 1})
+        content.append({"type": "tool_use", "id": tool_id, "name": "Skill", "input": tool_input})
+
+    out.stream({"type": "message_delta", "delta": {"stop_reason": "tool_use" if triggered else "end_turn"}})
+    out.stream({"type": "message_stop"})
+    out.emit({"type": "assistant", "session_id": session_id, "message": {"role": "assistant", "content": content}})
+    out.emit({"type": "result", "subtype": "success", "is_error": False, "session_id": session_id,
+              "duration_ms": round(latency * 1000), "result": ""})
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # The harness stops reading as soon as the outcome is known
+        sys.exit(0)
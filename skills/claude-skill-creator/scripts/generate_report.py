@@ -25,8 +25,10 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
     if history:
         for r in history[0].get("train_results", history[0].get("results", [])):
             train_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
-        if history[0].get("test_results"):
-            for r in history[0].get("test_results", []):
+        # Test results arrive after train results, so the first iteration may not have them yet
+        first_tested = next((h for h in history if h.get("test_results")), None)
+        if first_tested:
+            for r in first_tested["test_results"]:
                 test_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
 
     refresh_tag = '    <meta http-equiv="refresh" content="5">\n' if auto_refresh else ""
@@ -204,20 +206,23 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
 
     # Find best iteration for highlighting
     if test_queries:
-        best_iter = max(history, key=lambda h: h.get("test_passed") or 0).get("iteration")
+        best_entry = max(history, key=lambda h: h.get("test_passed") or 0)
     else:
-        best_iter = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0))).get("iteration")
+        best_entry = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0)))
 
-    # Add rows for each iteration
+    # Add rows for each iteration (one per candidate in beam search)
     for h in history:
         iteration = h.get("iteration", "?")
+        if h.get("candidate"):
+            iteration = f"{iteration}.{h['candidate']}"
         train_passed = h.get("train_passed", h.get("passed", 0))
         train_total = h.get("train_total", h.get("total", 0))
         test_passed = h.get("test_passed")
         test_total = h.get("test_total")
         description = h.get("description", "")
         train_results = h.get("train_results", h.get("results", []))
-        test_results = h.get("test_results", [])
+        test_results = h.get("test_results") or []
+        test_pending = test_queries and h.get("test_results") is None
 
         # Create lookups for results by query
         train_by_query = {r["query"]: r for r in train_results}
@@ -253,12 +258,12 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         train_class = score_class(train_correct, train_runs)
         test_class = score_class(test_correct, test_runs)
 
-        row_class = "best-row" if iteration == best_iter else ""
+        row_class = "best-row" if h is best_entry else ""
 
         html_parts.append(f"""            <tr class="{row_class}">
                 <td>{iteration}</td>
                 <td><span class="score {train_class}">{train_correct}/{train_runs}</span></td>
-                <td><span class="score {test_class}">{test_correct}/{test_runs}</span></td>
+                <td><span class="score {test_class}">{"…" if test_pending else f"{test_correct}/{test_runs}"}</span></td>
                 <td class="description">{html.escape(description)}</td>
 """)
 
@@ -276,6 +281,9 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
 
         # Add result for each test query (with different background)
         for qinfo in test_queries:
+            if test_pending:
+                html_parts.append('                <td class="result test-result">…</td>\n')
+                continue
             r = test_by_query.get(qinfo["query"], {})
             did_pass = r.get("pass", False)
             triggers = r.get("triggers", 0)
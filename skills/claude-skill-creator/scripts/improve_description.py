@@ -9,6 +9,7 @@ import argparse
 import json
 import re
 import sys
+import time
 from pathlib import Path
 
 import anthropic
@@ -16,6 +17,131 @@ import anthropic
 from scripts.utils import parse_skill_md
 
 
+# Attempts beyond this many characters of prompt get summarized, oldest first
+HISTORY_BUDGET_CHARS = 20_000
+# Attempts are summarized in groups of this size so the summary (and with it
+# the cached prompt prefix) stays byte-identical across several iterations
+COMPACT_STEP = 4
+
+CACHE_BREAKPOINT = {"type": "ephemeral"}
+
+# Angles for the candidates of one beam-search iteration, so parallel
+# proposals from the same parent explore different directions. They go in
+# the final, uncached block; thinking rules out varying the temperature.
+CANDIDATE_STRATEGIES = [
+    "",
+    "Prioritize recall: cover the intents and phrasings behind the queries that failed to trigger, "
+    "including ones that never name the skill's domain directly.",
+    "Prioritize precision: sharpen the boundary so near-miss queries that should not trigger are "
+    "clearly excluded, without losing the queries that already pass.",
+    "Take a structurally different approach from the current description: reorganize it around user "
+    "goals or situations instead of refining its existing wording.",
+    "Aim for the most concise description that still covers every intent, leading with the strongest "
+    "trigger words.",
+]
+
+INSTRUCTIONS = """You are optimizing a skill description for a Claude Code skill called "{skill_name}". A "skill" is sort of like a prompt, but with progressive disclosure -- there's a title and description that Claude sees when deciding whether to use the skill, and then if it does use the skill, it reads the .md file which has lots more details and potentially links to other resources in the skill folder like helper files and scripts and additional documentation or examples.
+
+The description appears in Claude's "available_skills" list. When a user sends a query, Claude decides whether to invoke the skill based solely on the title and on this description. Your goal is to write a description that triggers for relevant queries, and doesn't trigger for irrelevant ones.
+
+Skill content (for context on what the skill does):
+<skill_content>
+{skill_content}
+</skill_content>
+
+Below you'll get the current description with its failures, and earlier attempts. Based on the failures, write a new and improved description that is more likely to trigger correctly. When I say "based on the failures", it's a bit of a tricky line to walk because we don't want to overfit to the specific cases you're seeing. So what I DON'T want you to do is produce an ever-expanding list of specific queries that this skill should or shouldn't trigger for. Instead, try to generalize from the failures to broader categories of user intent and situations where this skill would be useful or not useful. The reason for this is twofold:
+
+1. Avoid overfitting
+2. The list might get loooong and it's injected into ALL queries and there might be a lot of skills, so we don't want to blow too much space on any given description.
+
+Concretely, your description should not be more than about 100-200 words, even if that comes at the cost of accuracy.
+
+Here are some tips that we've found to work well in writing these descriptions:
+- The skill should be phrased in the imperative -- "Use this skill for" rather than "this skill does"
+- The skill description should focus on the user's intent, what they are trying to achieve, vs. the implementation details of how the skill works.
+- The description competes with other skills for Claude's attention — make it distinctive and immediately recognizable.
+- If you're getting lots of failures after repeated attempts, change things up. Try different sentence structures or wordings.
+
+I'd encourage you to be creative and mix up the style in different iterations since you'll have multiple opportunities to try different approaches and we'll just grab the highest-scoring one at the end."""
+
+
+def _render_attempt(h: dict) -> str:
+    train_s = f"{h.get('train_passed', h.get('passed', 0))}/{h.get('train_total', h.get('total', 0))}"
+    test_s = f"{h.get('test_passed', '?')}/{h.get('test_total', '?')}" if h.get('test_passed') is not None else None
+    score_str = f"train={train_s}" + (f", test={test_s}" if test_s else "")
+    text = f'<attempt {score_str}>\n'
+    text += f'Description: "{h["description"]}"\n'
+    if "results" in h:
+        text += "Train results:\n"
+        for r in h["results"]:
+            status = "PASS" if r["pass"] else "FAIL"
+            text += f'  [{status}] "{r["query"][:80]}" (triggered {r["triggers"]}/{r["runs"]})\n'
+    if h.get("note"):
+        text += f'Note: {h["note"]}\n'
+    return text + "</attempt>\n\n"
+
+
+def _render_summary(attempts: list[dict]) -> str:
+    text = "EARLIER ATTEMPTS (summarized; scores only):\n"
+    for h in attempts:
+        train_s = f"{h.get('train_passed', h.get('passed', 0))}/{h.get('train_total', h.get('total', 0))}"
+        text += f'  - train={train_s}: "{h["description"]}"\n'
+    return text + "\n"
+
+
+def compact_history(history: list[dict], budget_chars: int = HISTORY_BUDGET_CHARS) -> list[str]:
+    """Render previous attempts as prompt blocks, summarizing the oldest ones over budget.
+
+    Attempts are summarized COMPACT_STEP at a time, always from the start, so
+    the rendered blocks only change when another group is folded in.
+    """
+    rendered = [_render_attempt(h) for h in history]
+    summarized = 0
+    while summarized < len(history):
+        size = sum(map(len, rendered[summarized:]))
+        if summarized:
+            size += len(_render_summary(history[:summarized]))
+        if size <= budget_chars:
+            break
+        summarized = min(len(history), summarized + COMPACT_STEP)
+    blocks = [_render_summary(history[:summarized])] if summarized else []
+    return blocks + rendered[summarized:]
+
+
+def _usage_record(call: str, response, elapsed: float) -> dict:
+    usage = response.usage
+    return {
+        "call": call,
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+        "latency_seconds": round(elapsed, 3),
+    }
+
+
+def summarize_usage(records: list[dict]) -> dict:
+    """Totals over per-call usage records."""
+    keys = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+    totals = {key: sum(r[key] for r in records) for key in keys}
+    totals["calls"] = len(records)
+    totals["latency_seconds"] = round(sum(r["latency_seconds"] for r in records), 3)
+    return totals
+
+
+def format_usage(totals: dict) -> str:
+    return (f"{totals['calls']} call(s), {totals['input_tokens']} input + "
+            f"{totals['cache_read_input_tokens']} cache-read + {totals['cache_creation_input_tokens']} cache-write, "
+            f"{totals['output_tokens']} output tokens, {totals['latency_seconds']:.1f}s")
+
+
+def _create(client: anthropic.Anthropic, call: str, usage: list[dict], **kwargs):
+    started = time.monotonic()
+    response = client.messages.create(**kwargs)
+    usage.append(_usage_record(call, response, time.monotonic() - started))
+    return response
+
+
 def improve_description(
     client: anthropic.Anthropic,
     skill_name: str,
@@ -27,8 +153,26 @@ def improve_description(
     test_results: dict | None = None,
     log_dir: Path | None = None,
     iteration: int | None = None,
+    candidate: int | None = None,
+    usage: list[dict] | None = None,
+    history_budget: int = HISTORY_BUDGET_CHARS,
 ) -> str:
-    """Call Claude to improve the description based on eval results."""
+    """Call Claude to improve the description based on eval results.
+
+    The prompt is sent as content blocks ordered from most to least stable:
+    the instructions and skill content, then one block per previous attempt,
+    then the current description and its failures. Cache breakpoints after
+    the instructions and after the last attempt let later iterations (and
+    the other candidates of the same iteration) read that prefix from the
+    prompt cache. One record per API call, with token counts and latency,
+    is appended to ``usage`` when given.
+
+    ``candidate`` numbers parallel proposals for one iteration; each gets a
+    different angle from CANDIDATE_STRATEGIES so they don't converge on the
+    same rewrite.
+    """
+    if usage is None:
+        usage = []
     failed_triggers = [
         r for r in eval_results["results"]
         if r["should_trigger"] and not r["pass"]
@@ -46,11 +190,19 @@ def improve_description(
     else:
         scores_summary = f"Train: {train_score}"
 
-    prompt = f"""You are optimizing a skill description for a Claude Code skill called "{skill_name}". A "skill" is sort of like a prompt, but with progressive disclosure -- there's a title and description that Claude sees when deciding whether to use the skill, and then if it does use the skill, it reads the .md file which has lots more details and potentially links to other resources in the skill folder like helper files and scripts and additional documentation or examples.
+    blocks = [{
+        "type": "text",
+        "text": INSTRUCTIONS.format(skill_name=skill_name, skill_content=skill_content),
+        "cache_control": CACHE_BREAKPOINT,
+    }]
 
-The description appears in Claude's "available_skills" list. When a user sends a query, Claude decides whether to invoke the skill based solely on the title and on this description. Your goal is to write a description that triggers for relevant queries, and doesn't trigger for irrelevant ones.
+    if history:
+        attempt_blocks = compact_history(history, history_budget)
+        attempt_blocks[0] = "PREVIOUS ATTEMPTS (do NOT repeat these — try something structurally different):\n\n" + attempt_blocks[0]
+        blocks.extend({"type": "text", "text": text} for text in attempt_blocks)
+        blocks[-1]["cache_control"] = CACHE_BREAKPOINT
 
-Here's the current description:
+    current = f"""Here's the current description:
 <current_description>
 "{current_description}"
 </current_description>
@@ -59,66 +211,38 @@ Current scores ({scores_summary}):
 <scores_summary>
 """
     if failed_triggers:
-        prompt += "FAILED TO TRIGGER (should have triggered but didn't):\n"
+        current += "FAILED TO TRIGGER (should have triggered but didn't):\n"
         for r in failed_triggers:
-            prompt += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
-        prompt += "\n"
+            current += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
+        current += "\n"
 
     if false_triggers:
-        prompt += "FALSE TRIGGERS (triggered but shouldn't have):\n"
+        current += "FALSE TRIGGERS (triggered but shouldn't have):\n"
         for r in false_triggers:
-            prompt += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
-        prompt += "\n"
-
-    if history:
-        prompt += "PREVIOUS ATTEMPTS (do NOT repeat these — try something structurally different):\n\n"
-        for h in history:
-            train_s = f"{h.get('train_passed', h.get('passed', 0))}/{h.get('train_total', h.get('total', 0))}"
-            test_s = f"{h.get('test_passed', '?')}/{h.get('test_total', '?')}" if h.get('test_passed') is not None else None
-            score_str = f"train={train_s}" + (f", test={test_s}" if test_s else "")
-            prompt += f'<attempt {score_str}>\n'
-            prompt += f'Description: "{h["description"]}"\n'
-            if "results" in h:
-                prompt += "Train results:\n"
-                for r in h["results"]:
-                    status = "PASS" if r["pass"] else "FAIL"
-                    prompt += f'  [{status}] "{r["query"][:80]}" (triggered {r["triggers"]}/{r["runs"]})\n'
-            if h.get("note"):
-                prompt += f'Note: {h["note"]}\n'
-            prompt += "</attempt>\n\n"
-
-    prompt += f"""</scores_summary>
-
-Skill content (for context on what the skill does):
-<skill_content>
-{skill_content}
-</skill_content>
+            current += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
+        current += "\n"
 
-Based on the failures, write a new and improved description that is more likely to trigger correctly. When I say "based on the failures", it's a bit of a tricky line to walk because we don't want to overfit to the specific cases you're seeing. So what I DON'T want you to do is produce an ever-expanding list of specific queries that this skill should or shouldn't trigger for. Instead, try to generalize from the failures to broader categories of user intent and situations where this skill would be useful or not useful. The reason for this is twofold:
+    current += "</scores_summary>\n\n"
 
-1. Avoid overfitting
-2. The list might get loooong and it's injected into ALL queries and there might be a lot of skills, so we don't want to blow too much space on any given description.
+    strategy = CANDIDATE_STRATEGIES[(candidate - 1) % len(CANDIDATE_STRATEGIES)] if candidate else ""
+    if strategy:
+        current += f"""Several proposals are being written in parallel from this description, so yours should differ from the others. Your angle: {strategy}
 
-Concretely, your description should not be more than about 100-200 words, even if that comes at the cost of accuracy.
-
-Here are some tips that we've found to work well in writing these descriptions:
-- The skill should be phrased in the imperative -- "Use this skill for" rather than "this skill does"
-- The skill description should focus on the user's intent, what they are trying to achieve, vs. the implementation details of how the skill works.
-- The description competes with other skills for Claude's attention — make it distinctive and immediately recognizable.
-- If you're getting lots of failures after repeated attempts, change things up. Try different sentence structures or wordings.
-
-I'd encourage you to be creative and mix up the style in different iterations since you'll have multiple opportunities to try different approaches and we'll just grab the highest-scoring one at the end. 
+"""
 
-Please respond with only the new description text in <new_description> tags, nothing else."""
+    current += """Please respond with only the new description text in <new_description> tags, nothing else."""
+    blocks.append({"type": "text", "text": current})
+    prompt = "\n".join(block["text"] for block in blocks)
 
-    response = client.messages.create(
+    response = _create(
+        client, "improve", usage,
         model=model,
         max_tokens=16000,
         thinking={
             "type": "enabled",
             "budget_tokens": 10000,
         },
-        messages=[{"role": "user", "content": prompt}],
+        messages=[{"role": "user", "content": blocks}],
     )
 
     # Extract thinking and text from response
@@ -148,7 +272,8 @@ Please respond with only the new description text in <new_description> tags, not
     # If over 1024 chars, ask the model to shorten it
     if len(description) > 1024:
         shorten_prompt = f"Your description is {len(description)} characters, which exceeds the hard 1024 character limit. Please rewrite it to be under 1024 characters while preserving the most important trigger words and intent coverage. Respond with only the new description in <new_description> tags."
-        shorten_response = client.messages.create(
+        shorten_response = _create(
+            client, "shorten", usage,
             model=model,
             max_tokens=16000,
             thinking={
@@ -156,7 +281,7 @@ Please respond with only the new description text in <new_description> tags, not
                 "budget_tokens": 10000,
             },
             messages=[
-                {"role": "user", "content": prompt},
+                {"role": "user", "content": blocks},
                 {"role": "assistant", "content": text},
                 {"role": "user", "content": shorten_prompt},
             ],
@@ -181,10 +306,13 @@ Please respond with only the new description text in <new_description> tags, not
         description = shortened
 
     transcript["final_description"] = description
+    transcript["usage"] = usage
+    transcript["usage_total"] = summarize_usage(usage)
 
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"improve_iter_{iteration or 'unknown'}.json"
+        suffix = f"_{candidate}" if candidate else ""
+        log_file = log_dir / f"improve_iter_{iteration or 'unknown'}{suffix}.json"
         log_file.write_text(json.dumps(transcript, indent=2))
 
     return description
@@ -217,6 +345,7 @@ def main():
         print(f"Score: {eval_results['summary']['passed']}/{eval_results['summary']['total']}", file=sys.stderr)
 
     client = anthropic.Anthropic()
+    usage: list[dict] = []
     new_description = improve_description(
         client=client,
         skill_name=name,
@@ -225,10 +354,12 @@ def main():
         eval_results=eval_results,
         history=history,
         model=args.model,
+        usage=usage,
     )
 
     if args.verbose:
         print(f"Improved: {new_description}", file=sys.stderr)
+        print(f"API usage: {format_usage(summarize_usage(usage))}", file=sys.stderr)
 
     # Output as JSON with both the new description and updated history
     output = {
@@ -240,6 +371,7 @@ def main():
             "total": eval_results["summary"]["total"],
             "results": eval_results["results"],
         }],
+        "usage": summarize_usage(usage),
     }
     print(json.dumps(output, indent=2))
 
@@ -0,0 +1,122 @@
+"""Per-query latency history for trigger eval runs.
+
+Every `claude -p` run that finishes records its wall time here, keyed by query
+and model. Later evals use the history to start the slowest queries first
+and to size each run's timeout from observed percentiles rather than one
+fixed value.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+from scripts.eval_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_STATS_DIR = DEFAULT_CACHE_DIR.parent / "latency"
+
+# Samples kept per query; older ones stop influencing scheduling
+MAX_SAMPLES = 50
+# A query's own percentiles are used once it has this many samples
+MIN_SAMPLES = 5
+# Dynamic timeout = TIMEOUT_FACTOR * p95, but never below MIN_TIMEOUT seconds
+TIMEOUT_FACTOR = 2.0
+MIN_TIMEOUT = 10.0
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linearly interpolated percentile, ``q`` in [0, 100]."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile of empty sequence")
+    pos = (len(ordered) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "samples": len(values),
+    }
+
+
+class LatencyStats:
+    """Append-only JSONL log of run latencies, one file per skill."""
+
+    def __init__(self, skill_name: str, stats_dir: Path = DEFAULT_STATS_DIR, max_samples: int = MAX_SAMPLES):
+        self.skill_name = skill_name
+        self.path = Path(stats_dir) / f"{skill_name}.jsonl"
+        self.max_samples = max_samples
+        self.samples: dict[str, deque] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        lines = 0
+        with open(self.path) as f:
+            for line in f:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+                self._samples(record["key"]).append(record["elapsed"])
+        # Drop samples that have aged out once they dominate the file
+        if lines > 4 * max(1, sum(len(s) for s in self.samples.values())):
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            for key, samples in self.samples.items():
+                for elapsed in samples:
+                    f.write(json.dumps({"key": key, "elapsed": elapsed}) + "\n")
+        os.replace(tmp, self.path)
+
+    def _samples(self, key: str) -> deque:
+        samples = self.samples.get(key)
+        if samples is None:
+            samples = self.samples[key] = deque(maxlen=self.max_samples)
+        return samples
+
+    def key(self, query: str, model: str | None) -> str:
+        raw = json.dumps([query, model or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+    def record(self, query: str, model: str | None, elapsed: float) -> None:
+        key = self.key(query, model)
+        elapsed = round(elapsed, 3)
+        self._samples(key).append(elapsed)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"key": key, "elapsed": elapsed, "time": time.time()}) + "\n")
+
+    def history(self, query: str, model: str | None) -> list[float]:
+        return list(self.samples.get(self.key(query, model), ()))
+
+    def expected(self, query: str, model: str | None) -> float | None:
+        """Median latency of the query, or None if it has never run."""
+        samples = self.history(query, model)
+        return percentile(samples, 50) if samples else None
+
+    def timeout_for(self, query: str, model: str | None, cap: float) -> float:
+        """Timeout for one run: a multiple of the observed p95, at most ``cap``.
+
+        Falls back to the skill-wide p95 for queries with few samples, and
+        to ``cap`` until there is enough history. Killed runs are never
+        recorded, so the caller retries a run that hits this timeout at
+        ``cap`` rather than counting it as timed out.
+        """
+        samples = self.history(query, model)
+        if len(samples) < MIN_SAMPLES:
+            samples = [s for per_query in self.samples.values() for s in per_query]
+        if len(samples) < MIN_SAMPLES:
+            return cap
+        return min(cap, max(MIN_TIMEOUT, TIMEOUT_FACTOR * percentile(samples, 95)))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Local mock of the Anthropic Messages API for measuring improve_description.
+
+Serves POST /v1/messages with responses shaped like the real API, including
+prompt-cache accounting: content blocks marked with ``cache_control`` write
+their prefix to an in-memory cache, and later requests that share a cached
+prefix report it as ``cache_read_input_tokens`` instead of
+``input_tokens``. Latency is simulated from the uncached token count, so the
+effect of prompt caching on cost and latency is measurable offline:
+
+    python -m scripts.mock_anthropic_api --port 8765 &
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=mock \\
+        python -m scripts.run_loop --model mock ... --verbose
+
+Replies propose a variation of the <current_description> found in the
+prompt, wrapped in <new_description> tags.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Rough tokenizer stand-in
+CHARS_PER_TOKEN = 4
+# Prefixes shorter than this are never cached, as with the real API
+MIN_CACHEABLE_TOKENS = 1024
+# How many block boundaries before a breakpoint are checked for a cache hit
+LOOKBACK_BLOCKS = 20
+
+DESCRIPTION_PATTERN = re.compile(r'<current_description>\s*"?(.*?)"?\s*</current_description>', re.DOTALL)
+VARIATIONS = [
+    "Use this skill whenever the user wants to {}.",
+    "Use this skill for any request to {}, even when it is not named explicitly.",
+    "Reach for this skill when a task involves the need to {}.",
+]
+
+
+def core_description(description: str) -> str:
+    """Strip the wording earlier mock replies wrapped around the description."""
+    changed = True
+    while changed:
+        changed = False
+        for template in VARIATIONS:
+            before, after = template.split("{}")
+            if description.startswith(before) and description.endswith(after) and len(description) > len(before + after):
+                description = description[len(before):len(description) - len(after)]
+                changed = True
+    return description.rstrip(".")
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def flatten_blocks(body: dict) -> list[tuple[str, bool]]:
+    """(serialized block, has breakpoint) for system and message blocks in prompt order."""
+    blocks = []
+    system = body.get("system") or []
+    if isinstance(system, str):
+        system = [{"type": "text", "text": system}]
+    for block in system:
+        blocks.append(("system:" + block.get("text", ""), "cache_control" in block))
+    for message in body.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        for block in content:
+            text = block.get("text") or json.dumps({k: v for k, v in block.items() if k != "cache_control"})
+            blocks.append((message["role"] + ":" + text, "cache_control" in block))
+    return blocks
+
+
+class PromptCache:
+    """Prefix hashes written at cache breakpoints."""
+
+    def __init__(self):
+        self.prefixes: set[str] = set()
+        self.lock = threading.Lock()
+
+    def account(self, body: dict) -> tuple[int, int, int]:
+        """Return (uncached input, cache write, cache read) token counts for a request."""
+        blocks = flatten_blocks(body)
+        hashes, tokens = [], []
+        digest = hashlib.sha256(json.dumps([body.get("model"), body.get("thinking")]).encode())
+        total = 0
+        for text, _ in blocks:
+            digest.update(text.encode())
+            hashes.append(digest.copy().hexdigest())
+            total += count_tokens(text)
+            tokens.append(total)
+
+        breakpoints = [i for i, (_, marked) in enumerate(blocks) if marked]
+        if not breakpoints:
+            return total, 0, 0
+
+        with self.lock:
+            read_end = -1
+            for point in reversed(breakpoints):
+                for i in range(point, max(-1, point - LOOKBACK_BLOCKS), -1):
+                    if hashes[i] in self.prefixes:
+                        read_end = i
+                        break
+                if read_end >= 0:
+                    break
+            written_end = read_end
+            for point in breakpoints:
+                if point > read_end and tokens[point] >= MIN_CACHEABLE_TOKENS:
+                    self.prefixes.add(hashes[point])
+                    written_end = point
+
+        read = tokens[read_end] if read_end >= 0 else 0
+        written = tokens[written_end] - read if written_end > read_end else 0
+        return total - read - written, written, read
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: "MockServer"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/v1/messages":
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        uncached, written, read = self.server.cache.account(body)
+        prompt_text = " ".join(text for text, _ in flatten_blocks(body))
+        match = DESCRIPTION_PATTERN.search(prompt_text)
+        current = match.group(1).strip() if match else "handle this kind of task"
+        count = next(self.server.counter)
+        text = f"<new_description>{VARIATIONS[count % len(VARIATIONS)].format(core_description(current))}</new_description>"
+
+        content = []
+        if body.get("thinking", {}).get("type") == "enabled":
+            content.append({"type": "thinking", "thinking": "Considering the failures.", "signature": "mock"})
+        content.append({"type": "text", "text": text})
+        output_tokens = count_tokens(text) + (self.server.thinking_tokens if len(content) > 1 else 0)
+
+        # Uncached and cache-write tokens are processed; cache reads are nearly free
+        time.sleep(self.server.base_latency
+                   + (uncached + written) * self.server.seconds_per_input_token
+                   + read * self.server.seconds_per_input_token / 10
+                   + output_tokens * self.server.seconds_per_output_token)
+
+        payload = json.dumps({
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock"),
+            "content": content,
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": uncached,
+                "cache_creation_input_tokens": written,
+                "cache_read_input_tokens": read,
+                "output_tokens": output_tokens,
+            },
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, args):
+        super().__init__(address, Handler)
+        self.cache = PromptCache()
+        self.counter = itertools.count()
+        self.verbose = args.verbose
+        self.base_latency = args.base_latency
+        self.seconds_per_input_token = args.ms_per_input_token / 1000
+        self.seconds_per_output_token = args.ms_per_output_token / 1000
+        self.thinking_tokens = args.thinking_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the Anthropic Messages API with prompt-cache accounting")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-latency", type=float, default=0.5, help="Seconds added to every response")
+    parser.add_argument("--ms-per-input-token", type=float, default=0.05, help="Simulated cost of uncached input")
+    parser.add_argument("--ms-per-output-token", type=float, default=5.0, help="Simulated generation speed")
+    parser.add_argument("--thinking-tokens", type=int, default=300, help="Output tokens billed for a thinking block")
+    parser.add_argument("--verbose", action="store_true", help="Log requests to stderr")
+    args = parser.parse_args()
+
+    server = MockServer((args.host, args.port), args)
+    print(f"Mock Messages API on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,46 @@ for a set of queries. Outputs results as JSON.
 """
 
 import argparse
+import asyncio
+import contextlib
+import heapq
+import itertools
 import json
+import math
 import os
-import select
-import subprocess
+import re
+import shlex
+import shutil
 import sys
+import tempfile
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from statistics import NormalDist
+from typing import Callable
 
+from scripts.eval_cache import DEFAULT_CACHE_DIR, EvalCache
+from scripts.latency_stats import DEFAULT_STATS_DIR, LatencyStats, summarize
 from scripts.utils import parse_skill_md
 
+READ_CHUNK_SIZE = 64 * 1024
+
+# Command files written by _write_command_file / Sandbox
+TEMP_COMMAND_PATTERN = re.compile(r"-skill-[0-9a-f]{8}\.md$")
+
+# Overrides the `claude` command, e.g. with scripts/fake_claude.py for offline benchmarks
+CLAUDE_BIN_ENV = "SKILL_CREATOR_CLAUDE"
+
+# How a `claude -p` run ended. Only RUN_OK outcomes are real observations;
+# the others say nothing about triggering and are never cached or scored.
+RUN_OK = "ok"
+RUN_TIMEOUT = "timeout"
+RUN_ERROR = "error"
+
+
+def claude_command() -> list[str]:
+    return shlex.split(os.environ.get(CLAUDE_BIN_ENV) or "claude")
+
 
 def find_project_root() -> Path:
     """Find the project root by walking up from cwd looking for .claude/.
@@ -32,7 +60,353 @@ def find_project_root() -> Path:
     return current
 
 
-def run_single_query(
+class LineReader:
+    """Split a byte stream into lines using one reusable bytearray.
+
+    Complete lines are sliced out by offset and the consumed prefix is
+    dropped once per chunk, and the newline search resumes where the last
+    one stopped, so each byte is scanned and copied a constant number of
+    times however long a line grows.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._scanned = 0
+
+    def feed(self, chunk: bytes) -> list[bytearray]:
+        buf = self.buffer
+        buf += chunk
+        lines = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", max(start, self._scanned))
+            if end < 0:
+                break
+            lines.append(buf[start:end])
+            start = end + 1
+        if start:
+            del buf[:start]
+        self._scanned = len(buf)
+        return lines
+
+    def flush(self) -> list[bytearray]:
+        """Return the trailing line if the stream ended without a newline."""
+        rest = [self.buffer[:]] if self.buffer else []
+        self.buffer.clear()
+        self._scanned = 0
+        return rest
+
+
+class SubstringMatcher:
+    """Detect a fixed pattern across a sequence of text fragments.
+
+    Only the last ``len(pattern) - 1`` characters are carried between
+    fragments, so matching costs time linear in the total input instead of
+    rescanning everything accumulated so far.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.matched = False
+        self._tail = ""
+
+    def feed(self, text: str) -> bool:
+        if not self.matched:
+            window = self._tail + text
+            if self.pattern in window:
+                self.matched = True
+            else:
+                keep = len(self.pattern) - 1
+                self._tail = window[-keep:] if keep else ""
+        return self.matched
+
+    def reset(self) -> None:
+        self.matched = False
+        self._tail = ""
+
+
+class TriggerDetector:
+    """Decide from `claude -p` stream-json events whether the skill triggered.
+
+    Uses --include-partial-messages stream events to detect triggering early
+    (content_block_start) rather than waiting for the full assistant message,
+    which only arrives after tool execution.
+    """
+
+    def __init__(self, clean_name: str):
+        self.clean_name = clean_name
+        self.triggered = False
+        self.pending_tool_name = None
+        self.input_matcher = SubstringMatcher(clean_name)
+
+    def feed(self, event: dict) -> bool | None:
+        """Consume one event; return the outcome once it is known, else None."""
+        # Early detection via stream events
+        if event.get("type") == "stream_event":
+            se = event.get("event", {})
+            se_type = se.get("type", "")
+
+            if se_type == "content_block_start":
+                cb = se.get("content_block", {})
+                if cb.get("type") == "tool_use":
+                    tool_name = cb.get("name", "")
+                    if tool_name in ("Skill", "Read"):
+                        self.pending_tool_name = tool_name
+                        self.input_matcher.reset()
+                    else:
+                        return False
+
+            elif se_type == "content_block_delta" and self.pending_tool_name:
+                delta = se.get("delta", {})
+                if delta.get("type") == "input_json_delta":
+                    if self.input_matcher.feed(delta.get("partial_json", "")):
+                        return True
+
+            elif se_type in ("content_block_stop", "message_stop"):
+                if self.pending_tool_name:
+                    return self.input_matcher.matched
+                if se_type == "message_stop":
+                    return False
+
+        # Fallback: full assistant message
+        elif event.get("type") == "assistant":
+            message = event.get("message", {})
+            for content_item in message.get("content", []):
+                if content_item.get("type") != "tool_use":
+                    continue
+                tool_name = content_item.get("name", "")
+                tool_input = content_item.get("input", {})
+                if tool_name == "Skill" and self.clean_name in tool_input.get("skill", ""):
+                    self.triggered = True
+                elif tool_name == "Read" and self.clean_name in tool_input.get("file_path", ""):
+                    self.triggered = True
+                return self.triggered
+
+        elif event.get("type") == "result":
+            return self.triggered
+
+        return None
+
+
+def _command_content(skill_name: str, skill_description: str) -> str:
+    # Use YAML block scalar to avoid breaking on quotes in description
+    indented_desc = "\n  ".join(skill_description.split("\n"))
+    return (
+        f"---\n"
+        f"description: |\n"
+        f"  {indented_desc}\n"
+        f"---\n\n"
+        f"# {skill_name}\n\n"
+        f"This skill handles: {skill_description}\n"
+    )
+
+
+def _write_command_file(skill_name: str, skill_description: str, project_root: str) -> tuple[str, Path]:
+    """Create a uniquely named command file so the skill shows up in available_skills."""
+    unique_id = uuid.uuid4().hex[:8]
+    clean_name = f"{skill_name}-skill-{unique_id}"
+    project_commands_dir = Path(project_root) / ".claude" / "commands"
+    command_file = project_commands_dir / f"{clean_name}.md"
+
+    project_commands_dir.mkdir(parents=True, exist_ok=True)
+    command_file.write_text(_command_content(skill_name, skill_description))
+    return clean_name, command_file
+
+
+class Sandbox:
+    """A private project root holding one command file for the skill under test."""
+
+    def __init__(self, path: Path, skill_name: str):
+        self.path = path
+        self.skill_name = skill_name
+        self.clean_name = f"{skill_name}-skill-{uuid.uuid4().hex[:8]}"
+        self.command_file = path / ".claude" / "commands" / f"{self.clean_name}.md"
+        self.description: str | None = None
+
+    def prepare(self, description: str) -> None:
+        """Point the command file at ``description``; a no-op if it already does."""
+        if description != self.description:
+            self.command_file.write_text(_command_content(self.skill_name, description))
+            self.description = description
+
+
+class SandboxPool:
+    """Reusable per-worker project roots for concurrent `claude -p` runs.
+
+    Sharing one ``.claude/commands`` directory means every concurrent run
+    sees every other run's temporary command file. Instead each worker gets
+    its own project root, created once per eval session, that mirrors the
+    real project's ``.claude`` contents and CLAUDE.md via symlinks and adds
+    only its own command file, rewritten only when the description changes.
+    """
+
+    MIRRORED_FILES = ("CLAUDE.md", ".mcp.json")
+
+    def __init__(self, project_root: Path, skill_name: str, size: int):
+        self.project_root = Path(project_root)
+        self.skill_name = skill_name
+        self.size = size
+        self.root = Path(tempfile.mkdtemp(prefix=f"skill-eval-{skill_name}-"))
+        self.sandboxes: list[Sandbox] = []
+        self._idle: list[Sandbox] = []
+        self._waiters: list[tuple[int, float, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def ensure(self, size: int) -> list[Sandbox]:
+        """Grow the pool to at least ``size`` sandboxes and return them."""
+        while len(self.sandboxes) < size:
+            path = self.root / f"worker-{len(self.sandboxes)}"
+            self._mirror_project(path)
+            self.sandboxes.append(Sandbox(path, self.skill_name))
+        return self.sandboxes[:size]
+
+    @contextlib.asynccontextmanager
+    async def checkout(self, priority: int = 0, weight: float = 0.0):
+        """Borrow an idle sandbox; waits while all ``size`` are in use.
+
+        Concurrent run_eval_async calls sharing a pool therefore share one
+        concurrency limit. Waiters are served lowest ``priority`` first, then
+        highest ``weight`` (expected run time), then in arrival order.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures are bound to one event loop; each asyncio.run gets a fresh one
+            self._loop = loop
+            self._idle = list(self.ensure(self.size))
+            self._waiters = []
+        if self._idle and not self._waiters:
+            sandbox = self._idle.pop()
+        else:
+            waiter = loop.create_future()
+            heapq.heappush(self._waiters, (priority, -weight, next(self._order), waiter))
+            try:
+                sandbox = await waiter
+            except asyncio.CancelledError:
+                # Handed a sandbox just as we were cancelled: pass it on
+                if waiter.done() and not waiter.cancelled():
+                    self._release(waiter.result())
+                raise
+        try:
+            yield sandbox
+        finally:
+            self._release(sandbox)
+
+    def _release(self, sandbox: Sandbox) -> None:
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)[-1]
+            if not waiter.done():
+                waiter.set_result(sandbox)
+                return
+        self._idle.append(sandbox)
+
+    def _mirror_project(self, path: Path) -> None:
+        commands_dir = path / ".claude" / "commands"
+        commands_dir.mkdir(parents=True)
+        for name in self.MIRRORED_FILES:
+            if (self.project_root / name).exists():
+                (path / name).symlink_to(self.project_root / name)
+
+        project_claude = self.project_root / ".claude"
+        if not project_claude.is_dir():
+            return
+        for entry in project_claude.iterdir():
+            if entry.name != "commands":
+                (path / ".claude" / entry.name).symlink_to(entry)
+        if (project_claude / "commands").is_dir():
+            for entry in (project_claude / "commands").iterdir():
+                # Skip temporary command files left by other eval runs
+                if not TEMP_COMMAND_PATTERN.search(entry.name):
+                    (commands_dir / entry.name).symlink_to(entry)
+
+    def close(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+async def _read_events(stream: asyncio.StreamReader, detector: TriggerDetector) -> bool | None:
+    """Return the outcome once known, or None if the stream ends undecided."""
+    reader = LineReader()
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        lines = reader.feed(chunk) if chunk else reader.flush()
+        for line in lines:
+            if not line.strip():
+                continue
+
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            outcome = detector.feed(event)
+            if outcome is not None:
+                return outcome
+        if not chunk:
+            return None
+
+
+async def _run_claude(
+    query: str, clean_name: str, cwd: str, timeout: float, model: str | None,
+) -> tuple[bool, str]:
+    """Run `claude -p` in ``cwd`` and read its stream-json output until the outcome is known.
+
+    Returns (triggered, status). The status is RUN_TIMEOUT if the run was
+    killed at ``timeout``, RUN_ERROR if the process exited non-zero before
+    the outcome was known, else RUN_OK.
+    """
+    cmd = [
+        *claude_command(),
+        "-p", query,
+        "--output-format", "stream-json",
+        "--verbose",
+        "--include-partial-messages",
+    ]
+    if model:
+        cmd.extend(["--model", model])
+
+    # Remove CLAUDECODE env var to allow nesting claude -p inside a
+    # Claude Code session. The guard is for interactive terminal conflicts;
+    # programmatic subprocess usage is safe.
+    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+
+    # Cancelling create_subprocess_exec mid-spawn can leave its cleanup
+    # waiting forever, so finish spawning and then kill the child instead
+    spawn = asyncio.ensure_future(asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=cwd,
+        env=env,
+    ))
+    try:
+        process = await asyncio.shield(spawn)
+    except asyncio.CancelledError:
+        process = await spawn
+        process.kill()
+        await process.wait()
+        raise
+
+    detector = TriggerDetector(clean_name)
+    try:
+        outcome = await asyncio.wait_for(_read_events(process.stdout, detector), timeout)
+        if outcome is not None:
+            return outcome, RUN_OK
+        # Output ended without a decision: trust it only if the CLI exited cleanly
+        returncode = await process.wait()
+        return detector.triggered, RUN_OK if returncode == 0 else RUN_ERROR
+    except asyncio.TimeoutError:
+        return detector.triggered, RUN_TIMEOUT
+    finally:
+        # Clean up process on any exit path (return, timeout, cancellation)
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+
+async def run_single_query_async(
     query: str,
     skill_name: str,
     skill_description: str,
@@ -44,144 +418,62 @@ def run_single_query(
 
     Creates a command file in .claude/commands/ so it appears in Claude's
     available_skills list, then runs `claude -p` with the raw query.
-    Uses --include-partial-messages to detect triggering early from
-    stream events (content_block_start) rather than waiting for the
-    full assistant message, which only arrives after tool execution.
+    run_eval uses a SandboxPool instead so concurrent runs stay isolated.
     """
-    unique_id = uuid.uuid4().hex[:8]
-    clean_name = f"{skill_name}-skill-{unique_id}"
-    project_commands_dir = Path(project_root) / ".claude" / "commands"
-    command_file = project_commands_dir / f"{clean_name}.md"
-
+    clean_name, command_file = _write_command_file(skill_name, skill_description, project_root)
     try:
-        project_commands_dir.mkdir(parents=True, exist_ok=True)
-        # Use YAML block scalar to avoid breaking on quotes in description
-        indented_desc = "\n  ".join(skill_description.split("\n"))
-        command_content = (
-            f"---\n"
-            f"description: |\n"
-            f"  {indented_desc}\n"
-            f"---\n\n"
-            f"# {skill_name}\n\n"
-            f"This skill handles: {skill_description}\n"
-        )
-        command_file.write_text(command_content)
-
-        cmd = [
-            "claude",
-            "-p", query,
-            "--output-format", "stream-json",
-            "--verbose",
-            "--include-partial-messages",
-        ]
-        if model:
-            cmd.extend(["--model", model])
-
-        # Remove CLAUDECODE env var to allow nesting claude -p inside a
-        # Claude Code session. The guard is for interactive terminal conflicts;
-        # programmatic subprocess usage is safe.
-        env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
-
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            cwd=project_root,
-            env=env,
-        )
-
-        triggered = False
-        start_time = time.time()
-        buffer = ""
-        # Track state for stream event detection
-        pending_tool_name = None
-        accumulated_json = ""
-
-        try:
-            while time.time() - start_time < timeout:
-                if process.poll() is not None:
-                    remaining = process.stdout.read()
-                    if remaining:
-                        buffer += remaining.decode("utf-8", errors="replace")
-                    break
-
-                ready, _, _ = select.select([process.stdout], [], [], 1.0)
-                if not ready:
-                    continue
-
-                chunk = os.read(process.stdout.fileno(), 8192)
-                if not chunk:
-                    break
-                buffer += chunk.decode("utf-8", errors="replace")
-
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Early detection via stream events
-                    if event.get("type") == "stream_event":
-                        se = event.get("event", {})
-                        se_type = se.get("type", "")
-
-                        if se_type == "content_block_start":
-                            cb = se.get("content_block", {})
-                            if cb.get("type") == "tool_use":
-                                tool_name = cb.get("name", "")
-                                if tool_name in ("Skill", "Read"):
-                                    pending_tool_name = tool_name
-                                    accumulated_json = ""
-                                else:
-                                    return False
-
-                        elif se_type == "content_block_delta" and pending_tool_name:
-                            delta = se.get("delta", {})
-                            if delta.get("type") == "input_json_delta":
-                                accumulated_json += delta.get("partial_json", "")
-                                if clean_name in accumulated_json:
-                                    return True
-
-                        elif se_type in ("content_block_stop", "message_stop"):
-                            if pending_tool_name:
-                                return clean_name in accumulated_json
-                            if se_type == "message_stop":
-                                return False
-
-                    # Fallback: full assistant message
-                    elif event.get("type") == "assistant":
-                        message = event.get("message", {})
-                        for content_item in message.get("content", []):
-                            if content_item.get("type") != "tool_use":
-                                continue
-                            tool_name = content_item.get("name", "")
-                            tool_input = content_item.get("input", {})
-                            if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
-                                triggered = True
-                            elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
-                                triggered = True
-                            return triggered
-
-                    elif event.get("type") == "result":
-                        return triggered
-        finally:
-            # Clean up process on any exit path (return, exception, timeout)
-            if process.poll() is None:
-                process.kill()
-                process.wait()
-
+        triggered, _ = await _run_claude(query, clean_name, project_root, timeout, model)
         return triggered
     finally:
-        if command_file.exists():
-            command_file.unlink()
+        command_file.unlink(missing_ok=True)
 
 
-def run_eval(
+def run_single_query(
+    query: str,
+    skill_name: str,
+    skill_description: str,
+    timeout: int,
+    project_root: str,
+    model: str | None = None,
+) -> bool:
+    """Blocking wrapper around run_single_query_async."""
+    return asyncio.run(run_single_query_async(query, skill_name, skill_description, timeout, project_root, model))
+
+
+def outcome_fixed(
+    triggers: int,
+    runs: int,
+    runs_per_query: int,
+    trigger_threshold: float,
+    confidence: float | None = None,
+) -> bool | None:
+    """Return whether the trigger rate will reach the threshold, once that is certain.
+
+    The exact rule stops as soon as no combination of the remaining runs can
+    change ``triggers / runs_per_query >= trigger_threshold``. With
+    ``confidence`` set, it also stops when a Wilson score interval around the
+    observed rate lies entirely on one side of the threshold. Returns None
+    while the outcome is still open.
+    """
+    needed = math.ceil(trigger_threshold * runs_per_query - 1e-9)
+    if triggers >= needed:
+        return True
+    if triggers + (runs_per_query - runs) < needed:
+        return False
+
+    if confidence and runs >= 2:
+        z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+        rate = triggers / runs
+        center = (rate + z * z / (2 * runs)) / (1 + z * z / runs)
+        margin = z * math.sqrt(rate * (1 - rate) / runs + z * z / (4 * runs * runs)) / (1 + z * z / runs)
+        if center - margin >= trigger_threshold:
+            return True
+        if center + margin < trigger_threshold:
+            return False
+    return None
+
+
+async def run_eval_async(
     eval_set: list[dict],
     skill_name: str,
     description: str,
@@ -191,47 +483,185 @@ def run_eval(
     runs_per_query: int = 1,
     trigger_threshold: float = 0.5,
     model: str | None = None,
+    cache: EvalCache | None = None,
+    early_stop: bool = True,
+    early_stop_confidence: float | None = None,
+    on_result: Callable[[dict], None] | None = None,
+    sandboxes: SandboxPool | None = None,
+    priority: int = 0,
+    latency: LatencyStats | None = None,
 ) -> dict:
-    """Run the full eval set and return results."""
-    results = []
+    """Run the full eval set and return results.
+
+    All `claude -p` children are driven from one event loop, at most
+    ``num_workers`` at a time, each in its own sandbox project root. Pass a
+    SandboxPool to reuse sandboxes across calls -- its size then replaces
+    ``num_workers`` and is shared by every call using it; otherwise one is
+    created for this call and removed afterwards. When calls compete for a
+    shared pool, runs with a lower ``priority`` get sandboxes first.
+    ``on_result`` is called with a dict for each run as soon as its outcome
+    is known.
+
+    With a cache, runs already recorded for this description, query, model
+    and run index are reused and only the missing ones are executed.
+
+    Runs that time out or fail are not observations: they are never cached
+    and don't count towards a query's trigger rate. A query left with no
+    completed runs fails and is marked with ``"error": True``.
+
+    With early stopping, runs for a query are submitted only as far as they
+    could still change its pass/fail outcome; once the outcome is fixed the
+    remaining runs are skipped and queued or running ones are cancelled.
+
+    With latency stats, the wall time of every run that wasn't killed is
+    recorded. Queries expected to take longest (or never measured) get
+    sandboxes first, so slow stragglers don't start last. Each run's timeout
+    is derived from observed percentiles, with ``timeout`` as the upper
+    bound; a run killed at a tighter timeout is retried once at ``timeout``.
+    """
+    queries: dict[str, dict] = {}
+    for item in eval_set:
+        queries.setdefault(item["query"], {
+            "item": item,
+            "triggers": [],
+            "next_run": 0,
+            "in_flight": 0,
+            "decided": None,
+            "latencies": [],
+            "failed_runs": 0,
+        })
 
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_info = {}
-        for item in eval_set:
-            for run_idx in range(runs_per_query):
-                future = executor.submit(
-                    run_single_query,
-                    item["query"],
-                    skill_name,
-                    description,
-                    timeout,
-                    str(project_root),
-                    model,
-                )
-                future_to_info[future] = (item, run_idx)
-
-        query_triggers: dict[str, list[bool]] = {}
-        query_items: dict[str, dict] = {}
-        for future in as_completed(future_to_info):
-            item, _ = future_to_info[future]
-            query = item["query"]
-            query_items[query] = item
-            if query not in query_triggers:
-                query_triggers[query] = []
-            try:
-                query_triggers[query].append(future.result())
-            except Exception as e:
-                print(f"Warning: query failed: {e}", file=sys.stderr)
-                query_triggers[query].append(False)
-
-    for query, triggers in query_triggers.items():
-        item = query_items[query]
-        trigger_rate = sum(triggers) / len(triggers)
+    counts = {"cached": 0, "executed": 0, "cancelled": 0, "retried": 0, RUN_TIMEOUT: 0, RUN_ERROR: 0}
+    task_to_info: dict[asyncio.Task, tuple[str, int]] = {}
+    own_sandboxes = sandboxes is None
+    if own_sandboxes:
+        sandboxes = SandboxPool(project_root, skill_name, num_workers)
+
+    def record(state: dict, triggered: bool) -> None:
+        state["triggers"].append(triggered)
+        if early_stop:
+            state["decided"] = outcome_fixed(
+                sum(state["triggers"]), len(state["triggers"]),
+                runs_per_query, trigger_threshold, early_stop_confidence,
+            )
+
+    def wanted(state: dict) -> int:
+        """Runs to keep in flight: all of them, or just enough to possibly decide."""
+        if not early_stop:
+            return runs_per_query
+        needed = math.ceil(trigger_threshold * runs_per_query - 1e-9)
+        triggers = sum(state["triggers"])
+        misses = len(state["triggers"]) - triggers
+        return max(1, min(needed - triggers, runs_per_query - needed + 1 - misses))
+
+    # Longest expected first; queries without history count as longest
+    expected = {
+        query: (latency.expected(query, model) if latency else None)
+        for query in queries
+    }
+    weights = {query: math.inf if e is None else e for query, e in expected.items()}
+
+    async def run_one(query: str) -> tuple[bool, str, float]:
+        run_timeout = latency.timeout_for(query, model, timeout) if latency else timeout
+        async with sandboxes.checkout(priority, weights[query]) as sandbox:
+            sandbox.prepare(description)
+            started = time.monotonic()
+            triggered, status = await _run_claude(query, sandbox.clean_name, str(sandbox.path), run_timeout, model)
+            if status == RUN_TIMEOUT and run_timeout < timeout:
+                # The history may be too thin or too fast for this query; only
+                # the fixed timeout can call a run timed out
+                counts["retried"] += 1
+                started = time.monotonic()
+                triggered, status = await _run_claude(query, sandbox.clean_name, str(sandbox.path), timeout, model)
+            return triggered, status, time.monotonic() - started
+
+    def schedule(query: str) -> None:
+        state = queries[query]
+        while (state["decided"] is None
+               and state["next_run"] < runs_per_query
+               and state["in_flight"] < wanted(state)):
+            run_idx = state["next_run"]
+            state["next_run"] += 1
+            cached = cache.get(description, query, model, run_idx) if cache else None
+            if cached is not None:
+                counts["cached"] += 1
+                record(state, cached)
+                if on_result:
+                    on_result({"query": query, "run": run_idx, "triggered": cached, "cached": True, "elapsed": 0.0})
+                continue
+            task_to_info[asyncio.create_task(run_one(query))] = (query, run_idx)
+            state["in_flight"] += 1
+
+    eval_started = time.monotonic()
+    try:
+        for query in sorted(queries, key=weights.get, reverse=True):
+            schedule(query)
+
+        while task_to_info:
+            done, _ = await asyncio.wait(task_to_info, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                query, run_idx = task_to_info.pop(task)
+                state = queries[query]
+                state["in_flight"] -= 1
+                if task.cancelled():
+                    continue
+                counts["executed"] += 1
+                try:
+                    triggered, status, elapsed = task.result()
+                    # A killed run's time says only how long it was allowed
+                    if status != RUN_TIMEOUT:
+                        state["latencies"].append(elapsed)
+                        if latency:
+                            latency.record(query, model, elapsed)
+                except Exception as e:
+                    print(f"Warning: query failed: {e}", file=sys.stderr)
+                    triggered, status, elapsed = False, RUN_ERROR, 0.0
+
+                if status != RUN_OK:
+                    # Not an observation: leave it out of the cache and the trigger rate
+                    counts[status] += 1
+                    state["failed_runs"] += 1
+                    if on_result:
+                        on_result({"query": query, "run": run_idx, "triggered": None, "status": status,
+                                   "cached": False, "elapsed": elapsed})
+                    if state["decided"] is None:
+                        schedule(query)
+                    continue
+                if cache:
+                    cache.put(description, query, model, run_idx, triggered)
+
+                # Runs that finish after the outcome is fixed are cached but not counted
+                if state["decided"] is not None:
+                    continue
+                record(state, triggered)
+                if on_result:
+                    on_result({"query": query, "run": run_idx, "triggered": triggered, "status": status,
+                               "cached": False, "elapsed": elapsed})
+                if state["decided"] is not None:
+                    for other, (other_query, _) in task_to_info.items():
+                        if other_query == query and other.cancel():
+                            counts["cancelled"] += 1
+                else:
+                    schedule(query)
+    finally:
+        # Never leave children running if a callback or the caller bails out
+        for task in task_to_info:
+            task.cancel()
+        if task_to_info:
+            await asyncio.gather(*task_to_info, return_exceptions=True)
+        if own_sandboxes:
+            sandboxes.close()
+    wall_time = time.monotonic() - eval_started
+
+    results = []
+    for query, state in queries.items():
+        item = state["item"]
+        triggers = state["triggers"]
+        trigger_rate = sum(triggers) / len(triggers) if triggers else 0.0
         should_trigger = item["should_trigger"]
-        if should_trigger:
-            did_pass = trigger_rate >= trigger_threshold
-        else:
-            did_pass = trigger_rate < trigger_threshold
+        reaches_threshold = state["decided"] if state["decided"] is not None else trigger_rate >= trigger_threshold
+        # Without a single completed run there is nothing to pass on
+        did_pass = bool(triggers) and (reaches_threshold if should_trigger else not reaches_threshold)
         results.append({
             "query": query,
             "should_trigger": should_trigger,
@@ -240,11 +670,19 @@ def run_eval(
             "runs": len(triggers),
             "pass": did_pass,
         })
+        if state["failed_runs"]:
+            results[-1]["failed_runs"] = state["failed_runs"]
+        if not triggers:
+            results[-1]["error"] = True
+        # Percentiles over the whole history when kept, else over this eval's runs
+        samples = latency.history(query, model) if latency else state["latencies"]
+        if samples:
+            results[-1]["latency"] = summarize(samples)
 
     passed = sum(1 for r in results if r["pass"])
     total = len(results)
 
-    return {
+    output = {
         "skill_name": skill_name,
         "description": description,
         "results": results,
@@ -254,6 +692,44 @@ def run_eval(
             "failed": total - passed,
         },
     }
+    if cache:
+        output["cache"] = {
+            "cached_runs": counts["cached"],
+            "executed_runs": counts["executed"],
+        }
+    if counts[RUN_TIMEOUT] or counts[RUN_ERROR]:
+        output["failed_runs"] = {
+            "timeout": counts[RUN_TIMEOUT],
+            "error": counts[RUN_ERROR],
+            "queries_without_result": sum(1 for r in results if r.get("error")),
+        }
+    if early_stop:
+        planned = len(queries) * runs_per_query
+        used = sum(len(state["triggers"]) for state in queries.values())
+        failed = counts[RUN_TIMEOUT] + counts[RUN_ERROR]
+        output["early_stopping"] = {
+            "runs_planned": planned,
+            "runs_used": used,
+            "runs_saved": planned - used - failed,
+            "cancelled": counts["cancelled"],
+            "confidence": early_stop_confidence,
+        }
+    run_times = [elapsed for state in queries.values() for elapsed in state["latencies"]]
+    if run_times:
+        output["latency"] = {
+            **summarize(run_times),
+            "wall_seconds": round(wall_time, 2),
+            # No schedule on this many workers can finish faster than this
+            "ideal_seconds": round(max(sum(run_times) / sandboxes.size, max(run_times)), 2),
+            # Runs killed at the dynamic timeout and run again at the fixed one
+            "retried_runs": counts["retried"],
+        }
+    return output
+
+
+def run_eval(*args, **kwargs) -> dict:
+    """Blocking wrapper around run_eval_async; takes the same arguments."""
+    return asyncio.run(run_eval_async(*args, **kwargs))
 
 
 def main():
@@ -261,14 +737,29 @@ def main():
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
     parser.add_argument("--description", default=None, help="Override description to test")
-    parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
-    parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
+    parser.add_argument("--num-workers", type=int, default=10, help="Maximum concurrent claude -p processes")
+    parser.add_argument("--timeout", type=int, default=30,
+                        help="Timeout per query in seconds (the upper bound once latency history exists)")
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
     parser.add_argument("--model", default=None, help="Model to use for claude -p (default: user's configured model)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Directory for the persistent eval result cache")
+    parser.add_argument("--no-cache", action="store_true", help="Run every query without reading or writing the cache")
+    parser.add_argument("--invalidate-cache", action="store_true", help="Discard cached results for this skill before running")
+    parser.add_argument("--no-early-stop", action="store_true", help="Always run every query runs-per-query times")
+    parser.add_argument("--early-stop-confidence", type=float, default=None,
+                        help="Also stop once the trigger rate is on one side of the threshold at this confidence (e.g. 0.95)")
+    parser.add_argument("--latency-dir", default=str(DEFAULT_STATS_DIR), help="Directory for per-query latency history")
+    parser.add_argument("--no-latency-stats", action="store_true",
+                        help="Run queries in eval-set order with the fixed --timeout and record no latency history")
+    parser.add_argument("--claude-bin", default=None,
+                        help=f"Command to run instead of `claude` (e.g. the absolute path of scripts/fake_claude.py); also ${CLAUDE_BIN_ENV}")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     args = parser.parse_args()
 
+    if args.claude_bin:
+        os.environ[CLAUDE_BIN_ENV] = args.claude_bin
+
     eval_set = json.loads(Path(args.eval_set).read_text())
     skill_path = Path(args.skill_path)
 
@@ -280,9 +771,23 @@ def main():
     description = args.description or original_description
     project_root = find_project_root()
 
+    cache = None
+    if not args.no_cache:
+        cache = EvalCache(name, Path(args.cache_dir))
+        if args.invalidate_cache:
+            cache.clear()
+
+    latency = None if args.no_latency_stats else LatencyStats(name, Path(args.latency_dir))
+
+    on_result = None
     if args.verbose:
         print(f"Evaluating: {description}", file=sys.stderr)
 
+        def on_result(run: dict) -> None:
+            source = "cached" if run["cached"] else f"{run['elapsed']:.1f}s"
+            outcome = f"triggered={run['triggered']}" if run.get("status", RUN_OK) == RUN_OK else run["status"]
+            print(f"  run {run['run']} {outcome} ({source}): {run['query'][:60]}", file=sys.stderr)
+
     output = run_eval(
         eval_set=eval_set,
         skill_name=name,
@@ -293,15 +798,35 @@ def main():
         runs_per_query=args.runs_per_query,
         trigger_threshold=args.trigger_threshold,
         model=args.model,
+        cache=cache,
+        early_stop=not args.no_early_stop,
+        early_stop_confidence=args.early_stop_confidence,
+        on_result=on_result,
+        latency=latency,
     )
 
     if args.verbose:
         summary = output["summary"]
         print(f"Results: {summary['passed']}/{summary['total']} passed", file=sys.stderr)
+        if cache:
+            print(f"Cache: {output['cache']['cached_runs']} runs reused, {output['cache']['executed_runs']} executed", file=sys.stderr)
+        if "early_stopping" in output:
+            stopping = output["early_stopping"]
+            print(f"Early stopping: {stopping['runs_used']}/{stopping['runs_planned']} runs used, {stopping['runs_saved']} saved", file=sys.stderr)
+        if "failed_runs" in output:
+            failed = output["failed_runs"]
+            print(f"Failed runs (not cached or scored): {failed['timeout']} timed out, {failed['error']} errored, "
+                  f"{failed['queries_without_result']} queries without a result", file=sys.stderr)
+        if "latency" in output:
+            timing = output["latency"]
+            print(f"Latency: p50={timing['p50']}s p95={timing['p95']}s, "
+                  f"wall {timing['wall_seconds']}s vs ideal {timing['ideal_seconds']}s, "
+                  f"{timing['retried_runs']} retried at --timeout", file=sys.stderr)
         for r in output["results"]:
-            status = "PASS" if r["pass"] else "FAIL"
+            status = "ERROR" if r.get("error") else "PASS" if r["pass"] else "FAIL"
             rate_str = f"{r['triggers']}/{r['runs']}"
-            print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:70]}", file=sys.stderr)
+            timing = f" p50={r['latency']['p50']}s p95={r['latency']['p95']}s" if "latency" in r else ""
+            print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}{timing}: {r['query'][:70]}", file=sys.stderr)
 
     print(json.dumps(output, indent=2))
 
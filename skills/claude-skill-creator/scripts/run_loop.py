@@ -7,7 +7,9 @@ overfitting.
 """
 
 import argparse
+import asyncio
 import json
+import os
 import random
 import sys
 import tempfile
@@ -18,8 +20,10 @@ from pathlib import Path
 import anthropic
 
 from scripts.generate_report import generate_html
-from scripts.improve_description import improve_description
-from scripts.run_eval import find_project_root, run_eval
+from scripts.eval_cache import DEFAULT_CACHE_DIR, EvalCache
+from scripts.improve_description import format_usage, improve_description, summarize_usage
+from scripts.latency_stats import DEFAULT_STATS_DIR, LatencyStats
+from scripts.run_eval import CLAUDE_BIN_ENV, SandboxPool, find_project_root, run_eval_async
 from scripts.utils import parse_skill_md
 
 
@@ -46,7 +50,54 @@ def split_eval_set(eval_set: list[dict], holdout: float, seed: int = 42) -> tupl
     return train_set, test_set
 
 
-def run_loop(
+def _train_rank(entry: dict) -> tuple[int, float]:
+    """Rank candidates by train queries passed, then by the fraction of correct runs."""
+    correct = runs = 0
+    for r in entry["train_results"]:
+        runs += r["runs"]
+        correct += r["triggers"] if r["should_trigger"] else r["runs"] - r["triggers"]
+    return entry["train_passed"], correct / runs if runs else 0.0
+
+
+# Train runs gate the next improvement call, so they get sandboxes before test runs
+TRAIN_PRIORITY = 0
+TEST_PRIORITY = 1
+
+
+def _split_summary(results: list[dict]) -> dict:
+    passed = sum(1 for r in results if r["pass"])
+    return {"passed": passed, "failed": len(results) - passed, "total": len(results)}
+
+
+def print_eval_stats(label: str, results: list[dict], elapsed: float) -> None:
+    pos = [r for r in results if r["should_trigger"]]
+    neg = [r for r in results if not r["should_trigger"]]
+    tp = sum(r["triggers"] for r in pos)
+    pos_runs = sum(r["runs"] for r in pos)
+    fn = pos_runs - tp
+    fp = sum(r["triggers"] for r in neg)
+    neg_runs = sum(r["runs"] for r in neg)
+    tn = neg_runs - fp
+    total = tp + tn + fp + fn
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
+    accuracy = (tp + tn) / total if total > 0 else 0.0
+    print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
+    for r in results:
+        status = "PASS" if r["pass"] else "FAIL"
+        rate_str = f"{r['triggers']}/{r['runs']}"
+        print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
+
+
+def _print_run_stats(label: str, output: dict) -> None:
+    if "cache" in output:
+        print(f"{label} cache: {output['cache']['cached_runs']} runs reused, {output['cache']['executed_runs']} executed", file=sys.stderr)
+    if "early_stopping" in output:
+        stopping = output["early_stopping"]
+        print(f"{label} early stopping: {stopping['runs_used']}/{stopping['runs_planned']} runs used, {stopping['runs_saved']} saved", file=sys.stderr)
+
+
+async def run_loop_async(
     eval_set: list[dict],
     skill_path: Path,
     description_override: str | None,
@@ -60,8 +111,29 @@ def run_loop(
     verbose: bool,
     live_report_path: Path | None = None,
     log_dir: Path | None = None,
+    cache: EvalCache | None = None,
+    early_stop: bool = True,
+    early_stop_confidence: float | None = None,
+    candidates: int = 1,
+    beam_width: int = 1,
+    latency: LatencyStats | None = None,
 ) -> dict:
-    """Run the eval + improvement loop."""
+    """Run the eval + improvement loop.
+
+    Each iteration evaluates a set of candidate descriptions together in one
+    shared worker pool. The best ``beam_width`` of those and the previous
+    beam by train score are kept, so the beam never gets worse, and
+    ``candidates`` new descriptions are proposed from them for the next
+    iteration, each from a different angle. The defaults (1 and 1) give the plain
+    evaluate-improve-repeat loop.
+
+    The loop is pipelined: only train results feed the improvement call, so
+    it starts as soon as the train runs finish, while the test runs of the
+    same iteration are still in flight. The next iteration's train runs are
+    started right after, ahead of any test runs still queued. An iteration
+    then takes about max(train eval + improve, test eval) instead of their
+    sum.
+    """
     project_root = find_project_root()
     name, original_description, content = parse_skill_md(skill_path)
     current_description = description_override or original_description
@@ -78,144 +150,209 @@ def run_loop(
     client = anthropic.Anthropic()
     history = []
     exit_reason = "unknown"
-
-    for iteration in range(1, max_iterations + 1):
-        if verbose:
-            print(f"\n{'='*60}", file=sys.stderr)
-            print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
-            print(f"Description: {current_description}", file=sys.stderr)
-            print(f"{'='*60}", file=sys.stderr)
-
-        # Evaluate train + test together in one batch for parallelism
-        all_queries = train_set + test_set
-        t0 = time.time()
-        all_results = run_eval(
-            eval_set=all_queries,
-            skill_name=name,
-            description=current_description,
-            num_workers=num_workers,
-            timeout=timeout,
-            project_root=project_root,
-            runs_per_query=runs_per_query,
-            trigger_threshold=trigger_threshold,
-            model=model,
-        )
-        eval_elapsed = time.time() - t0
-
-        # Split results back into train/test by matching queries
-        train_queries_set = {q["query"] for q in train_set}
-        train_result_list = [r for r in all_results["results"] if r["query"] in train_queries_set]
-        test_result_list = [r for r in all_results["results"] if r["query"] not in train_queries_set]
-
-        train_passed = sum(1 for r in train_result_list if r["pass"])
-        train_total = len(train_result_list)
-        train_summary = {"passed": train_passed, "failed": train_total - train_passed, "total": train_total}
-        train_results = {"results": train_result_list, "summary": train_summary}
-
-        if test_set:
-            test_passed = sum(1 for r in test_result_list if r["pass"])
-            test_total = len(test_result_list)
-            test_summary = {"passed": test_passed, "failed": test_total - test_passed, "total": test_total}
-            test_results = {"results": test_result_list, "summary": test_summary}
-        else:
-            test_results = None
-            test_summary = None
-
-        history.append({
-            "iteration": iteration,
-            "description": current_description,
-            "train_passed": train_summary["passed"],
-            "train_failed": train_summary["failed"],
-            "train_total": train_summary["total"],
-            "train_results": train_results["results"],
-            "test_passed": test_summary["passed"] if test_summary else None,
-            "test_failed": test_summary["failed"] if test_summary else None,
-            "test_total": test_summary["total"] if test_summary else None,
-            "test_results": test_results["results"] if test_results else None,
-            # For backward compat with report generator
-            "passed": train_summary["passed"],
-            "failed": train_summary["failed"],
-            "total": train_summary["total"],
-            "results": train_results["results"],
-        })
-
-        # Write live report if path provided
-        if live_report_path:
-            partial_output = {
-                "original_description": original_description,
-                "best_description": current_description,
-                "best_score": "in progress",
-                "iterations_run": len(history),
-                "holdout": holdout,
-                "train_size": len(train_set),
-                "test_size": len(test_set),
-                "history": history,
-            }
-            live_report_path.write_text(generate_html(partial_output, auto_refresh=True, skill_name=name))
-
-        if verbose:
-            def print_eval_stats(label, results, elapsed):
-                pos = [r for r in results if r["should_trigger"]]
-                neg = [r for r in results if not r["should_trigger"]]
-                tp = sum(r["triggers"] for r in pos)
-                pos_runs = sum(r["runs"] for r in pos)
-                fn = pos_runs - tp
-                fp = sum(r["triggers"] for r in neg)
-                neg_runs = sum(r["runs"] for r in neg)
-                tn = neg_runs - fp
-                total = tp + tn + fp + fn
-                precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
-                recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
-                accuracy = (tp + tn) / total if total > 0 else 0.0
-                print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
-                for r in results:
-                    status = "PASS" if r["pass"] else "FAIL"
-                    rate_str = f"{r['triggers']}/{r['runs']}"
-                    print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
-
-            print_eval_stats("Train", train_results["results"], eval_elapsed)
-            if test_summary:
-                print_eval_stats("Test ", test_results["results"], 0)
-
-        if train_summary["failed"] == 0:
-            exit_reason = f"all_passed (iteration {iteration})"
+    # All candidates and both splits share these sandboxes, and with them the worker limit
+    sandboxes = SandboxPool(project_root, name, num_workers)
+    pending_descriptions = [current_description]
+    beam: list[dict] = []
+    tasks: list[asyncio.Task] = []
+    api_usage: list[dict] = []
+
+    def evaluate(queries: list[dict], descriptions: list[str], priority: int) -> list[asyncio.Task]:
+        started = [
+            asyncio.create_task(run_eval_async(
+                eval_set=queries,
+                skill_name=name,
+                description=description,
+                num_workers=num_workers,
+                timeout=timeout,
+                project_root=project_root,
+                runs_per_query=runs_per_query,
+                trigger_threshold=trigger_threshold,
+                model=model,
+                cache=cache,
+                early_stop=early_stop,
+                early_stop_confidence=early_stop_confidence,
+                sandboxes=sandboxes,
+                priority=priority,
+                latency=latency,
+            ))
+            for description in descriptions
+        ]
+        tasks.extend(started)
+        return started
+
+    def write_live_report(iteration: int) -> None:
+        if not live_report_path:
+            return
+        partial_output = {
+            "original_description": original_description,
+            "best_description": current_description,
+            "best_score": "in progress",
+            "iterations_run": iteration,
+            "holdout": holdout,
+            "train_size": len(train_set),
+            "test_size": len(test_set),
+            "history": history,
+        }
+        live_report_path.write_text(generate_html(partial_output, auto_refresh=True, skill_name=name))
+
+    async def collect_test(iteration: int, entries: list[dict], test_tasks: list[asyncio.Task], started: float) -> None:
+        """Fill in the test half of an iteration's entries once its runs finish."""
+        outputs = await asyncio.gather(*test_tasks)
+        elapsed = time.time() - started
+        for entry, output in zip(entries, outputs):
+            summary = _split_summary(output["results"])
+            entry["test_passed"] = summary["passed"]
+            entry["test_failed"] = summary["failed"]
+            entry["test_total"] = summary["total"]
+            entry["test_results"] = output["results"]
             if verbose:
-                print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
-            break
-
-        if iteration == max_iterations:
-            exit_reason = f"max_iterations ({max_iterations})"
+                label = f"Iteration {iteration}"
+                if "candidate" in entry:
+                    label += f" candidate {entry['candidate']}"
+                print(f"\n{label} test results:", file=sys.stderr)
+                _print_run_stats("Test", output)
+                print_eval_stats("Test ", entry["test_results"], elapsed)
+        write_live_report(iteration)
+
+    test_collectors: list[asyncio.Task] = []
+    t0 = time.time()
+    train_tasks = evaluate(train_set, pending_descriptions, TRAIN_PRIORITY)
+    try:
+        for iteration in range(1, max_iterations + 1):
             if verbose:
-                print(f"\nMax iterations reached ({max_iterations}).", file=sys.stderr)
-            break
+                print(f"\n{'='*60}", file=sys.stderr)
+                print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
+                for description in pending_descriptions:
+                    print(f"Description: {description}", file=sys.stderr)
+                print(f"{'='*60}", file=sys.stderr)
+
+            # Train runs for these descriptions are already in flight; queue the test runs behind them
+            test_started = time.time()
+            test_tasks = evaluate(test_set, pending_descriptions, TEST_PRIORITY) if test_set else []
+            train_outputs = await asyncio.gather(*train_tasks)
+            train_elapsed = time.time() - t0
+
+            entries = []
+            for candidate, output in enumerate(train_outputs):
+                train_result_list = output["results"]
+                train_summary = _split_summary(train_result_list)
+                entry = {
+                    "iteration": iteration,
+                    "description": output["description"],
+                    "train_passed": train_summary["passed"],
+                    "train_failed": train_summary["failed"],
+                    "train_total": train_summary["total"],
+                    "train_results": train_result_list,
+                    # Filled in by collect_test once the test runs finish
+                    "test_passed": None,
+                    "test_failed": None,
+                    "test_total": None,
+                    "test_results": None,
+                    # For backward compat with report generator
+                    "passed": train_summary["passed"],
+                    "failed": train_summary["failed"],
+                    "total": train_summary["total"],
+                    "results": train_result_list,
+                }
+                if len(train_outputs) > 1:
+                    entry["candidate"] = candidate + 1
+                history.append(entry)
+                entries.append(entry)
+
+            # Keep the top candidates and surviving parents by train score; the test set stays blind.
+            # Ties go to the new candidates, and a re-proposed description is kept once.
+            ranked = sorted(entries + beam, key=_train_rank, reverse=True)
+            beam = []
+            for entry in ranked:
+                if len(beam) < beam_width and all(entry["description"] != kept["description"] for kept in beam):
+                    beam.append(entry)
+            current_description = beam[0]["description"]
+            write_live_report(iteration)
 
-        # Improve the description based on train results
-        if verbose:
-            print(f"\nImproving description...", file=sys.stderr)
+            if verbose:
+                for entry, output in zip(entries, train_outputs):
+                    if "candidate" in entry:
+                        kept = " (kept)" if entry in beam else ""
+                        print(f"\nCandidate {entry['candidate']}{kept}: {entry['description'][:80]}", file=sys.stderr)
+                    _print_run_stats("Train", output)
+                    print_eval_stats("Train", entry["train_results"], train_elapsed)
+
+            if test_tasks:
+                test_collectors.append(asyncio.create_task(collect_test(iteration, entries, test_tasks, test_started)))
+
+            if beam[0]["train_failed"] == 0:
+                exit_reason = f"all_passed (iteration {iteration})"
+                if verbose:
+                    print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
+                break
+
+            if iteration == max_iterations:
+                exit_reason = f"max_iterations ({max_iterations})"
+                if verbose:
+                    print(f"\nMax iterations reached ({max_iterations}).", file=sys.stderr)
+                break
+
+            # Improve the kept descriptions based on train results
+            if verbose:
+                print(f"\nImproving description...", file=sys.stderr)
+
+            t0 = time.time()
+            # Strip test scores from history so improvement model can't see them
+            blinded_history = [
+                {k: v for k, v in h.items() if not k.startswith("test_")}
+                for h in history
+            ]
+
+            def propose(index: int) -> str:
+                parent = beam[index % len(beam)]
+                calls: list[dict] = []
+                proposal = improve_description(
+                    client=client,
+                    skill_name=name,
+                    skill_content=content,
+                    current_description=parent["description"],
+                    eval_results={
+                        "results": parent["train_results"],
+                        "summary": _split_summary(parent["train_results"]),
+                    },
+                    history=blinded_history,
+                    model=model,
+                    log_dir=log_dir,
+                    iteration=iteration,
+                    candidate=index + 1 if candidates > 1 else None,
+                    usage=calls,
+                )
+                api_usage.append({"iteration": iteration, "candidate": index + 1, **summarize_usage(calls)})
+                if verbose:
+                    print(f"Improve call {iteration}.{index + 1}: {format_usage(summarize_usage(calls))}", file=sys.stderr)
+                return proposal
+
+            # The API calls run in threads so the event loop keeps driving the test runs
+            proposals = await asyncio.gather(*(asyncio.to_thread(propose, i) for i in range(candidates)))
+            improve_elapsed = time.time() - t0
+
+            # Identical proposals would only be evaluated twice
+            pending_descriptions = list(dict.fromkeys(proposals))
 
-        t0 = time.time()
-        # Strip test scores from history so improvement model can't see them
-        blinded_history = [
-            {k: v for k, v in h.items() if not k.startswith("test_")}
-            for h in history
-        ]
-        new_description = improve_description(
-            client=client,
-            skill_name=name,
-            skill_content=content,
-            current_description=current_description,
-            eval_results=train_results,
-            history=blinded_history,
-            model=model,
-            log_dir=log_dir,
-            iteration=iteration,
-        )
-        improve_elapsed = time.time() - t0
+            if verbose:
+                for proposal in pending_descriptions:
+                    print(f"Proposed ({improve_elapsed:.1f}s): {proposal}", file=sys.stderr)
 
-        if verbose:
-            print(f"Proposed ({improve_elapsed:.1f}s): {new_description}", file=sys.stderr)
+            # Start the next train eval now rather than after this iteration's test runs
+            t0 = time.time()
+            train_tasks = evaluate(train_set, pending_descriptions, TRAIN_PRIORITY)
 
-        current_description = new_description
+        if test_collectors:
+            if verbose:
+                print(f"\nWaiting for remaining test runs...", file=sys.stderr)
+            await asyncio.gather(*test_collectors)
+    finally:
+        # Never leave runs behind if the loop fails part way
+        for task in tasks + test_collectors:
+            task.cancel()
+        await asyncio.gather(*tasks, *test_collectors, return_exceptions=True)
+        sandboxes.close()
 
     # Find the best iteration by TEST score (or train if no test set)
     if test_set:
@@ -237,31 +374,59 @@ def run_loop(
         "best_train_score": f"{best['train_passed']}/{best['train_total']}",
         "best_test_score": f"{best['test_passed']}/{best['test_total']}" if test_set else None,
         "final_description": current_description,
-        "iterations_run": len(history),
+        "iterations_run": iteration,
         "holdout": holdout,
         "train_size": len(train_set),
         "test_size": len(test_set),
+        "candidates": candidates,
+        "beam_width": beam_width,
+        "improvement_usage": {
+            "total": summarize_usage(api_usage) if api_usage else None,
+            "calls": api_usage,
+        },
         "history": history,
     }
 
 
+def run_loop(*args, **kwargs) -> dict:
+    """Synchronous wrapper around run_loop_async."""
+    return asyncio.run(run_loop_async(*args, **kwargs))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run eval + improve loop")
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
     parser.add_argument("--description", default=None, help="Override starting description")
     parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
-    parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
+    parser.add_argument("--timeout", type=int, default=30,
+                        help="Timeout per query in seconds (the upper bound once latency history exists)")
     parser.add_argument("--max-iterations", type=int, default=5, help="Max improvement iterations")
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
     parser.add_argument("--holdout", type=float, default=0.4, help="Fraction of eval set to hold out for testing (0 to disable)")
     parser.add_argument("--model", required=True, help="Model for improvement")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Directory for the persistent eval result cache")
+    parser.add_argument("--no-cache", action="store_true", help="Run every query without reading or writing the cache")
+    parser.add_argument("--invalidate-cache", action="store_true", help="Discard cached results for this skill before running")
+    parser.add_argument("--no-early-stop", action="store_true", help="Always run every query runs-per-query times")
+    parser.add_argument("--early-stop-confidence", type=float, default=None,
+                        help="Also stop once the trigger rate is on one side of the threshold at this confidence (e.g. 0.95)")
+    parser.add_argument("--latency-dir", default=str(DEFAULT_STATS_DIR), help="Directory for per-query latency history")
+    parser.add_argument("--no-latency-stats", action="store_true",
+                        help="Run queries in eval-set order with the fixed --timeout and record no latency history")
+    parser.add_argument("--candidates", type=int, default=1, help="Candidate descriptions proposed and evaluated per iteration")
+    parser.add_argument("--beam-width", type=int, default=1, help="Best candidates kept each iteration to propose the next ones from")
+    parser.add_argument("--claude-bin", default=None,
+                        help=f"Command to run instead of `claude` (e.g. the absolute path of scripts/fake_claude.py); also ${CLAUDE_BIN_ENV}")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     parser.add_argument("--report", default="auto", help="Generate HTML report at this path (default: 'auto' for temp file, 'none' to disable)")
     parser.add_argument("--results-dir", default=None, help="Save all outputs (results.json, report.html, log.txt) to a timestamped subdirectory here")
     args = parser.parse_args()
 
+    if args.claude_bin:
+        os.environ[CLAUDE_BIN_ENV] = args.claude_bin
+
     eval_set = json.loads(Path(args.eval_set).read_text())
     skill_path = Path(args.skill_path)
 
@@ -271,6 +436,14 @@ def main():
 
     name, _, _ = parse_skill_md(skill_path)
 
+    cache = None
+    if not args.no_cache:
+        cache = EvalCache(name, Path(args.cache_dir))
+        if args.invalidate_cache:
+            cache.clear()
+
+    latency = None if args.no_latency_stats else LatencyStats(name, Path(args.latency_dir))
+
     # Set up live report path
     if args.report != "none":
         if args.report == "auto":
@@ -308,6 +481,12 @@ def main():
         verbose=args.verbose,
         live_report_path=live_report_path,
         log_dir=log_dir,
+        cache=cache,
+        early_stop=not args.no_early_stop,
+        early_stop_confidence=args.early_stop_confidence,
+        candidates=max(1, args.candidates),
+        beam_width=max(1, args.beam_width),
+        latency=latency,
     )
 
     # Save JSON output